@@ -42,6 +42,7 @@ class SectionalArticleGenerator:
             max_completion_tokens=self.config.get(
                 "max_completion_tokens_for_generation", 4096
             ),
+            agent="article_generator",
         )
         cost = self.openai_client.latest_cost
         if error or not response:
@@ -56,7 +56,8 @@ class BriefAssembler:
             response_json, error = self.openai_client.call_chat_completion(
                 messages=messages,
                 model="gpt-5-nano",
-                schema=schema
+                schema=schema,
+                agent="brief_assembler",
             )
 
             if error:
@@ -1,9 +1,11 @@
 import logging
-import textstat
-from typing import Dict, Any, List, Optional  # ADD List
-from bs4 import BeautifulSoup  # ADD this for HTML parsing
+from typing import Dict, Any, List, Optional, Union  # ADD List
+from bs4 import Tag  # ADD this for HTML parsing
 import re  # ADD this for regex checks
 import requests
+from backend.core.article_document import ArticleDocument
+from backend.core.phrase_matcher import PhraseMatcher
+from backend.core.text_statistics import TextStatistics
 
 
 class ContentAuditor:
@@ -15,7 +17,7 @@ class ContentAuditor:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def _check_for_broken_links(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _check_for_broken_links(self, soup: Tag) -> List[Dict[str, str]]:
         """Checks all <a> tags for 4xx or 5xx status codes."""
         issues = []
         links = soup.find_all("a", href=True)
@@ -57,7 +59,7 @@ class ContentAuditor:
 
     def audit_content(
         self,
-        article_html: str,
+        article_html: Union[str, ArticleDocument],
         primary_keyword: str,
         blueprint: Dict[str, Any],
         client_cfg: Dict[str, Any],
@@ -65,16 +67,24 @@ class ContentAuditor:
     ) -> Dict[str, Any]:
         """
         Audits the HTML content and returns a dictionary of metrics.
+        `article_html` may be an already parsed ArticleDocument, which is
+        then reused instead of parsing the article again.
         """
-        # Extract plain text for text-based analysis
-        soup = BeautifulSoup(article_html, "html.parser")
-        plain_text = soup.get_text(separator=" ", strip=True)
-        html_issues = self._check_html_publish_readiness(article_html)
+        document = (
+            article_html
+            if isinstance(article_html, ArticleDocument)
+            else ArticleDocument(article_html)
+        )
+        # Extract plain text for text-based analysis; counts are kept per
+        # block, so re-audits after a small refinement only recount changes.
+        text_stats = TextStatistics(document.text_blocks())
+        plain_text = text_stats.text
+        html_issues = self._check_html_publish_readiness(document)
         if html_issues is None:
             html_issues = []
 
         # Add broken link check results
-        broken_link_issues = self._check_for_broken_links(soup)
+        broken_link_issues = self._check_for_broken_links(document.root)
         html_issues.extend(broken_link_issues)
 
         word_count = len(plain_text.split())
@@ -91,10 +101,10 @@ class ContentAuditor:
                     }
                 )
 
-        readability_score = textstat.flesch_kincaid_grade(plain_text)
+        readability_score = text_stats.flesch_kincaid_grade()
         # Calculate additional metrics for comprehensive audit (Task 9.1)
-        smog_score = textstat.smog_index(plain_text)
-        coleman_liau_score = textstat.coleman_liau_index(plain_text)
+        smog_score = text_stats.smog_index()
+        coleman_liau_score = text_stats.coleman_liau_index()
 
         persona = blueprint.get("ai_content_brief", {}).get(
             "target_audience_persona", "General audience"
@@ -178,17 +188,15 @@ class ContentAuditor:
         if not entities:
             return {"score": 100, "missing": []}
 
-        missing_entities = []
-        for entity in entities:
-            # Heuristic check: Look for exact match or simple pluralization (Task 11.1)
-            if entity.endswith("s"):
-                # If entity is already plural (e.g., 'tools'), check for exact match only
-                pattern = r"\b" + re.escape(entity) + r"\b"
-            else:
-                # Check for singular or plural form (e.g., 'tool' or 'tools')
-                pattern = r"\b" + re.escape(entity) + r"s?\b"
-            if not re.search(pattern, article_text, re.IGNORECASE):
-                missing_entities.append(entity)
+        # Heuristic check: Look for exact match or simple pluralization (Task 11.1).
+        # All entities are matched together in one pass over the article.
+        matcher = PhraseMatcher(
+            entities, ignore_case=True, word_boundary=True, plurals=True
+        )
+        found = matcher.found(article_text)
+        missing_entities = [
+            entity for index, entity in enumerate(entities) if index not in found
+        ]
 
         coverage_score = (
             100 - (len(missing_entities) / len(entities) * 100) if entities else 100
@@ -200,16 +208,18 @@ class ContentAuditor:
             "total_expected": len(entities),
         }
 
-    def _check_html_publish_readiness(self, article_html: str) -> List[Dict[str, Any]]:
+    def _check_html_publish_readiness(
+        self, document: ArticleDocument
+    ) -> List[Dict[str, Any]]:
         """
         Performs specific checks on the final HTML for publish-readiness, returning structured issues.
         """
         issues = []
-        soup = BeautifulSoup(article_html, "html.parser")
+        soup = document.root
 
         # Check for unresolved image placeholders
         placeholder_pattern = r"\[\[IMAGE_ID:\s*(.*?)\s*PROMPT:\s*(.*?)\s*\]\]"
-        placeholders_found = re.findall(placeholder_pattern, article_html)
+        placeholders_found = re.findall(placeholder_pattern, document.source)
         if placeholders_found:
             issues.append(
                 {
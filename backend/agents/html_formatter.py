@@ -1,11 +1,12 @@
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import re
 import markdown
-from bs4 import BeautifulSoup
 from datetime import datetime
 from backend.core import utils
+from backend.core.article_document import ArticleDocument
+from backend.core.phrase_matcher import PhraseMatcher
 
 
 class HtmlFormatter:
@@ -17,66 +18,82 @@ class HtmlFormatter:
         return markdown.markdown(html_body, extensions=["tables", "fenced_code"])
 
     def _insert_internal_links(
-        self, soup: BeautifulSoup, internal_links: List[Dict[str, str]]
+        self, document: ArticleDocument, internal_links: List[Dict[str, str]]
     ) -> None:
         """
-        Inserts internal links into the BeautifulSoup object based on specific contextual suggestions from an AI agent.
+        Inserts internal links into the article document based on specific contextual suggestions from an AI agent.
         """
         if not internal_links:
             return
 
-        linked_anchors = set()
+        links = [
+            link_data
+            for link_data in internal_links
+            if all(
+                [
+                    link_data.get("anchor_text"),
+                    link_data.get("url"),
+                    link_data.get("context_paragraph_text"),
+                ]
+            )
+        ]
+        # Locate every suggestion's context paragraph and anchor in one pass
+        # over the paragraphs: contexts match exactly, anchors ignore case.
+        context_matcher = PhraseMatcher(
+            [link_data["context_paragraph_text"] for link_data in links]
+        )
+        anchor_matcher = PhraseMatcher(
+            [link_data["anchor_text"] for link_data in links], ignore_case=True
+        )
+        locations: Dict[int, List[Tuple[int, Any, Tuple[int, int]]]] = {}
+        for p_index, p_tag in enumerate(document.root.find_all("p")):
+            # Only paragraphs that are a single, not yet linked, text node.
+            text_node = p_tag.string
+            if text_node is None or text_node.find_parent("a"):
+                continue
+            text = str(text_node)
+            contexts = context_matcher.found(text)
+            if not contexts:
+                continue
+            anchors = anchor_matcher.first_matches(text)
+            for index in sorted(contexts):
+                if index in anchors:
+                    locations.setdefault(index, []).append(
+                        (p_index, text_node, anchors[index])
+                    )
 
-        for link_data in internal_links:
-            anchor_text = link_data.get("anchor_text")
-            url = link_data.get("url")
-            context_paragraph = link_data.get("context_paragraph_text")
+        linked_anchors = set()
+        linked_paragraphs = set()
 
-            if (
-                not all([anchor_text, url, context_paragraph])
-                or anchor_text.lower() in linked_anchors
-            ):
+        for index, link_data in enumerate(links):
+            anchor_text = link_data["anchor_text"]
+            if anchor_text.lower() in linked_anchors:
                 continue
 
-            # Find all paragraphs that contain the exact context text
-            potential_paragraphs = soup.find_all(
-                "p", string=re.compile(re.escape(context_paragraph))
-            )
-
-            for p_tag in potential_paragraphs:
-                # Find the text node within this paragraph that contains the anchor
-                text_node = p_tag.find(
-                    string=re.compile(re.escape(anchor_text), re.IGNORECASE)
-                )
-
-                if text_node and not text_node.find_parent(
-                    "a"
-                ):  # Ensure it's not already linked
-                    match = re.search(
-                        re.escape(anchor_text), str(text_node), re.IGNORECASE
-                    )
-                    if match:
-                        before_text = str(text_node)[: match.start()]
-                        matched_text = match.group(0)
-                        after_text = str(text_node)[match.end() :]
-
-                        link_tag = soup.new_tag("a", href=url)
-                        link_tag.string = matched_text
-
-                        new_content = []
-                        if before_text:
-                            new_content.append(before_text)
-                        new_content.append(link_tag)
-                        if after_text:
-                            new_content.append(after_text)
-
-                        text_node.replace_with(*new_content)
-                        linked_anchors.add(anchor_text.lower())
-                        break  # Move to the next link suggestion once placed
-
-    def _generate_toc(self, soup: BeautifulSoup) -> None:
-        """Generates and inserts a Table of Contents from H2 tags into the BeautifulSoup object."""
-        toc_list = soup.new_tag("ul", **{"class": "toc-list"})
+            for p_index, text_node, (start, end) in locations.get(index, []):
+                if p_index in linked_paragraphs:
+                    continue  # Already split by an earlier link.
+
+                text = str(text_node)
+                link_tag = document.new_tag("a", href=link_data["url"])
+                link_tag.string = text[start:end]
+
+                new_content = []
+                if text[:start]:
+                    new_content.append(text[:start])
+                new_content.append(link_tag)
+                if text[end:]:
+                    new_content.append(text[end:])
+
+                text_node.replace_with(*new_content)
+                linked_anchors.add(anchor_text.lower())
+                linked_paragraphs.add(p_index)
+                break  # Move to the next link suggestion once placed
+
+    def _generate_toc(self, document: ArticleDocument) -> None:
+        """Generates and inserts a Table of Contents from H2 tags into the article document."""
+        soup = document.root
+        toc_list = document.new_tag("ul", **{"class": "toc-list"})
         h2_tags = soup.find_all("h2")
 
         if len(h2_tags) < 2:
@@ -89,13 +106,13 @@ class HtmlFormatter:
                 slug = f"section-{i + 1}"
             h2["id"] = slug  # Add ID to H2 for linking
 
-            toc_item = soup.new_tag("li")
-            toc_link = soup.new_tag("a", href=f"#{slug}")
+            toc_item = document.new_tag("li")
+            toc_link = document.new_tag("a", href=f"#{slug}")
             toc_link.string = h2.text
             toc_item.append(toc_link)
             toc_list.append(toc_item)
 
-        toc_header = soup.new_tag("h2")
+        toc_header = document.new_tag("h2")
         toc_header.string = "Table of Contents"
         toc_header["id"] = "table-of-contents"  # Give TOC its own ID
 
@@ -114,11 +131,12 @@ class HtmlFormatter:
                 soup.insert(0, toc_header)
 
     def _generate_schema_org(
-        self, soup: BeautifulSoup, opportunity: Dict[str, Any]
+        self, document: ArticleDocument, opportunity: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Dynamically generates Schema.org JSON-LD from the final HTML soup.
+        Dynamically generates Schema.org JSON-LD from the final article document.
         """
+        soup = document.root
         schema_graph: List[Dict[str, Any]] = []
         client_cfg = opportunity.get("client_cfg", {})
         slug = opportunity.get("blueprint", {}).get("slug", "default-slug")
@@ -177,30 +195,32 @@ class HtmlFormatter:
         opportunity: Dict[str, Any],
         internal_linking_suggestions: Optional[List[Dict[str, str]]] = None,
         in_article_images_data: Optional[List[Dict[str, Any]]] = None,
+        document: Optional[ArticleDocument] = None,
     ) -> Dict[str, Any]:
         """
         Constructs the final content package, now including schema generation.
+        `document` is the already parsed article body (e.g. from the audit);
+        it is reused, and mutated, when it matches the opportunity's body.
         """
         # ... (existing code for html_body_str, soup creation, internal linking, ToC, etc.) ...
         ai_content = opportunity.get("ai_content", {})
         client_cfg = opportunity.get("client_cfg", {})
         html_body_str = ai_content.get("article_body_html", "")
-        soup = BeautifulSoup(f"<div>{html_body_str}</div>", "html.parser")
+        if document is None or document.source != html_body_str:
+            document = ArticleDocument(html_body_str)
 
         if internal_linking_suggestions:
-            self._insert_internal_links(soup, internal_linking_suggestions)
+            self._insert_internal_links(document, internal_linking_suggestions)
 
         if client_cfg.get("generate_toc", True):
-            self._generate_toc(soup)
+            self._generate_toc(document)
 
         # ... (image replacement logic) ...
 
-        article_html_final = (
-            str(soup.body.decode_contents()) if soup.body else str(soup)
-        )
+        article_html_final = document.to_html()
 
         # --- NEW: Call the schema generator ---
-        schema_org_json = self._generate_schema_org(soup, opportunity)
+        schema_org_json = self._generate_schema_org(document, opportunity)
 
         featured_image = opportunity.get("featured_image_data", {})
         featured_image_relative_path = (
@@ -208,6 +228,12 @@ class HtmlFormatter:
             if featured_image and featured_image.get("local_path")
             else None
         )
+        featured_image_srcset = ", ".join(
+            f"/api/images/{os.path.basename(path)} {width}w"
+            for width, path in sorted(
+                (int(w), p) for w, p in (featured_image or {}).get("variants", {}).items()
+            )
+        )
 
         return {
             "meta_title": ai_content.get("meta_title", "No Title"),
@@ -216,5 +242,6 @@ class HtmlFormatter:
             "schema_org_json": schema_org_json,  # Add the generated schema to the final package
             "featured_image_path": featured_image.get("local_path"),
             "featured_image_relative_path": featured_image_relative_path,
+            "featured_image_srcset": featured_image_srcset or None,
             "social_media_posts": opportunity.get("social_media_posts_json", []),
         }
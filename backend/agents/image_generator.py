@@ -1,9 +1,10 @@
 import logging
 import os
+import uuid
 from typing import Dict, Any, Tuple, Optional, List
 
-from backend.external_apis.pexels_client import PexelsClient, download_image_from_url
-from backend.core import utils
+from backend.external_apis.pexels_client import PexelsClient
+from backend.core.image_store import ImageStore
 
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 
@@ -26,11 +27,33 @@ class ImageGenerator:
                     f"Pexels client could not be initialized: {e}. Image generation will be skipped."
                 )
 
+        self.image_store = ImageStore(
+            self.config.get("image_store_dir", "generated_images"), self.config
+        )
+
     def _add_text_overlay(self, image_path: str, text: str) -> str:
-        """Adds a text overlay to the image based on configured settings."""
+        """
+        Adds a text overlay to the image based on configured settings.
+        The result is cached per (photo, text, styling), so it is rendered once.
+        """
         if not self.config.get("overlay_text_enabled", False):
             return image_path  # If disabled, return original path
 
+        new_image_path = self.image_store.derived_path(
+            image_path,
+            [
+                "overlay",
+                text,
+                str(self.config.get("overlay_text_color", "#FFFFFF")),
+                str(self.config.get("overlay_background_color", "#00000080")),
+                str(self.config.get("overlay_font_size", 40)),
+                str(self.config.get("overlay_position", "bottom_center")),
+            ],
+        )
+        if os.path.exists(new_image_path):
+            self.logger.info(f"Reusing cached overlay image: {new_image_path}")
+            return new_image_path
+
         try:
             image = Image.open(image_path).convert(
                 "RGBA"
@@ -126,9 +149,11 @@ class ImageGenerator:
 
             draw.text((x, y), text, font=font, fill=text_color)
 
-            # Save the modified image
-            new_image_path = image_path.replace(".jpeg", "-overlay.jpeg")
-            image.convert("RGB").save(new_image_path)
+            # Save the modified image; write-then-rename so concurrent jobs never
+            # serve a half-written overlay.
+            tmp_path = f"{new_image_path}.{uuid.uuid4().hex}.tmp"
+            image.convert("RGB").save(tmp_path, format="JPEG")
+            os.replace(tmp_path, new_image_path)
             return new_image_path
         except Exception as e:
             self.logger.error(f"Failed to add text overlay to image: {e}")
@@ -172,15 +197,10 @@ class ImageGenerator:
             )
             return None, cost
 
-        image_dir = "generated_images"
-        os.makedirs(image_dir, exist_ok=True)
-        file_path = os.path.join(
-            image_dir,
-            f"pexels-featured-{utils.slugify(search_query)}-{best_photo['id']}.jpeg",
+        local_path = self.image_store.store_remote(
+            f"pexels:{best_photo['id']}:{best_photo_url}", best_photo_url
         )
 
-        local_path = download_image_from_url(best_photo_url, file_path)
-
         if not local_path:
             self.logger.error(
                 f"Failed to download featured image from Pexels: {best_photo_url}"
@@ -192,6 +212,7 @@ class ImageGenerator:
             "meta_title", opportunity["keyword"]
         )
         local_path = self._add_text_overlay(local_path, meta_title)
+        variants = self.image_store.generate_variants(local_path)
 
         self.logger.info(
             f"Successfully sourced featured image from Pexels: {local_path}"
@@ -200,6 +221,7 @@ class ImageGenerator:
             "type": "featured",
             "search_query": search_query,
             "local_path": local_path,
+            "variants": variants,
             "remote_url": best_photo_url,  # Store Pexels URL directly
             "alt_text": best_photo["alt"],
             "source_id": best_photo["id"],
@@ -229,8 +251,10 @@ class ImageGenerator:
         # Use a low temperature for predictable, factual output
         extracted_keywords_str, error = self.openai_client.call_chat_completion(
             messages=prompt_messages,
-                            model=self.config.get("default_model", "gpt-5-nano"),  # Use a cost-effective model for this            temperature=0.1,
+            model=self.config.get("default_model", "gpt-5-nano"),  # Use a cost-effective model for this
+            temperature=0.1,
             max_completion_tokens=50,  # Keep output very short
+            agent="image_generator.pexels_query",
             schema={
                 "name": "extract_keywords",
                 "type": "object",
@@ -296,13 +320,9 @@ class ImageGenerator:
                 photo_url = photo["src"].get("large") or photo["src"].get("original")
 
                 if photo_url:
-                    image_dir = "generated_images"
-                    os.makedirs(image_dir, exist_ok=True)
-                    file_path = os.path.join(
-                        image_dir,
-                        f"pexels-in-article-{utils.slugify(search_query)}-{photo['id']}.jpeg",
+                    local_path = self.image_store.store_remote(
+                        f"pexels:{photo['id']}:{photo_url}", photo_url
                     )
-                    local_path = download_image_from_url(photo_url, file_path)
 
                     if local_path:
                         images_data.append(
@@ -311,6 +331,9 @@ class ImageGenerator:
                                 "search_query": search_query,
                                 "original_prompt": prompt,
                                 "local_path": local_path,
+                                "variants": self.image_store.generate_variants(
+                                    local_path
+                                ),
                                 "remote_url": photo_url,
                                 "alt_text": photo.get("alt") or prompt,
                                 "source_id": photo["id"],
@@ -67,6 +67,7 @@ class InternalLinkingSuggester:
             messages=prompt_messages,
             schema=schema,
             model=self.config.get("default_model", "gpt-5-nano"),
+            agent="internal_linking_suggester",
         )
 
         if error or not response:
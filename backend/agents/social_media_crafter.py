@@ -5,6 +5,7 @@ from typing import Dict, Any, Tuple, Optional, List
 from bs4 import BeautifulSoup
 
 from backend.external_apis.openai_client import OpenAIClientWrapper
+from backend.external_apis.openai_batch import BatchRequest
 
 
 class SocialMediaCrafter:
@@ -12,6 +13,32 @@ class SocialMediaCrafter:
     AI agent for crafting social media posts based on the generated article.
     """
 
+    POSTS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "social_media_posts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "platform": {
+                            "type": "string",
+                            "description": "The social media platform (e.g., 'Twitter', 'LinkedIn').",
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "The content of the social media post.",
+                        },
+                    },
+                    "required": ["platform", "content"],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["social_media_posts"],
+        "additionalProperties": False,
+    }
+
     def __init__(self, openai_client: OpenAIClientWrapper, config: Dict[str, Any]):
         self.openai_client = openai_client
         self.config = config
@@ -25,36 +52,11 @@ class SocialMediaCrafter:
         """
         prompt_messages = self._build_crafting_prompt(opportunity)
 
-        schema = {
-            "type": "object",
-            "properties": {
-                "social_media_posts": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "platform": {
-                                "type": "string",
-                                "description": "The social media platform (e.g., 'Twitter', 'LinkedIn').",
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "The content of the social media post.",
-                            },
-                        },
-                        "required": ["platform", "content"],
-                        "additionalProperties": False,
-                    },
-                }
-            },
-            "required": ["social_media_posts"],
-            "additionalProperties": False,
-        }
-
         response, error = self.openai_client.call_chat_completion(
             messages=prompt_messages,
-            schema=schema,
+            schema=self.POSTS_SCHEMA,
             model=self.config.get("default_model", "gpt-5-nano"),
+            agent="social_media_crafter",
         )
 
         # Get the actual cost from the client after the API call
@@ -66,6 +68,17 @@ class SocialMediaCrafter:
 
         return response.get("social_media_posts"), cost
 
+    def build_batch_request(
+        self, opportunity: Dict[str, Any], custom_id: str
+    ) -> BatchRequest:
+        """Same request as `craft_posts`, packaged for the OpenAI Batch API."""
+        return BatchRequest(
+            custom_id=custom_id,
+            messages=self._build_crafting_prompt(opportunity),
+            schema=self.POSTS_SCHEMA,
+            model=self.config.get("default_model", "gpt-5-nano"),
+        )
+
     def _build_crafting_prompt(
         self, opportunity: Dict[str, Any]
     ) -> list[Dict[str, str]]:
@@ -1,6 +1,8 @@
 import logging
 from typing import Dict, Any
 
+from backend.core.score_breakdown import inflate_breakdown
+
 
 class SummaryGenerator:
     """
@@ -13,7 +15,7 @@ class SummaryGenerator:
     def generate_summary(self, opportunity: Dict[str, Any]) -> str:
         """Builds a narrative summary based on the opportunity's data."""
         full_data = opportunity.get("full_data", {})
-        score_breakdown = full_data.get("score_breakdown", {})
+        score_breakdown = inflate_breakdown(full_data.get("score_breakdown", {}))
 
         # Check qualification status first
         quality_status = full_data.get("quality_status", "passed")
@@ -62,6 +64,8 @@ class SummaryGenerator:
         narrative_parts = []
         if not score_breakdown:
             return "No score breakdown available to generate a narrative."
+        # Only component scores are needed, so compact breakdowns are not expanded.
+        score_breakdown = inflate_breakdown(score_breakdown)
 
         # Ease of Ranking
         ease_score = score_breakdown.get("ease_of_ranking", {}).get("score", 0)
@@ -0,0 +1,57 @@
+# api/conditional.py
+import hashlib
+import json
+from typing import Any, Dict, Iterable
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Clients may keep a copy but must revalidate it (If-None-Match) before use.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+# ETags are weak: GZipMiddleware sends the same entity gzip-encoded or not,
+# and different encodings must not share a strong validator.
+
+
+def opportunity_etag(opportunity_id: int, version: int) -> str:
+    """Weak ETag for an opportunity detail, from its row version."""
+    return f'W/"opp-{opportunity_id}-v{version}"'
+
+
+def opportunity_list_etag(
+    query: Dict[str, Any], rows: Iterable[Dict[str, Any]], total: int
+) -> str:
+    """
+    Weak ETag for a page of opportunities: a digest of the query, the total
+    count and the (id, version) of every row on the page.
+    """
+    digest = hashlib.sha1(json.dumps(query, sort_keys=True, default=str).encode())
+    digest.update(f"|{total}".encode())
+    for row in rows:
+        digest.update(f"|{row['id']}:{row.get('version')}".encode())
+    return f'W/"opps-{digest.hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match matches `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["etag"] = etag
+    response.headers["cache-control"] = REVALIDATE_CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """304 response carrying the validator and caching headers."""
+    return Response(
+        status_code=304,
+        headers={"etag": etag, "cache-control": REVALIDATE_CACHE_CONTROL},
+    )
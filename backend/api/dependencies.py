@@ -2,6 +2,7 @@
 import os
 from fastapi import Depends, HTTPException, Security, Request
 from fastapi.security import APIKeyHeader
+from data_access.async_database import AsyncDatabaseManager
 from data_access.database_manager import DatabaseManager
 from backend.pipeline import WorkflowOrchestrator
 from jobs import JobManager
@@ -15,6 +16,11 @@ def get_db() -> DatabaseManager:
     return api_globals.db_manager
 
 
+def get_async_db() -> AsyncDatabaseManager:
+    """Dependency injector for the async DatabaseManager facade used by routers."""
+    return api_globals.async_db
+
+
 def get_opportunities_service(
     db: DatabaseManager = Depends(get_db),
 ) -> OpportunitiesService:
@@ -47,29 +53,29 @@ def get_current_client_id(request: Request) -> str:
     return client_id
 
 
-# Update the `get_orchestrator` dependency to *not* directly use `get_current_client_id` within its signature
-# because it will be passed explicitly to the endpoint if needed.
-# Modify `get_orchestrator` signature from `get_orchestrator(client_id: str, ...)` to:
-def get_orchestrator(
-    request: Request,  # Add Request to get client_id
-    db: DatabaseManager = Depends(get_db),
-    jm: JobManager = Depends(get_job_manager),
-) -> WorkflowOrchestrator:
+def get_authorized_client_id(request: Request) -> str:
     """
-    Dependency injector for WorkflowOrchestrator.
-    Creates a new instance for each request, configured for the specific client_id.
+    Lightweight client check for endpoints that only need to compare the
+    X-Client-ID header with a path/resource client ID. Existence is cached, so
+    no orchestrator is built and, after the first hit, no DB read is made.
     """
-    client_id = request.headers.get("X-Client-ID")  # Get client_id from request headers
-    if not client_id:
-        # Fallback to default for orchestrator initialization if header is missing
-        client_id = "Lark_Main_Site"
-
-    if not db.get_client_settings(client_id):
+    client_id = get_current_client_id(request)
+    if not api_globals.orchestrator_cache.client_exists(client_id):
         raise HTTPException(
             status_code=404, detail=f"Client with ID '{client_id}' not found."
         )
+    return client_id
+
 
-    return WorkflowOrchestrator(api_globals.config_manager, db, client_id, jm)
+def get_orchestrator(
+    client_id: str = Depends(get_authorized_client_id),
+) -> WorkflowOrchestrator:
+    """
+    Dependency injector for WorkflowOrchestrator.
+    Returns the cached instance for the client; it is rebuilt after the
+    client's settings change.
+    """
+    return api_globals.orchestrator_cache.get(client_id)
 
 
 API_KEY = os.getenv("INTERNAL_API_KEY")
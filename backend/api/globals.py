@@ -1,9 +1,17 @@
 # api/globals.py
 from typing import Optional
 from app_config.manager import ConfigManager
+from data_access.async_database import AsyncDatabaseManager
 from data_access.database_manager import DatabaseManager
 from jobs import JobManager
+from .keyword_index import KeywordPrefixIndex
+from .orchestrator_cache import OrchestratorCache
+from .stats_reconciler import ClientStatsReconciler
 
 config_manager: Optional[ConfigManager] = None
 db_manager: Optional[DatabaseManager] = None
+async_db: Optional[AsyncDatabaseManager] = None
 job_manager: Optional[JobManager] = None
+orchestrator_cache: Optional[OrchestratorCache] = None
+keyword_index: Optional[KeywordPrefixIndex] = None
+stats_reconciler: Optional[ClientStatsReconciler] = None
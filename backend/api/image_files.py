@@ -0,0 +1,61 @@
+# api/image_files.py
+import os
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+
+from core.image_store import CONTENT_ADDRESSED_NAME
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+
+class ImageStaticFiles(StaticFiles):
+    """
+    StaticFiles for the generated image directory.
+
+    Content-addressed files (see core.image_store) never change once written, so
+    they get a year-long immutable Cache-Control and an ETag derived from the
+    file name itself. Legacy, non-hashed files keep a short max-age and the
+    default stat-based ETag.
+    """
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        response = FileResponse(
+            full_path, status_code=status_code, stat_result=stat_result
+        )
+
+        file_name = os.path.basename(str(full_path))
+        if CONTENT_ADDRESSED_NAME.match(file_name):
+            response.headers["etag"] = f'"{os.path.splitext(file_name)[0]}"'
+            response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["cache-control"] = DEFAULT_CACHE_CONTROL
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedImageResponse(response.headers)
+        return response
+
+
+class NotModifiedImageResponse(Response):
+    """304 response carrying over the caching headers of the full response."""
+
+    NOT_MODIFIED_HEADERS = ("cache-control", "etag", "expires", "vary")
+
+    def __init__(self, headers: Headers):
+        super().__init__(
+            status_code=304,
+            headers={
+                name: value
+                for name, value in headers.items()
+                if name in self.NOT_MODIFIED_HEADERS
+            },
+        )
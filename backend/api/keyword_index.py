@@ -0,0 +1,135 @@
+# api/keyword_index.py
+import bisect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from data_access.database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class _ClientKeywords:
+    """Sorted (lowercased keyword, keyword) pairs for one client."""
+
+    def __init__(self, keywords: List[str]):
+        self.loaded_at = time.monotonic()
+        self.entries = sorted({(k.lower(), k) for k in keywords if k})
+
+    def add(self, keyword: str):
+        entry = (keyword.lower(), keyword)
+        i = bisect.bisect_left(self.entries, entry)
+        if i == len(self.entries) or self.entries[i] != entry:
+            self.entries.insert(i, entry)
+
+    def prefix(self, prefix: str, limit: int) -> List[str]:
+        prefix = prefix.lower()
+        i = bisect.bisect_left(self.entries, (prefix, ""))
+        matches = []
+        while i < len(self.entries) and len(matches) < limit:
+            lowered, keyword = self.entries[i]
+            if not lowered.startswith(prefix):
+                break
+            matches.append(keyword)
+            i += 1
+        return matches
+
+
+class KeywordPrefixIndex:
+    """
+    Per-client in-memory prefix index of processed keywords for autocomplete.
+
+    Each client's keywords are loaded lazily from
+    `get_all_processed_keywords_for_client` into a sorted array searched with
+    bisect, then kept current from `add_opportunities` commits. Clients are
+    evicted LRU beyond `max_clients`, and an index older than `max_age_seconds`
+    is reloaded so status changes (e.g. rejections) are eventually reflected.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_clients: int = 32,
+        max_age_seconds: float = 900.0,
+    ):
+        self.db_manager = db_manager
+        self.max_clients = max_clients
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[str, _ClientKeywords]" = OrderedDict()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        # Keywords committed while a client's index is being loaded.
+        self._pending: Dict[str, List[str]] = {}
+
+        db_manager.add_opportunities_added_listener(self.add_keywords)
+
+    def _get_fresh(self, client_id: str) -> Optional[_ClientKeywords]:
+        index = self._clients.get(client_id)
+        if index is None:
+            return None
+        if time.monotonic() - index.loaded_at > self.max_age_seconds:
+            del self._clients[client_id]
+            return None
+        self._clients.move_to_end(client_id)
+        return index
+
+    def _load(self, client_id: str) -> _ClientKeywords:
+        with self._lock:
+            index = self._get_fresh(client_id)
+            if index is not None:
+                return index
+            load_lock = self._load_locks.setdefault(client_id, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                index = self._get_fresh(client_id)
+                if index is not None:
+                    return index
+                self._pending[client_id] = []
+
+            try:
+                index = _ClientKeywords(
+                    self.db_manager.get_all_processed_keywords_for_client(client_id)
+                )
+            except Exception:
+                with self._lock:
+                    self._pending.pop(client_id, None)
+                raise
+
+            with self._lock:
+                for keyword in self._pending.pop(client_id, []):
+                    index.add(keyword)
+                self._clients[client_id] = index
+                while len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            logger.info(
+                f"Loaded keyword index for client '{client_id}' ({len(index.entries)} keywords)."
+            )
+            return index
+
+    def search(self, client_id: str, prefix: str, limit: int = 10) -> List[str]:
+        """Returns up to `limit` keywords starting with `prefix` (case-insensitive)."""
+        index = self._load(client_id)
+        with self._lock:
+            return index.prefix(prefix, limit)
+
+    def add_keywords(self, client_id: str, keywords: List[str]):
+        """Adds committed keywords to a loaded (or loading) client index."""
+        with self._lock:
+            if client_id in self._pending:
+                self._pending[client_id].extend(keywords)
+            index = self._clients.get(client_id)
+            if index is not None:
+                for keyword in keywords:
+                    if keyword:
+                        index.add(keyword)
+
+    def invalidate(self, client_id: Optional[str] = None):
+        """Drops the index for `client_id`, or for every client."""
+        with self._lock:
+            if client_id is None:
+                self._clients.clear()
+            else:
+                self._clients.pop(client_id, None)
@@ -84,7 +84,9 @@ class ContentHistoryItem(BaseModel):
     id: int
     opportunity_id: int
     timestamp: str
-    ai_content_json: Dict[str, Any]
+    title: Optional[str] = None
+    version_type: str
+    size_bytes: Optional[int] = None
 
 
 class RestoreRequest(BaseModel):
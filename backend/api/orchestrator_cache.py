@@ -0,0 +1,95 @@
+# api/orchestrator_cache.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Set
+
+from app_config.manager import ConfigManager
+from data_access.database_manager import DatabaseManager
+from jobs import JobManager
+from backend.pipeline import WorkflowOrchestrator
+
+logger = logging.getLogger(__name__)
+
+
+class OrchestratorCache:
+    """
+    Per-client cache of WorkflowOrchestrator instances and known client IDs.
+
+    Building an orchestrator loads and merges the client's settings and
+    constructs every API client and agent, so it is done once per client and
+    reused across requests. Entries are dropped when that client's settings are
+    written (or when global settings are reloaded) and rebuilt on next use.
+    """
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        db_manager: DatabaseManager,
+        job_manager: JobManager,
+        max_clients: int = 32,
+    ):
+        self.config_manager = config_manager
+        self.db_manager = db_manager
+        self.job_manager = job_manager
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._orchestrators: "OrderedDict[str, WorkflowOrchestrator]" = OrderedDict()
+        self._build_locks = {}
+        self._known_clients: Set[str] = set()
+        self._generation = 0  # Bumped on every invalidation.
+
+        db_manager.add_client_settings_listener(self.invalidate)
+        config_manager.add_global_settings_listener(self.invalidate)
+
+    def client_exists(self, client_id: str) -> bool:
+        """True if the client has settings. Positive answers are cached."""
+        with self._lock:
+            if client_id in self._known_clients:
+                return True
+        if not self.db_manager.get_client_settings(client_id):
+            return False
+        with self._lock:
+            self._known_clients.add(client_id)
+        return True
+
+    def get(self, client_id: str) -> WorkflowOrchestrator:
+        with self._lock:
+            orchestrator = self._orchestrators.get(client_id)
+            if orchestrator is not None:
+                self._orchestrators.move_to_end(client_id)
+                return orchestrator
+            build_lock = self._build_locks.setdefault(client_id, threading.Lock())
+
+        # Build outside the cache lock so one slow client does not block others,
+        # but only once per client when requests race.
+        with build_lock:
+            with self._lock:
+                orchestrator = self._orchestrators.get(client_id)
+                generation = self._generation
+            if orchestrator is not None:
+                return orchestrator
+
+            logger.info(f"Building orchestrator for client '{client_id}'.")
+            orchestrator = WorkflowOrchestrator(
+                self.config_manager, self.db_manager, client_id, self.job_manager
+            )
+            with self._lock:
+                self._known_clients.add(client_id)
+                if generation != self._generation:
+                    # Settings changed while building; serve it once, don't cache.
+                    return orchestrator
+                self._orchestrators[client_id] = orchestrator
+                while len(self._orchestrators) > self.max_clients:
+                    self._orchestrators.popitem(last=False)
+            return orchestrator
+
+    def invalidate(self, client_id: Optional[str] = None):
+        """Drops the cached orchestrator for `client_id`, or for every client."""
+        with self._lock:
+            self._generation += 1
+            if client_id is None:
+                self._orchestrators.clear()
+            else:
+                self._orchestrators.pop(client_id, None)
+        logger.info(f"Orchestrator cache invalidated for {client_id or 'all clients'}.")
@@ -0,0 +1,19 @@
+# api/responses.py
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from backend.core import serializer
+
+
+class SerializerJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with core.serializer (orjson when it is installed).
+
+    Endpoints returning large payloads built from database rows return it
+    directly. The content is already plain JSON types, so FastAPI's
+    jsonable_encoder pass and response-model validation are skipped too.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return serializer.dumps_bytes(content)
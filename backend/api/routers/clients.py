@@ -2,10 +2,9 @@ import logging
 from pydantic import BaseModel
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException
-from data_access.database_manager import DatabaseManager
-from ..dependencies import get_db, get_orchestrator
+from data_access.async_database import AsyncDatabaseManager
+from ..dependencies import get_async_db, get_authorized_client_id
 from .. import globals as api_globals
-from backend.pipeline import WorkflowOrchestrator
 
 
 class NewClientRequest(BaseModel):
@@ -18,9 +17,9 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/clients")
-async def get_all_clients(db: DatabaseManager = Depends(get_db)):
+async def get_all_clients(db: AsyncDatabaseManager = Depends(get_async_db)):
     logger.info("Received request for /clients")
-    clients = db.get_clients()
+    clients = await db.get_clients()
     logger.info(f"Found clients: {clients}")
     if not clients:
         return []
@@ -30,15 +29,15 @@ async def get_all_clients(db: DatabaseManager = Depends(get_db)):
 @router.get("/clients/{client_id}/settings")
 async def get_client_settings_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    settings = db.get_client_settings(client_id)
+    settings = await db.get_client_settings(client_id)
     if not settings:
         raise HTTPException(
             status_code=404, detail=f"Settings not found for client '{client_id}'"
@@ -49,15 +48,15 @@ async def get_client_settings_endpoint(
 @router.get("/clients/{client_id}/dashboard-stats")
 async def get_dashboard_stats_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    stats = db.get_dashboard_stats(client_id)
+    stats = await db.get_dashboard_stats(client_id)
     if not stats:
         raise HTTPException(
             status_code=404, detail=f"Stats not found for client '{client_id}'"
@@ -68,19 +67,19 @@ async def get_dashboard_stats_endpoint(
 @router.get("/clients/{client_id}/dashboard")
 async def get_dashboard_data_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Endpoint to fetch aggregated data for the main dashboard."""
     logger.info(f"Dashboard endpoint called for client: {client_id}")
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
     try:
         logger.info("Fetching dashboard data from database...")
-        dashboard_data = db.get_dashboard_data(client_id)
+        dashboard_data = await db.get_dashboard_data(client_id)
         logger.info("Successfully fetched dashboard data.")
         if not dashboard_data:
             logger.warning(f"No dashboard data found for client {client_id}")
@@ -97,16 +96,16 @@ async def get_dashboard_data_endpoint(
 @router.get("/clients/{client_id}/processed-keywords")
 async def get_processed_keywords_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Retrieves all processed keywords for a client to prevent duplicates."""
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    keywords = db.get_all_processed_keywords_for_client(client_id)
+    keywords = await db.get_all_processed_keywords_for_client(client_id)
     return keywords
 
 
@@ -114,31 +113,83 @@ async def get_processed_keywords_endpoint(
 async def check_existing_keywords_endpoint(
     client_id: str,
     keywords: List[str],
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Checks a batch of keywords and returns which ones already exist."""
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    existing = db.check_existing_keywords(client_id, keywords)
+    existing = await db.check_existing_keywords(client_id, keywords)
     return {"existing_keywords": existing}
 
 
+@router.get("/clients/{client_id}/keyword-typeahead")
+async def keyword_typeahead_endpoint(
+    client_id: str,
+    prefix: str,
+    limit: int = 10,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
+):
+    """
+    Autocomplete for processed keywords, served from the in-memory prefix
+    index. SQLite is only read when a client's index is (re)loaded, which is
+    why the search runs on the database executor.
+    """
+    if client_id != current_client_id:
+        raise HTTPException(
+            status_code=403,
+            detail="You do not have permission to access this client's resources.",
+        )
+    if not prefix.strip():
+        return []
+    return await db.run(
+        api_globals.keyword_index.search,
+        client_id,
+        prefix.strip(),
+        max(1, min(limit, 50)),
+    )
+
+
+@router.get("/clients/{client_id}/serp/domain-rankings")
+async def domain_serp_rankings_endpoint(
+    client_id: str,
+    domain: str,
+    max_rank: int = 3,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
+):
+    """
+    Lists the client's keywords where `domain` ranks organically within
+    `max_rank`, from the latest stored SERP snapshot of each keyword.
+    """
+    if client_id != current_client_id:
+        raise HTTPException(
+            status_code=403,
+            detail="You do not have permission to access this client's resources.",
+        )
+    if not domain.strip():
+        return []
+    return await db.get_domain_serp_rankings(
+        domain.strip(), max(1, min(max_rank, 100)), client_id=client_id
+    )
+
+
 # ADD the new endpoint to the router:
 @router.get("/clients/{client_id}/search-all-assets")
 async def search_all_assets_endpoint(
     client_id: str,
     query: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     logger.info(
         f"Received search-all-assets request for client {client_id} with query: '{query}'"
     )
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
@@ -146,57 +197,45 @@ async def search_all_assets_endpoint(
     if len(query) < 3:
         return []
 
+    # One ranked FTS5 query covers opportunities and discovery runs.
     results = []
-
-    # Search Opportunities
-    opportunities = db.search_opportunities(client_id, query)
-    for opp in opportunities:
-        results.append({"id": opp["id"], "name": opp["keyword"], "type": "opportunity"})
-
-    # Search Discovery Runs (by seed keywords or run status/error)
-    discovery_runs = db.search_discovery_runs(client_id, query)
-    for run in discovery_runs:
-        seed_keywords_str = ", ".join(
-            run.get("parameters", {}).get("seed_keywords", [])
-        )
-        results.append(
-            {
-                "id": run["id"],
-                "name": f"Discovery Run #{run['id']}: {seed_keywords_str[:50]}...",
-                "type": "discovery_run",
-            }
-        )
-
-    # Deduplicate results by type-id if necessary (optional, but good practice)
-    unique_results = {}
-    for item in results:
-        key = f"{item['type']}-{item['id']}"
-        if key not in unique_results:
-            unique_results[key] = item
-
-    return list(unique_results.values())
+    for hit in await db.search_assets(client_id, query):
+        if hit["asset_type"] == "opportunity":
+            results.append(
+                {"id": hit["asset_id"], "name": hit["keyword"], "type": "opportunity"}
+            )
+        else:
+            seed_keywords_str = ", ".join(hit["seed_keywords"])
+            results.append(
+                {
+                    "id": hit["asset_id"],
+                    "name": f"Discovery Run #{hit['asset_id']}: {seed_keywords_str[:50]}...",
+                    "type": "discovery_run",
+                }
+            )
+    return results
 
 
 @router.get("/clients/{client_id}/opportunities/high-priority")
 async def get_high_priority_opportunities_endpoint(
     client_id: str,
     limit: int = 5,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Retrieves a short list of the highest-scored, validated opportunities."""
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    opportunities = db.get_high_priority_opportunities(client_id, limit)
+    opportunities = await db.get_high_priority_opportunities(client_id, limit)
     return opportunities
 
 
 @router.post("/clients")
 async def add_new_client(
-    request: NewClientRequest, db: DatabaseManager = Depends(get_db)
+    request: NewClientRequest, db: AsyncDatabaseManager = Depends(get_async_db)
 ):
     """Adds a new client to the database and initializes their settings."""
     try:
@@ -210,7 +249,7 @@ async def add_new_client(
             api_globals.config_manager.get_default_client_settings_template()
         )
 
-        success = db.add_client(
+        success = await db.add_client(
             client_id=request.client_id,
             client_name=request.client_name,
             default_settings=default_settings,
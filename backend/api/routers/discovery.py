@@ -1,16 +1,16 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
-from data_access.database_manager import DatabaseManager
+from data_access.async_database import AsyncDatabaseManager
 from backend.pipeline import WorkflowOrchestrator
 from services.discovery_service import DiscoveryService
-from ..dependencies import get_db, get_orchestrator, get_discovery_service
+from ..dependencies import get_async_db, get_orchestrator, get_discovery_service, get_authorized_client_id
 from ..models import (
     JobResponse,
     DiscoveryRunRequest,
 )  # Ensure DiscoveryRunRequest is imported
 
 # --- NEW IMPORTS AND MODELS FOR FRONTEND FEATURES ---
-from typing import Dict
+from typing import Dict, Optional
 
 
 # --- END NEW IMPORTS AND MODELS ---
@@ -144,6 +144,7 @@ async def get_available_filters():
 async def start_discovery_run_async(
     client_id: str,
     request: DiscoveryRunRequest,
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
     discovery_service: DiscoveryService = Depends(get_discovery_service),
 ):
@@ -180,11 +181,14 @@ async def start_discovery_run_async(
             "closely_variants": request.closely_variants,  # NEW
             "ignore_synonyms": request.ignore_synonyms,  # NEW
         }
-        run_id = discovery_service.create_discovery_run(
-            client_id=client_id, parameters=parameters
+        run_id = await db.run(
+            discovery_service.create_discovery_run,
+            client_id=client_id,
+            parameters=parameters,
         )
 
-        job_id = orchestrator.run_discovery_and_save(
+        job_id = await db.run(
+            orchestrator.run_discovery_and_save,
             run_id,
             request.seed_keywords,
             discovery_modes,
@@ -214,15 +218,15 @@ async def get_discovery_runs(
     client_id: str,
     page: int = 1,
     limit: int = 10,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    runs, total_count = db.get_all_discovery_runs_paginated(client_id, page, limit)
+    runs, total_count = await db.get_all_discovery_runs_paginated(client_id, page, limit)
     if not runs:
         return {"items": [], "total_items": 0, "page": page, "limit": limit}
     return {"items": runs, "total_items": total_count, "page": page, "limit": limit}
@@ -235,12 +239,12 @@ async def get_discovery_runs(
 async def rerun_discovery_run(
     run_id: int,
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
-    db: DatabaseManager = Depends(get_db),  # current_client_id dependency removed here
+    db: AsyncDatabaseManager = Depends(get_async_db),  # current_client_id dependency removed here
 ):
     """
     Initiates a new discovery run using the parameters from a previous run.
     """
-    previous_run = db.get_discovery_run_by_id(run_id)
+    previous_run = await db.get_discovery_run_by_id(run_id)
     if not previous_run:
         raise HTTPException(status_code=404, detail="Discovery run not found.")
 
@@ -289,10 +293,11 @@ async def rerun_discovery_run(
             "depth": depth,
         }
 
-        new_run_id = orchestrator.db_manager.create_discovery_run(
+        new_run_id = await db.create_discovery_run(
             client_id=previous_run["client_id"], parameters=new_run_parameters
         )
-        job_id = orchestrator.run_discovery_and_save(
+        job_id = await db.run(
+            orchestrator.run_discovery_and_save,
             new_run_id,
             seed_keywords,
             discovery_modes,
@@ -315,26 +320,33 @@ async def rerun_discovery_run(
 @router.get("/discovery-runs/{run_id}/keywords")
 async def get_run_keywords(
     run_id: int,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    page: int = 1,
+    limit: int = 50,
+    status: Optional[str] = None,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
-    Retrieves all keywords that were added to the database as part of a specific discovery run.
+    Retrieves one page of the keywords that were added to the database as part of a
+    specific discovery run, optionally filtered by status.
     """
-    run = db.get_discovery_run_by_id(run_id)
+    run = await db.get_discovery_run_by_id(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Discovery run not found.")
     if (
-        run["client_id"] != orchestrator.client_id
+        run["client_id"] != current_client_id
     ):  # Use orchestrator's client_id for auth
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access these keywords.",
         )
 
+    page, limit = max(1, page), max(1, min(limit, 500))
     try:
-        keywords = db.get_keywords_for_run(run_id)
-        return keywords
+        keywords, total_count = await db.get_keywords_for_run_page(
+            run_id, page, limit, status=status
+        )
+        return {"items": keywords, "total_items": total_count, "page": page, "limit": limit}
     except Exception as e:
         logger.error(
             f"Failed to retrieve keywords for run {run_id}: {e}", exc_info=True
@@ -346,27 +358,32 @@ async def get_run_keywords(
 async def get_run_keywords_by_reason(
     run_id: int,
     reason: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    page: int = 1,
+    limit: int = 50,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
-    Retrieves all keywords that were added to the database as part of a specific discovery run
-    that were disqualified for a specific reason.
+    Retrieves one page of the keywords from a specific discovery run that were
+    disqualified for a specific reason.
     """
-    run = db.get_discovery_run_by_id(run_id)
+    run = await db.get_discovery_run_by_id(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Discovery run not found.")
     if (
-        run["client_id"] != orchestrator.client_id
+        run["client_id"] != current_client_id
     ):  # Use orchestrator's client_id for auth
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access these keywords.",
         )
 
+    page, limit = max(1, page), max(1, min(limit, 500))
     try:
-        keywords = db.get_keywords_for_run_by_reason(run_id, reason)
-        return keywords
+        keywords, total_count = await db.get_keywords_for_run_page(
+            run_id, page, limit, reason=reason
+        )
+        return {"items": keywords, "total_items": total_count, "page": page, "limit": limit}
     except Exception as e:
         logger.error(
             f"Failed to retrieve keywords for run {run_id} and reason {reason}: {e}",
@@ -379,11 +396,13 @@ async def get_run_keywords_by_reason(
     "/discovery-runs/{run_id}/disqualification-reasons", response_model=Dict[str, int]
 )
 async def get_disqualification_reasons_endpoint(
-    run_id: int, discovery_service: DiscoveryService = Depends(get_discovery_service)
+    run_id: int,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    discovery_service: DiscoveryService = Depends(get_discovery_service),
 ):
     """
     Retrieves a summary of disqualification reasons for a specific discovery run.
     """
     logger.info(f"Received request for disqualification reasons for run {run_id}")
-    reasons = discovery_service.get_disqualification_reasons(run_id)
+    reasons = await db.run(discovery_service.get_disqualification_reasons, run_id)
     return reasons
@@ -2,8 +2,9 @@
 
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from data_access.async_database import AsyncDatabaseManager
 from jobs import JobManager
-from ..dependencies import get_job_manager
+from ..dependencies import get_async_db, get_job_manager
 from ..models import JobResponse
 
 router = APIRouter()
@@ -12,13 +13,15 @@ logger = logging.getLogger(__name__)
 
 @router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job_status(
-    job_id: str, job_manager: JobManager = Depends(get_job_manager)
+    job_id: str,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    job_manager: JobManager = Depends(get_job_manager),
 ):
     """
     Retrieves the status of a background job.
     """
     logger.info(f"Received request for job status for job_id: {job_id}")
-    job = job_manager.get_job_status(job_id)
+    job = await db.run(job_manager.get_job_status, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -2,11 +2,10 @@ import logging
 import bleach
 import json
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
-from data_access.database_manager import DatabaseManager
-from fastapi.concurrency import run_in_threadpool
+from fastapi import APIRouter, Depends, HTTPException, Request
+from data_access.async_database import AsyncDatabaseManager
 from services.opportunities_service import OpportunitiesService
-from ..dependencies import get_db, get_opportunities_service, get_orchestrator
+from ..dependencies import get_async_db, get_opportunities_service, get_authorized_client_id
 from ..models import (
     OpportunityListResponse,
     ContentHistoryItem,
@@ -14,9 +13,17 @@ from ..models import (
     SocialMediaPostsUpdate,
     ContentUpdatePayload,
 )
+from ..responses import SerializerJSONResponse
+from ..conditional import (
+    is_not_modified,
+    not_modified,
+    opportunity_etag,
+    opportunity_list_etag,
+    set_etag,
+)
 from pydantic import BaseModel
+from backend.core.score_breakdown import inflate_breakdown, is_compact_breakdown
 from .. import globals as api_globals
-from backend.pipeline import WorkflowOrchestrator
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -41,17 +48,22 @@ class ContentFeedbackRequest(BaseModel):
 )
 async def get_all_opportunities_summary_endpoint(
     client_id: str,
+    request: Request,
     status: Optional[str] = None,
     keyword: Optional[str] = None,
     page: int = 1,
     limit: int = 20,
     sort_by: str = "date_added",
     sort_direction: str = "desc",
+    db: AsyncDatabaseManager = Depends(get_async_db),
     opportunities_service: OpportunitiesService = Depends(get_opportunities_service),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
-    """Endpoint for fetching a paginated summary of opportunities for the main table view."""
-    if client_id != orchestrator.client_id:
+    """
+    Endpoint for fetching a paginated summary of opportunities for the main table
+    view. The ETag covers the query and the version of every row on the page.
+    """
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
@@ -64,18 +76,27 @@ async def get_all_opportunities_summary_endpoint(
         "sort_by": sort_by,
         "sort_direction": sort_direction,
     }
-    opportunities, total_count = await run_in_threadpool(
+    opportunities, total_count = await db.run(
         opportunities_service.get_all_opportunities_summary,
         client_id,
         params,
-        select_columns="id, keyword, status, date_added, strategic_score, cpc, competition, main_intent, blog_qualification_status, blog_qualification_reason, latest_job_id, cluster_name, full_data",
+        select_columns="id, keyword, status, date_added, strategic_score, cpc, competition, main_intent, blog_qualification_status, blog_qualification_reason, latest_job_id, cluster_name, keyword_info, keyword_properties, score_breakdown, version",
     )
-    return {
-        "items": opportunities,
-        "total_items": total_count,
-        "page": page,
-        "limit": limit,
-    }
+    etag = opportunity_list_etag(
+        {"client_id": client_id, **params}, opportunities, total_count
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response = SerializerJSONResponse(
+        {
+            "items": opportunities,
+            "total_items": total_count,
+            "page": page,
+            "limit": limit,
+        }
+    )
+    set_etag(response, etag)
+    return response
 
 
 @router.get(
@@ -84,18 +105,19 @@ async def get_all_opportunities_summary_endpoint(
 )
 async def get_opportunities_by_cluster_endpoint(
     client_id: str,
+    db: AsyncDatabaseManager = Depends(get_async_db),
     opportunities_service: OpportunitiesService = Depends(get_opportunities_service),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Retrieves all opportunities for a client, grouped by cluster.
     """
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    opportunities_by_cluster = await run_in_threadpool(
+    opportunities_by_cluster = await db.run(
         opportunities_service.get_opportunities_by_cluster, client_id
     )
     return opportunities_by_cluster
@@ -103,7 +125,7 @@ async def get_opportunities_by_cluster_endpoint(
 
 @router.put("/opportunities/{opportunity_id}/status", response_model=Dict[str, str])
 async def update_opportunity_status_endpoint(
-    opportunity_id: int, status: str, db: DatabaseManager = Depends(get_db)
+    opportunity_id: int, status: str, db: AsyncDatabaseManager = Depends(get_async_db)
 ):
     """
     Manually updates the status of an opportunity.
@@ -111,13 +133,16 @@ async def update_opportunity_status_endpoint(
     logger.info(
         f"Received request to update status for opportunity {opportunity_id} to {status}"
     )
-    db.update_opportunity_status(opportunity_id, status)
+    await db.update_opportunity_status(opportunity_id, status)
     return {"message": "Opportunity status updated successfully."}
 
 
 @router.post("/opportunities/bulk-action", response_model=Dict[str, str])
 async def bulk_action_endpoint(
-    action: str, opportunity_ids: List[int], db: DatabaseManager = Depends(get_db)
+    action: str,
+    opportunity_ids: List[int],
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Performs a bulk action on a list of opportunities.
@@ -125,29 +150,35 @@ async def bulk_action_endpoint(
     logger.info(
         f"Received request to perform bulk action '{action}' on {len(opportunity_ids)} opportunities"
     )
-    for opportunity_id in opportunity_ids:
-        if action == "reject":
-            db.update_opportunity_status(opportunity_id, "rejected")
-        elif action == "approve":
-            db.update_opportunity_status(opportunity_id, "qualified")
+    statuses = {"reject": "rejected", "approve": "qualified"}
+    if action in statuses:
+        updated = await db.update_opportunity_status_bulk(
+            opportunity_ids,
+            statuses[action],
+            current_client_id,
+        )
+        logger.info(f"Bulk action '{action}' updated {updated} opportunities.")
 
     return {"message": "Bulk action completed successfully."}
 
 
 @router.post("/opportunities/compare", response_model=List[Dict[str, Any]])
 async def compare_opportunities_endpoint(
-    opportunity_ids: List[int], db: DatabaseManager = Depends(get_db)
+    opportunity_ids: List[int],
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Retrieves a list of opportunities for comparison.
     """
     logger.info(f"Received request to compare {len(opportunity_ids)} opportunities")
-    opportunities = []
-    for opportunity_id in opportunity_ids:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
-        if opportunity:
-            opportunities.append(opportunity)
-
+    opportunities = await db.get_opportunities_by_ids(
+        opportunity_ids, client_id=current_client_id
+    )
+    for opportunity in opportunities:
+        opportunity["score_breakdown"] = inflate_breakdown(
+            opportunity.get("score_breakdown")
+        )
     return opportunities
 
 
@@ -157,11 +188,11 @@ async def compare_opportunities_endpoint(
 async def search_opportunities_endpoint(
     client_id: str,
     query: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     logger.info(f"Received search request for client {client_id} with query: '{query}'")
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
@@ -169,26 +200,39 @@ async def search_opportunities_endpoint(
     if len(query) < 3:
         return []
 
-    opportunities = db.search_opportunities(client_id, query)
+    opportunities = await db.search_opportunities(client_id, query)
     return opportunities
 
 
 @router.get("/opportunities/{opportunity_id}", response_model=Dict[str, Any])
 async def get_opportunity_by_id_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),  # Add this
+    request: Request,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
+    """
+    Returns the full opportunity. The ETag comes from the row version, which is
+    checked first so an unchanged opportunity is answered with 304 without
+    loading its documents.
+    """
     logger.info(f"Received request for opportunity {opportunity_id}")
-    opportunity = db.get_opportunity_by_id(opportunity_id)
-    if not opportunity:
+    current = await db.get_opportunity_version(opportunity_id)
+    if not current:
         raise HTTPException(status_code=404, detail="Opportunity not found")
     # Add authorization check
-    if opportunity["client_id"] != orchestrator.client_id:
+    if current["client_id"] != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this opportunity.",
         )
+    etag = opportunity_etag(opportunity_id, current["version"])
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    opportunity = await db.get_opportunity_by_id(opportunity_id)
+    if not opportunity or opportunity["client_id"] != current_client_id:
+        raise HTTPException(status_code=404, detail="Opportunity not found")
 
     # W23 FIX: Manually parse the blueprint from full_data if it exists
     if opportunity.get("full_data") and isinstance(opportunity["full_data"], str):
@@ -203,8 +247,20 @@ async def get_opportunity_by_id_endpoint(
                 f"Could not decode full_data JSON for opportunity {opportunity_id}."
             )
 
-    logger.info(f"Retrieved opportunity from DB: {opportunity}")
-    return opportunity
+    # Discovery stores compact breakdowns; rebuild the readable one on demand.
+    if is_compact_breakdown(opportunity.get("score_breakdown")):
+        orchestrator = await db.run(api_globals.orchestrator_cache.get, current_client_id)
+        opportunity["score_breakdown"] = orchestrator.scoring_engine.explain_breakdown(
+            opportunity
+        )
+        if isinstance(opportunity.get("full_data"), dict):
+            opportunity["full_data"]["score_breakdown"] = opportunity["score_breakdown"]
+
+    logger.debug(f"Retrieved opportunity {opportunity_id} (version {opportunity['version']}).")
+    response = SerializerJSONResponse(opportunity)
+    # Tag what is returned: the row may have changed since the version check.
+    set_etag(response, opportunity_etag(opportunity_id, opportunity["version"]))
+    return response
 
 
 @router.get(
@@ -212,26 +268,43 @@ async def get_opportunity_by_id_endpoint(
     response_model=List[ContentHistoryItem],
 )
 async def get_content_history_endpoint(
-    opportunity_id: int, db: DatabaseManager = Depends(get_db)
+    opportunity_id: int, db: AsyncDatabaseManager = Depends(get_async_db)
 ):
     logger.info(f"Fetching content history for opportunity {opportunity_id}")
-    history = db.get_content_history(opportunity_id)
+    history = await db.get_content_history(opportunity_id)
     if not history:
         return []
     return history
 
 
+@router.get(
+    "/opportunities/{opportunity_id}/content-history/{history_id}",
+    response_model=Dict[str, Any],
+)
+async def get_content_version_endpoint(
+    opportunity_id: int, history_id: int, db: AsyncDatabaseManager = Depends(get_async_db)
+):
+    """Rebuilds and returns the full content of one history version."""
+    try:
+        content = await db.get_content_version(opportunity_id, history_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    if content is None:
+        raise HTTPException(status_code=404, detail="Content version not found.")
+    return {"id": history_id, "ai_content_json": content}
+
+
 @router.post(
     "/opportunities/{opportunity_id}/restore-content", response_model=Dict[str, Any]
 )
 async def restore_content_version_endpoint(
-    opportunity_id: int, request: RestoreRequest, db: DatabaseManager = Depends(get_db)
+    opportunity_id: int, request: RestoreRequest, db: AsyncDatabaseManager = Depends(get_async_db)
 ):
     logger.info(
         f"Restoring content version from {request.version_timestamp} for opportunity {opportunity_id}"
     )
     try:
-        restored_content = db.restore_content_version(
+        restored_content = await db.restore_content_version(
             opportunity_id, request.version_timestamp
         )
         if restored_content:
@@ -262,20 +335,20 @@ async def restore_content_version_endpoint(
 async def update_social_media_posts_endpoint(
     opportunity_id: int,
     payload: SocialMediaPostsUpdate,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),  # Add this
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     logger.info(f"Updating social media posts for opportunity {opportunity_id}")
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found")
-        if opportunity["client_id"] != orchestrator.client_id:
+        if opportunity["client_id"] != current_client_id:
             raise HTTPException(
                 status_code=403,
                 detail="You do not have permission to access this opportunity.",
             )
-        db.update_opportunity_social_posts(opportunity_id, payload.social_media_posts)
+        await db.update_opportunity_social_posts(opportunity_id, payload.social_media_posts)
         return {"message": "Social media posts updated successfully."}
     except Exception as e:
         logger.error(
@@ -291,19 +364,19 @@ async def update_social_media_posts_endpoint(
 async def update_opportunity_content_endpoint(
     opportunity_id: int,
     payload: ContentUpdatePayload,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),  # Add this
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Updates the main HTML content of an opportunity's ai_content blob with server-side sanitization."""
     logger.info(f"Received manual content update for opportunity {opportunity_id}")
     from datetime import datetime
 
     try:
-        current_opp = db.get_opportunity_by_id(opportunity_id)
+        current_opp = await db.get_opportunity_by_id(opportunity_id, projection="content")
         if not current_opp:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
-        if current_opp["client_id"] != orchestrator.client_id:
+        if current_opp["client_id"] != current_client_id:
             raise HTTPException(
                 status_code=403,
                 detail="You do not have permission to access this opportunity.",
@@ -355,7 +428,7 @@ async def update_opportunity_content_endpoint(
         # 2. Save the current version to history before overwriting
         current_ai_content = current_opp.get("ai_content", {})
         if current_ai_content:
-            db.save_content_version_to_history(
+            await db.save_content_version_to_history(
                 opportunity_id,
                 current_ai_content,
                 timestamp=f"{datetime.now().isoformat()} (Before Manual Edit)",
@@ -366,7 +439,7 @@ async def update_opportunity_content_endpoint(
         updated_ai_content["article_body_html"] = clean_html
 
         # Use the query that also updates status and timestamp
-        db.update_opportunity_ai_content_and_status(
+        await db.update_opportunity_ai_content_and_status(
             opportunity_id,
             updated_ai_content,
             current_opp.get("ai_content_model"),
@@ -388,10 +461,10 @@ async def update_opportunity_content_endpoint(
     response_model=Dict[str, str],
 )
 async def override_disqualification_endpoint(
-    opportunity_id: int, db: DatabaseManager = Depends(get_db)
+    opportunity_id: int, db: AsyncDatabaseManager = Depends(get_async_db)
 ):
     """Manually overrides a 'failed' or 'rejected' qualification status."""
-    success = db.override_disqualification(opportunity_id)
+    success = await db.override_disqualification(opportunity_id)
     if not success:
         raise HTTPException(
             status_code=404,
@@ -406,13 +479,13 @@ async def override_disqualification_endpoint(
 async def submit_content_feedback_endpoint(
     opportunity_id: int,
     request: ContentFeedbackRequest,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
 ):
     """Submits user feedback for the generated content."""
     if not (1 <= request.rating <= 5):
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 5.")
     try:
-        db.save_content_feedback(opportunity_id, request.rating, request.comments)
+        await db.save_content_feedback(opportunity_id, request.rating, request.comments)
         return {"message": "Feedback submitted successfully."}
     except Exception as e:
         logger.error(
@@ -1,10 +1,11 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional, Dict, List
-from data_access.database_manager import DatabaseManager
+from data_access.async_database import AsyncDatabaseManager
 from jobs import JobManager
-from ..dependencies import get_db, get_job_manager, get_orchestrator
+from ..dependencies import get_async_db, get_job_manager, get_orchestrator, get_authorized_client_id
 from ..models import (
     JobResponse,
     AnalysisRequest,
@@ -13,6 +14,8 @@ from ..models import (
     ApproveAnalysisRequest,
 )  # Add ApproveAnalysisRequest
 from backend.pipeline import WorkflowOrchestrator
+from backend.core.cost_ledger import cost_ledger
+from backend.external_apis.openai_runtime import agent_metrics
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -29,11 +32,11 @@ class GenerationRequest(BaseModel):
 async def run_generation_async_endpoint(
     opportunity_id: int,
     request: GenerationRequest,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -56,7 +59,8 @@ async def run_generation_async_endpoint(
             )
 
         # orchestrator is already initialized with the correct client_id from the header
-        job_id = orchestrator.run_full_content_generation(
+        job_id = await db.run(
+            orchestrator.run_full_content_generation,
             opportunity_id, request.model_override, request.temperature
         )
         return {
@@ -75,11 +79,11 @@ async def run_generation_async_endpoint(
 )
 async def run_validation_async_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
         if opportunity["client_id"] != orchestrator.client_id:
@@ -87,7 +91,7 @@ async def run_validation_async_endpoint(
                 status_code=403,
                 detail="You do not have permission to access this opportunity.",
             )
-        job_id = orchestrator.run_validation(opportunity_id)
+        job_id = await db.run(orchestrator.run_validation, opportunity_id)
         return {"job_id": job_id, "message": f"Validation job {job_id} started."}
     except Exception as e:
         logger.error(
@@ -102,11 +106,11 @@ async def run_validation_async_endpoint(
 async def run_analysis_async_endpoint(
     opportunity_id: int,
     request: AnalysisRequest,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -128,7 +132,8 @@ async def run_analysis_async_endpoint(
             )
         # --- START MODIFICATION ---
         # Pass selected_competitor_urls from the request
-        job_id = orchestrator.run_full_analysis(
+        job_id = await db.run(
+            orchestrator.run_full_analysis,
             opportunity_id, request.selected_competitor_urls
         )
         # --- END MODIFICATION ---
@@ -143,12 +148,12 @@ async def run_analysis_async_endpoint(
 @router.get("/orchestrator/{opportunity_id}/full-prompt", response_model=str)
 async def get_full_prompt_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to get the full, flattened prompt for an opportunity."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
         if opportunity["client_id"] != orchestrator.client_id:
@@ -157,7 +162,7 @@ async def get_full_prompt_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        full_prompt = orchestrator.get_full_prompt_for_display(opportunity_id)
+        full_prompt = await db.run(orchestrator.get_full_prompt_for_display, opportunity_id)
         if not full_prompt:
             raise HTTPException(
                 status_code=404,
@@ -176,12 +181,12 @@ async def get_full_prompt_endpoint(
 )
 async def regenerate_social_async_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to start a job for regenerating only the social media posts."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -191,7 +196,7 @@ async def regenerate_social_async_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        job_id = orchestrator.regenerate_social_posts(opportunity_id)
+        job_id = await db.run(orchestrator.regenerate_social_posts, opportunity_id)
         return {
             "job_id": job_id,
             "message": f"Social media post regeneration job {job_id} started.",
@@ -204,6 +209,63 @@ async def regenerate_social_async_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class BulkSocialPostsRequest(BaseModel):
+    opportunity_ids: List[int]
+
+
+@router.post("/orchestrator/social-posts/bulk-regenerate-async", response_model=JobResponse)
+async def bulk_regenerate_social_async_endpoint(
+    request: BulkSocialPostsRequest,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+):
+    """
+    Starts a job that regenerates social posts for many opportunities, using the
+    OpenAI Batch API for large sets. Opportunities of other clients are skipped.
+    """
+    if not request.opportunity_ids:
+        raise HTTPException(status_code=400, detail="No opportunity IDs provided.")
+    try:
+        job_id = await db.run(
+            orchestrator.regenerate_social_posts_bulk, request.opportunity_ids
+        )
+        return {
+            "job_id": job_id,
+            "message": f"Bulk social post regeneration job {job_id} started.",
+        }
+    except Exception as e:
+        logger.error(f"Failed to start bulk social post regeneration: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+class BulkAnalysisRequest(BaseModel):
+    opportunity_ids: List[int]
+
+
+@router.post("/orchestrator/analysis/bulk-run-async", response_model=JobResponse)
+async def bulk_analysis_async_endpoint(
+    request: BulkAnalysisRequest,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+):
+    """
+    Starts one job that analyzes many opportunities through a staged pipeline
+    (SERP, competitor crawl, AI synthesis, persistence). Opportunities of other
+    clients, or with a workflow already active, are skipped.
+    """
+    if not request.opportunity_ids:
+        raise HTTPException(status_code=400, detail="No opportunity IDs provided.")
+    try:
+        job_id = await db.run(orchestrator.run_bulk_analysis, request.opportunity_ids)
+        return {
+            "job_id": job_id,
+            "message": f"Bulk analysis job {job_id} started.",
+        }
+    except Exception as e:
+        logger.error(f"Failed to start bulk analysis: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 class DiscoveryCostParams(BaseModel):
     seed_keywords: List[str]
     discovery_modes: List[str]
@@ -220,7 +282,7 @@ class CostEstimationRequest(BaseModel):
 async def estimate_cost_endpoint(
     request: CostEstimationRequest,
     opportunity_id: Optional[int] = None,  # Make opportunity_id optional
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """
@@ -245,7 +307,8 @@ async def estimate_cost_endpoint(
                     detail="discovery_params are required for 'discovery' action.",
                 )
             # For discovery, we don't need to check for an opportunity
-            cost_estimation = orchestrator.estimate_action_cost(
+            cost_estimation = await db.run(
+                orchestrator.estimate_action_cost,
                 action=action, discovery_params=request.discovery_params.dict()
             )
         else:
@@ -255,7 +318,7 @@ async def estimate_cost_endpoint(
                     detail="opportunity_id is required for this action.",
                 )
 
-            opportunity = db.get_opportunity_by_id(opportunity_id)
+            opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
             if not opportunity:
                 raise HTTPException(status_code=404, detail="Opportunity not found")
 
@@ -265,7 +328,8 @@ async def estimate_cost_endpoint(
                     detail="You do not have permission to access this opportunity.",
                 )
 
-            cost_estimation = orchestrator.estimate_action_cost(
+            cost_estimation = await db.run(
+                orchestrator.estimate_action_cost,
                 action=action, opportunity_id=opportunity_id
             )
 
@@ -281,23 +345,28 @@ async def estimate_cost_endpoint(
 
 @router.get("/jobs/{job_id}/status")
 async def get_job_status_endpoint(
-    job_id: str, jm: JobManager = Depends(get_job_manager)
+    job_id: str,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    jm: JobManager = Depends(get_job_manager),
 ):
     """Endpoint to get the status of a background job."""
     logger.info(f"API: Received request for job status: {job_id}")
-    job_status = jm.get_job_status(job_id)
+    job_status = await db.run(jm.get_job_status, job_id)
     if not job_status:
         logger.warning(f"API: Job with ID {job_id} not found in JobManager.")
         raise HTTPException(status_code=404, detail="Job not found")
     logger.info(f"API: Found job {job_id}, status: {job_status.get('status')}")
+    live_usage = cost_ledger.get(job_id)
+    if live_usage:
+        job_status["live_api_usage"] = live_usage
     return {"job_id": job_status["id"], "message": f"Status: {job_status['status']}", **job_status}
 
 
 @router.get("/jobs")
-async def get_all_jobs_endpoint(db: DatabaseManager = Depends(get_db)):
+async def get_all_jobs_endpoint(db: AsyncDatabaseManager = Depends(get_async_db)):
     """Endpoint to get all jobs for the activity log."""
     try:
-        jobs = db.get_all_jobs()
+        jobs = await db.get_all_jobs()
         return jobs
     except Exception as e:
         logger.error(f"Failed to retrieve all jobs: {e}", exc_info=True)
@@ -305,10 +374,14 @@ async def get_all_jobs_endpoint(db: DatabaseManager = Depends(get_db)):
 
 
 @router.post("/jobs/{job_id}/cancel")
-async def cancel_job_endpoint(job_id: str, jm: JobManager = Depends(get_job_manager)):
+async def cancel_job_endpoint(
+    job_id: str,
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    jm: JobManager = Depends(get_job_manager),
+):
     """Endpoint to cancel a running job."""
     try:
-        success = jm.cancel_job(job_id)
+        success = await db.run(jm.cancel_job, job_id)
         if success:
             return {"message": "Job cancellation request sent."}
         else:
@@ -320,20 +393,24 @@ async def cancel_job_endpoint(job_id: str, jm: JobManager = Depends(get_job_mana
         raise HTTPException(status_code=500, detail="Failed to cancel job.")
 
 
+@router.get("/orchestrator/ai-metrics")
+async def get_ai_metrics_endpoint(agent: Optional[str] = None):
+    """Per-agent OpenAI call metrics (latency, retries, tokens, cost) since startup."""
+    return agent_metrics.snapshot(agent)
+
+
 @router.post(
     "/orchestrator/{opportunity_id}/run-full-auto-async", response_model=JobResponse
 )
 async def run_full_auto_async_endpoint(
     opportunity_id: int,
     request: AutoWorkflowRequest,  # ADD request body
-    db: DatabaseManager = Depends(
-        get_db
-    ),  # Ensure DatabaseManager is correctly imported and injected
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to start the full 'auto' workflow from validation to generation."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -354,7 +431,8 @@ async def run_full_auto_async_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        job_id = orchestrator.run_full_auto_workflow(
+        job_id = await db.run(
+            orchestrator.run_full_auto_workflow,
             opportunity_id, request.override_validation
         )  # Pass override flag
         return {
@@ -374,12 +452,12 @@ async def run_full_auto_async_endpoint(
 )
 async def clear_cache_and_analyze_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Clears API cache for the opportunity's keyword and starts a new analysis job."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -400,7 +478,7 @@ async def clear_cache_and_analyze_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        job_id = orchestrator.run_full_analysis(opportunity_id)
+        job_id = await db.run(orchestrator.run_full_analysis, opportunity_id)
         return {
             "job_id": job_id,
             "message": f"Cache cleared and analysis job {job_id} started.",
@@ -418,12 +496,12 @@ async def clear_cache_and_analyze_endpoint(
 )
 async def get_score_narrative_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to generate a human-readable narrative for the score breakdown."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="analysis")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
         if opportunity["client_id"] != orchestrator.client_id:
@@ -449,12 +527,12 @@ async def get_score_narrative_endpoint(
 )
 async def refresh_content_async_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to trigger a refresh of an existing opportunity's content."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -475,7 +553,7 @@ async def refresh_content_async_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        job_id = orchestrator.run_content_refresh_workflow(opportunity_id)
+        job_id = await db.run(orchestrator.run_content_refresh_workflow, opportunity_id)
         return {"job_id": job_id, "message": f"Content refresh job {job_id} started."}
     except Exception as e:
         logger.error(
@@ -495,12 +573,12 @@ class FeaturedImageRequest(BaseModel):
 async def generate_featured_image_async_endpoint(
     opportunity_id: int,
     request: FeaturedImageRequest,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Starts a job to generate a new featured image for an opportunity."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -510,7 +588,9 @@ async def generate_featured_image_async_endpoint(
                 detail="You do not have permission to access this opportunity.",
             )
 
-        job_id = orchestrator.regenerate_featured_image(opportunity_id, request.prompt)
+        job_id = await db.run(
+            orchestrator.regenerate_featured_image, opportunity_id, request.prompt
+        )
         return {
             "job_id": job_id,
             "message": f"Featured image generation job {job_id} started.",
@@ -529,12 +609,12 @@ async def generate_featured_image_async_endpoint(
 async def refine_content_endpoint(
     opportunity_id: int,
     request: RefineContentRequest,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to refine a snippet of HTML content using an AI command."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -555,10 +635,12 @@ async def refine_content_endpoint(
             },
         ]
 
-        refined_html, error = orchestrator.openai_client.call_chat_completion(
+        refined_html, error = await run_in_threadpool(
+            orchestrator.openai_client.call_chat_completion,
             messages=prompt_messages,
             model=orchestrator.client_cfg.get("default_model", "gpt-5-nano"),
             temperature=0.4,
+            agent="content_refinement.manual",
         )
 
         if error or not refined_html:
@@ -589,12 +671,12 @@ async def refine_content_endpoint(
 )
 async def generate_content_override(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
 ):
     """Endpoint to manually trigger content generation override"""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -614,7 +696,8 @@ async def generate_content_override(
                 status_code=403,
                 detail="You do not have permission to access this opportunity.",
             )
-        job_id = orchestrator.run_full_auto_workflow(
+        job_id = await db.run(
+            orchestrator.run_full_auto_workflow,
             opportunity_id, True
         )  # Run with override = True
         return {
@@ -635,7 +718,7 @@ async def generate_content_override(
 async def approve_analysis_endpoint(
     opportunity_id: int,
     request: ApproveAnalysisRequest,  # Use the new request body model
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
     jm: JobManager = Depends(get_job_manager),
     orchestrator: WorkflowOrchestrator = Depends(
         get_orchestrator
@@ -643,7 +726,7 @@ async def approve_analysis_endpoint(
 ):
     """Endpoint to approve the analysis and continue the workflow by starting content generation with optional overrides."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
@@ -668,7 +751,8 @@ async def approve_analysis_endpoint(
         # Convert Pydantic model to dict if it exists, else pass None
         overrides_dict = request.overrides.dict() if request.overrides else None
 
-        job_id = orchestrator.run_full_content_generation(
+        job_id = await db.run(
+            orchestrator.run_full_content_generation,
             opportunity_id, overrides=overrides_dict
         )
 
@@ -696,12 +780,12 @@ async def approve_analysis_endpoint(
 )
 async def reject_opportunity_endpoint(
     opportunity_id: int,
-    db: DatabaseManager = Depends(get_db),
+    db: AsyncDatabaseManager = Depends(get_async_db),
 ):
     """Endpoint to reject the opportunity and set status to 'rejected'"""
     try:
         # This is a direct status update, no job manager needed for rejection itself
-        db.update_opportunity_workflow_state(
+        await db.update_opportunity_workflow_state(
             opportunity_id,
             "rejected_by_user",
             "rejected",
@@ -726,18 +810,16 @@ class SocialMediaStatusUpdateRequest(BaseModel):
 async def update_social_media_status_endpoint(
     opportunity_id: int,
     request: SocialMediaStatusUpdateRequest,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(
-        get_orchestrator
-    ),  # For client_id auth
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Endpoint to update the status of social media posts (e.g., 'approved', 'rejected')."""
     try:
-        opportunity = db.get_opportunity_by_id(opportunity_id)
+        opportunity = await db.get_opportunity_by_id(opportunity_id, projection="summary")
         if not opportunity:
             raise HTTPException(status_code=404, detail="Opportunity not found.")
 
-        if opportunity["client_id"] != orchestrator.client_id:
+        if opportunity["client_id"] != current_client_id:
             raise HTTPException(
                 status_code=403,
                 detail="You do not have permission to access this opportunity.",
@@ -750,7 +832,7 @@ async def update_social_media_status_endpoint(
                 detail=f"Invalid status: {request.new_status}. Must be one of {valid_statuses}.",
             )
 
-        db.update_social_media_posts_status(opportunity_id, request.new_status)
+        await db.update_social_media_posts_status(opportunity_id, request.new_status)
         return {
             "message": "Social media posts status updated successfully.",
             "new_status": request.new_status,
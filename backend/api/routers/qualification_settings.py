@@ -3,9 +3,8 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
-from data_access.database_manager import DatabaseManager
-from ..dependencies import get_db, get_orchestrator
-from backend.pipeline import WorkflowOrchestrator
+from data_access.async_database import AsyncDatabaseManager
+from ..dependencies import get_async_db, get_authorized_client_id
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,19 +15,19 @@ logger = logging.getLogger(__name__)
 )
 async def get_qualification_settings_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Retrieves the qualification settings for a specific client.
     """
     logger.info(f"Received request for qualification settings for client {client_id}")
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    settings = db.get_qualification_settings(client_id)
+    settings = await db.get_qualification_settings(client_id)
     if not settings:
         raise HTTPException(status_code=404, detail="Qualification settings not found")
     return settings
@@ -40,8 +39,8 @@ async def get_qualification_settings_endpoint(
 async def update_qualification_settings_endpoint(
     client_id: str,
     settings: Dict[str, Any],
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Updates the qualification settings for a specific client.
@@ -49,10 +48,10 @@ async def update_qualification_settings_endpoint(
     logger.info(
         f"Received request to update qualification settings for client {client_id}"
     )
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    db.update_qualification_settings(client_id, settings)
+    await db.update_qualification_settings(client_id, settings)
     return {"message": "Qualification settings updated successfully."}
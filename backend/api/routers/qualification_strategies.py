@@ -3,9 +3,8 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any, List
-from data_access.database_manager import DatabaseManager
-from ..dependencies import get_db, get_orchestrator
-from backend.pipeline import WorkflowOrchestrator
+from data_access.async_database import AsyncDatabaseManager
+from ..dependencies import get_async_db, get_authorized_client_id
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -16,19 +15,19 @@ logger = logging.getLogger(__name__)
 )
 async def get_qualification_strategies_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Retrieves all qualification strategies for a specific client.
     """
     logger.info(f"Received request for qualification strategies for client {client_id}")
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    strategies = db.get_qualification_strategies(client_id)
+    strategies = await db.get_qualification_strategies(client_id)
     return strategies
 
 
@@ -38,8 +37,8 @@ async def get_qualification_strategies_endpoint(
 async def create_qualification_strategy_endpoint(
     client_id: str,
     strategy: Dict[str, Any],
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Creates a new qualification strategy for a specific client.
@@ -47,12 +46,12 @@ async def create_qualification_strategy_endpoint(
     logger.info(
         f"Received request to create qualification strategy for client {client_id}"
     )
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
-    strategy_id = db.create_qualification_strategy(client_id, strategy)
+    strategy_id = await db.create_qualification_strategy(client_id, strategy)
     return {"id": strategy_id}
 
 
@@ -60,46 +59,46 @@ async def create_qualification_strategy_endpoint(
 async def update_qualification_strategy_endpoint(
     strategy_id: int,
     strategy: Dict[str, Any],
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Updates a qualification strategy.
     """
     logger.info(f"Received request to update qualification strategy {strategy_id}")
     # Auth check
-    strat_to_update = db.get_qualification_strategy_by_id(strategy_id)
+    strat_to_update = await db.get_qualification_strategy_by_id(strategy_id)
     if not strat_to_update:
         raise HTTPException(status_code=404, detail="Strategy not found.")
-    if strat_to_update["client_id"] != orchestrator.client_id:
+    if strat_to_update["client_id"] != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to modify this resource.",
         )
 
-    db.update_qualification_strategy(strategy_id, strategy)
+    await db.update_qualification_strategy(strategy_id, strategy)
     return {"message": "Qualification strategy updated successfully."}
 
 
 @router.delete("/qualification-strategies/{strategy_id}", response_model=Dict[str, str])
 async def delete_qualification_strategy_endpoint(
     strategy_id: int,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """
     Deletes a qualification strategy.
     """
     logger.info(f"Received request to delete qualification strategy {strategy_id}")
     # Auth check
-    strat_to_delete = db.get_qualification_strategy_by_id(strategy_id)
+    strat_to_delete = await db.get_qualification_strategy_by_id(strategy_id)
     if not strat_to_delete:
         raise HTTPException(status_code=404, detail="Strategy not found.")
-    if strat_to_delete["client_id"] != orchestrator.client_id:
+    if strat_to_delete["client_id"] != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to delete this resource.",
         )
 
-    db.delete_qualification_strategy(strategy_id)
+    await db.delete_qualification_strategy(strategy_id)
     return {"message": "Qualification strategy deleted successfully."}
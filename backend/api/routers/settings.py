@@ -2,9 +2,8 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Dict, Any
-from data_access.database_manager import DatabaseManager
-from ..dependencies import get_db, get_orchestrator
-from backend.pipeline import WorkflowOrchestrator
+from data_access.async_database import AsyncDatabaseManager
+from ..dependencies import get_async_db, get_authorized_client_id
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -12,17 +11,17 @@ logger = logging.getLogger(__name__)
 @router.get("/settings/{client_id}", response_model=Dict[str, Any])
 async def get_settings_endpoint(
     client_id: str,
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Endpoint for fetching all client-specific settings."""
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
     try:
-        settings = db.get_client_settings(client_id)
+        settings = await db.get_client_settings(client_id)
         if not settings:
             raise HTTPException(status_code=404, detail="Settings not found for this client.")
         return settings
@@ -34,17 +33,17 @@ async def get_settings_endpoint(
 async def update_settings_endpoint(
     client_id: str,
     settings: Dict[str, Any],
-    db: DatabaseManager = Depends(get_db),
-    orchestrator: WorkflowOrchestrator = Depends(get_orchestrator),
+    db: AsyncDatabaseManager = Depends(get_async_db),
+    current_client_id: str = Depends(get_authorized_client_id),
 ):
     """Endpoint for updating client-specific settings."""
-    if client_id != orchestrator.client_id:
+    if client_id != current_client_id:
         raise HTTPException(
             status_code=403,
             detail="You do not have permission to access this client's resources.",
         )
     try:
-        db.update_client_settings(client_id, settings)
+        await db.update_client_settings(client_id, settings)
         return {"message": "Settings updated successfully."}
     except Exception as e:
         logger.error(f"Failed to update settings for client {client_id}: {e}", exc_info=True)
@@ -0,0 +1,39 @@
+# api/stats_reconciler.py
+import logging
+import threading
+
+from data_access.database_manager import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+
+class ClientStatsReconciler:
+    """
+    Background thread that periodically recomputes the trigger-maintained
+    client_stats rows from the base tables, correcting any drift (e.g. from
+    writes made outside the migrated schema or manual edits).
+    """
+
+    def __init__(self, db_manager: DatabaseManager, interval_minutes: int):
+        self.db_manager = db_manager
+        self.interval_seconds = max(0, interval_minutes) * 60
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.interval_seconds <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="client-stats-reconciler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.db_manager.reconcile_client_stats()
+            except Exception as e:
+                logger.error(f"Client stats reconciliation failed: {e}", exc_info=True)
@@ -27,6 +27,15 @@ class ConfigManager:
         "num_unique_angles": int,
         "max_initial_serp_urls_to_analyze": int,
         "people_also_ask_click_depth": int,
+        "serp_snapshot_max_age_days": int,
+        "competitor_page_max_age_days": int,
+        "js_domain_min_tier1_attempts": int,
+        "js_domain_max_tier1_success_rate": float,
+        "bulk_analysis_serp_workers": int,
+        "bulk_analysis_crawl_workers": int,
+        "bulk_analysis_synthesis_workers": int,
+        "bulk_analysis_persist_workers": int,
+        "bulk_analysis_queue_size": int,
         "min_search_volume": int,
         "max_keyword_difficulty": int,
         "num_in_article_images": int,
@@ -57,6 +66,19 @@ class ConfigManager:
         "max_avg_lcp_time": int,  # NEW
         "high_value_sv_override_threshold": int,
         "overlay_font_size": int,
+        "image_variant_quality": int,
+        "openai_requests_per_minute": int,
+        "openai_tokens_per_minute": int,
+        "openai_request_timeout": int,
+        "openai_cache_ttl_days": int,
+        "openai_cache_memory_items": int,
+        "openai_batch_min_size": int,
+        "client_stats_reconcile_minutes": int,
+        "db_executor_workers": int,
+        "openai_batch_poll_seconds": int,
+        "openai_batch_timeout_seconds": int,
+        "openai_batch_cost_multiplier": float,
+        "openai_batch_enabled": bool,
         # Floats
         "informational_score": float,
         "commercial_score": float,
@@ -109,6 +131,7 @@ class ConfigManager:
         "onpage_validate_micromarkup": bool,
         "discovery_replace_with_core_keyword": bool,
         "discovery_ignore_synonyms": bool,
+        "compact_score_breakdown": bool,
         "enable_automated_internal_linking": bool,
         "generate_toc": bool,
         "overlay_text_enabled": bool,
@@ -135,6 +158,8 @@ class ConfigManager:
         "high_value_categories": list,
         "hostile_serp_features": list,
         "final_validation_non_blog_domains": list,
+        "image_variant_widths": list,
+        "openai_cache_agents": list,
         # Weights
         "ease_of_ranking_weight": float,
         "traffic_potential_weight": float,
@@ -153,6 +178,10 @@ class ConfigManager:
         "overlay_text_color": str,
         "overlay_background_color": str,
         "overlay_position": str,
+        "image_store_dir": str,
+        "openai_batch_completion_window": str,
+        "openai_base_url": str,
+        "image_variant_format": str,
         "closely_variants": bool,
         "max_cpc_filter": float,
         "discovery_order_by_field": str,
@@ -175,6 +204,7 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found at: {settings_path}")
         self.config_parser.read(settings_path)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._global_settings_listeners: List[Any] = []
         self._configure_logging()
         self._global_settings = self._load_and_validate_global()
 
@@ -382,3 +412,9 @@ class ConfigManager:
 
         self._global_settings = self._load_and_validate_global()
         self.logger.info("Global settings updated and reloaded from settings.ini.")
+        for callback in self._global_settings_listeners:
+            callback()
+
+    def add_global_settings_listener(self, callback):
+        """Registers `callback()`, called after global settings are reloaded."""
+        self._global_settings_listeners.append(callback)
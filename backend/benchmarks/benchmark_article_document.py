@@ -0,0 +1,114 @@
+"""
+Benchmark: HTML parsing work for one article through the audit/refinement loop
+and final formatting, parsing per consumer with html.parser (as before) vs. a
+single shared ArticleDocument per version, using lxml when it is installed.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.benchmark_article_document
+"""
+import random
+import time
+
+from backend.agents.content_auditor import ContentAuditor
+from backend.agents.html_formatter import HtmlFormatter
+from backend.core import article_document
+from backend.core.article_document import ArticleDocument
+
+AUDIT_ATTEMPTS = 3  # MAX_REFINEMENT_ATTEMPTS in the content orchestrator
+WORDS = (
+    "garden soil compost water seedling tomato harvest season planting mulch "
+    "raised bed fertilizer sunlight pruning pest watering root growth yield "
+    "organic nutrient climate frost trellis irrigation the a of and to with"
+).split()
+
+
+def build_article(word_count, seed=0):
+    """Blog-style HTML: H2 sections of paragraphs, lists and links."""
+    rng = random.Random(seed)
+    parts, written, section = [], 0, 0
+    while written < word_count:
+        section += 1
+        parts.append(f"<h2>How to handle step {section} of the garden plan</h2>")
+        for i in range(4):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(40, 90))]
+            if i % 2:
+                words[5] = f'<a href="/guides/{words[5]}">{words[5]}</a>'
+            parts.append(f"<p>{' '.join(words).capitalize()}.</p>")
+            written += len(words)
+        parts.append(
+            "<ol>"
+            + "".join(f"<li>Do task {i} for {rng.choice(WORDS)}</li>" for i in range(5))
+            + "</ol>"
+        )
+        written += 25
+    return "\n".join(parts)
+
+
+def link_suggestions(html, count=10):
+    document = ArticleDocument(html)
+    suggestions = []
+    for p_tag in document.root.find_all("p")[: count * 4 : 4]:
+        words = p_tag.get_text().split()
+        if len(words) > 3:
+            suggestions.append(
+                {
+                    "anchor_text": " ".join(words[1:3]),
+                    "url": f"/internal/{len(suggestions)}",
+                    "context_paragraph_text": " ".join(words[:3]),
+                }
+            )
+    return suggestions
+
+
+def per_consumer(auditor, formatter, opportunity, links):
+    html = opportunity["ai_content"]["article_body_html"]
+    for _ in range(AUDIT_ATTEMPTS):
+        ArticleDocument(html).get_text()
+        auditor._check_html_publish_readiness(ArticleDocument(html))
+    return formatter.format_final_package(opportunity, links)
+
+
+def shared(auditor, formatter, opportunity, links):
+    html = opportunity["ai_content"]["article_body_html"]
+    for _ in range(AUDIT_ATTEMPTS):
+        document = ArticleDocument(html)
+        document.get_text()
+        auditor._check_html_publish_readiness(document)
+    return formatter.format_final_package(opportunity, links, document=document)
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    auditor, formatter = ContentAuditor(), HtmlFormatter()
+    fastest = article_document.HTML_PARSER
+    print(f"{AUDIT_ATTEMPTS} audit passes + final formatting; shared parser: {fastest}")
+    for word_count in (3000, 4000, 5000):
+        html = build_article(word_count)
+        opportunity = {
+            "keyword": "garden plan",
+            "ai_content": {"article_body_html": html},
+            "client_cfg": {"target_domain": "example.com"},
+        }
+        links = link_suggestions(html)
+
+        article_document.HTML_PARSER = "html.parser"
+        before = best_of(lambda: per_consumer(auditor, formatter, opportunity, links))
+        article_document.HTML_PARSER = fastest
+        after = best_of(lambda: shared(auditor, formatter, opportunity, links))
+        print(
+            f"  {word_count} words ({len(html) / 1000:.0f} KB): "
+            f"{before * 1000:8.1f} ms -> {after * 1000:8.1f} ms  ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
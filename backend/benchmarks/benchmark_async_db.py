@@ -0,0 +1,115 @@
+"""
+Load test: fast requests issued while slow SQLite queries are running, against
+async endpoints that call DatabaseManager directly (as the routers did) vs.
+endpoints that await the AsyncDatabaseManager facade.
+
+Run from the repository root (needs fastapi and httpx):
+
+    python -m backend.benchmarks.benchmark_async_db
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from backend.data_access.async_database import AsyncDatabaseManager
+from backend.data_access.database_manager import DatabaseManager
+
+SLOW_REQUESTS = 4
+FAST_REQUESTS = 40
+SLOW_QUERY_ROWS = 1_000_000  # A few hundred ms of SQLite work.
+
+
+def slow_query(db_manager: DatabaseManager) -> int:
+    """A CPU-bound query standing in for a slow dashboard aggregate."""
+    row = (
+        db_manager._get_conn()
+        .execute(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+            "SELECT count(*) FROM n",
+            (SLOW_QUERY_ROWS,),
+        )
+        .fetchone()
+    )
+    return row[0]
+
+
+def build_app(db_manager: DatabaseManager, async_db: AsyncDatabaseManager, offload: bool):
+    app = FastAPI()
+
+    if offload:
+
+        @app.get("/slow")
+        async def slow():
+            return {"count": await async_db.run(slow_query, db_manager)}
+
+        @app.get("/fast")
+        async def fast():
+            return {"clients": await async_db.get_clients()}
+
+    else:
+
+        @app.get("/slow")
+        async def slow():
+            return {"count": slow_query(db_manager)}
+
+        @app.get("/fast")
+        async def fast():
+            return {"clients": db_manager.get_clients()}
+
+    return app
+
+
+async def load(app: FastAPI):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        started = time.perf_counter()
+
+        async def timed(path: str, delay: float) -> float:
+            # Latency is measured from when the request was due, so time spent
+            # waiting for a blocked event loop to wake the client counts too.
+            await asyncio.sleep(delay)
+            response = await client.get(path)
+            response.raise_for_status()
+            return time.perf_counter() - (started + delay)
+
+        slow = [timed("/slow", 0) for _ in range(SLOW_REQUESTS)]
+        # Fast requests arrive spread over the time the slow ones are running.
+        fast = [timed("/fast", 0.01 * i) for i in range(FAST_REQUESTS)]
+        results = await asyncio.gather(*slow, *fast)
+        wall = time.perf_counter() - started
+    fast_latencies = sorted(results[SLOW_REQUESTS:])
+    return {
+        "wall": wall,
+        "fast_p50": statistics.median(fast_latencies),
+        "fast_p95": fast_latencies[int(len(fast_latencies) * 0.95) - 1],
+        "fast_max": fast_latencies[-1],
+    }
+
+
+def main():
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    db_manager = DatabaseManager(db_path=db_path)
+    db_manager.initialize()
+    async_db = AsyncDatabaseManager(db_manager, max_workers=8)
+
+    print(
+        f"{SLOW_REQUESTS} slow + {FAST_REQUESTS} fast concurrent requests "
+        f"(slow query ~{SLOW_QUERY_ROWS:,} rows)"
+    )
+    for label, offload in (("blocking db calls", False), ("async facade", True)):
+        stats = asyncio.run(load(build_app(db_manager, async_db, offload)))
+        print(
+            f"  {label:18s} wall {stats['wall'] * 1000:7.0f} ms   fast p50 "
+            f"{stats['fast_p50'] * 1000:7.1f} ms   p95 {stats['fast_p95'] * 1000:7.1f} ms"
+            f"   max {stats['fast_max'] * 1000:7.1f} ms"
+        )
+    async_db.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: GET /opportunities/{id} for a full opportunity (opportunity_3.json)
+as a plain 200, a gzip-compressed 200 and a conditional GET answered with 304.
+Also checks that writing to the opportunity changes its ETag.
+
+Run from the repository root (needs fastapi and httpx):
+
+    python -m backend.benchmarks.benchmark_conditional_get
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The routers use the backend-relative imports api/main.py sets up.
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+from backend.api import dependencies  # noqa: E402
+from backend.api.main import GZIP_COMPRESS_LEVEL, GZIP_MINIMUM_SIZE  # noqa: E402
+from backend.api.routers import opportunities  # noqa: E402
+from backend.data_access.async_database import AsyncDatabaseManager  # noqa: E402
+from backend.data_access.database_manager import DatabaseManager  # noqa: E402
+
+SAMPLE_PATH = os.path.join(ROOT, "opportunity_3.json")
+CLIENT_ID = "bench"
+REPEAT = 50
+
+
+def seed(db_manager: DatabaseManager) -> int:
+    with open(SAMPLE_PATH) as f:
+        sample = json.load(f)
+    db_manager.add_client(CLIENT_ID, "Benchmark", {})
+    opportunity_id = db_manager.add_opportunity(CLIENT_ID, sample)
+    db_manager.update_opportunity_full_data(opportunity_id, sample)
+    db_manager.update_opportunity_blueprint(
+        opportunity_id, sample.get("blueprint"), sample.get("slug")
+    )
+    return opportunity_id
+
+
+def build_app(async_db: AsyncDatabaseManager) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESS_LEVEL
+    )
+    app.include_router(opportunities.router)
+    app.dependency_overrides[dependencies.get_async_db] = lambda: async_db
+    app.dependency_overrides[dependencies.get_authorized_client_id] = lambda: CLIENT_ID
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, headers: dict):
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        best = min(best, time.perf_counter() - started)
+    # Bytes on the wire: httpx decodes gzip, so read the raw stream length.
+    async with client.stream("GET", path, headers=headers) as raw:
+        wire = sum([len(chunk) async for chunk in raw.aiter_raw()])
+    return response, wire, best
+
+
+async def run(db_manager: DatabaseManager, async_db: AsyncDatabaseManager, opportunity_id: int):
+    transport = httpx.ASGITransport(app=build_app(async_db))
+    path = f"/opportunities/{opportunity_id}"
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        plain, plain_bytes, plain_time = await measure(
+            client, path, {"accept-encoding": "identity"}
+        )
+        etag = plain.headers["etag"]
+        gzipped, gzip_bytes, gzip_time = await measure(
+            client, path, {"accept-encoding": "gzip"}
+        )
+        cached, cached_bytes, cached_time = await measure(
+            client, path, {"accept-encoding": "gzip", "if-none-match": etag}
+        )
+        assert gzipped.headers.get("content-encoding") == "gzip"
+        assert cached.status_code == 304 and cached.headers["etag"] == etag
+
+        await async_db.update_opportunity_status(opportunity_id, "analyzed")
+        changed = await client.get(path, headers={"if-none-match": etag})
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+
+    print(f"GET {path} (ETag {etag}), best of {REPEAT}")
+    for label, status, size, seconds in (
+        ("200 identity", plain.status_code, plain_bytes, plain_time),
+        ("200 gzip", gzipped.status_code, gzip_bytes, gzip_time),
+        ("304 If-None-Match", cached.status_code, cached_bytes, cached_time),
+    ):
+        print(f"  {label:18s} {status}  {size:8,d} bytes  {seconds * 1000:7.2f} ms")
+    print(f"  after a status update: 200 with ETag {changed.headers['etag']}")
+
+
+def main():
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    db_manager = DatabaseManager(db_path=db_path)
+    db_manager.initialize()
+    async_db = AsyncDatabaseManager(db_manager, max_workers=2)
+    opportunity_id = seed(db_manager)
+    asyncio.run(run(db_manager, async_db, opportunity_id))
+    async_db.shutdown()
+
+
+if __name__ == "__main__":
+    main()
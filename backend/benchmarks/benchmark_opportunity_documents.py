@@ -0,0 +1,151 @@
+"""
+Benchmark: list queries and main-table size with large opportunity documents
+stored inline on `opportunities` vs. compressed in `opportunity_documents`.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.benchmark_opportunity_documents [rows]
+"""
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from backend.data_access import queries
+from backend.data_access.document_store import DOCUMENT_COLUMNS, encode_document
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAMPLE_PATH = os.path.join(ROOT, "opportunity_3.json")
+MIGRATIONS_DIR = os.path.join(ROOT, "backend", "data_access", "migrations")
+
+LIST_COLUMNS = (
+    "id, keyword, status, date_added, strategic_score, cpc, competition, "
+    "main_intent, blog_qualification_status, cluster_name, keyword_info, "
+    "keyword_properties, score_breakdown"
+)
+LIST_QUERIES = {
+    "page by score": f"SELECT {LIST_COLUMNS} FROM opportunities WHERE client_id = ? "
+    "ORDER BY strategic_score DESC LIMIT 50 OFFSET 500",
+    "page by search volume": f"SELECT {LIST_COLUMNS} FROM opportunities WHERE client_id = ? "
+    "ORDER BY JSON_EXTRACT(keyword_info, '$.search_volume') DESC LIMIT 50",
+    "count by status": "SELECT status, COUNT(*) FROM opportunities WHERE client_id = ? "
+    "GROUP BY status",
+}
+
+
+def build_db(sample, rows, side_table):
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        queries.CREATE_OPPORTUNITIES_TABLE
+        + queries.CREATE_CLIENTS_TABLE
+        + queries.CREATE_DISCOVERY_RUNS_TABLE
+    )
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        with open(os.path.join(MIGRATIONS_DIR, filename)) as f:
+            try:
+                conn.executescript(f.read())
+            except sqlite3.OperationalError:
+                pass  # Same tolerance as the migration runner for re-adds.
+
+    documents = {
+        "full_data": json.dumps(sample),
+        "blueprint_data": json.dumps(sample.get("blueprint")),
+        "ai_content_json": json.dumps(sample.get("ai_content")),
+        "final_package_json": json.dumps(sample.get("final_package_json")),
+        "wordpress_payload_json": json.dumps(sample.get("wordpress_payload_json")),
+        "serp_overview": json.dumps(sample.get("serp_overview")),
+    }
+    encoded = {doc_type: encode_document(text) for doc_type, text in documents.items()}
+    small = {
+        "keyword_info": json.dumps(sample.get("keyword_info")),
+        "keyword_properties": json.dumps(sample.get("keyword_properties")),
+        "score_breakdown": json.dumps(sample.get("score_breakdown")),
+    }
+    statuses = ["validated", "analyzed", "generated", "rejected"]
+
+    with conn:
+        for i in range(rows):
+            inline = {
+                col: (documents[col] if not side_table else None)
+                for col in DOCUMENT_COLUMNS
+            }
+            if side_table:
+                inline["full_data"] = ""
+            cursor = conn.execute(
+                f"""INSERT INTO opportunities (keyword, client_id, status, date_added,
+                    strategic_score, cpc, keyword_info, keyword_properties, score_breakdown,
+                    {', '.join(DOCUMENT_COLUMNS)})
+                VALUES (?, 'bench', ?, '2024-01-01', ?, ?, ?, ?, ?,
+                    {', '.join('?' for _ in DOCUMENT_COLUMNS)})""",
+                (
+                    f"{sample['keyword']} {i}",
+                    statuses[i % len(statuses)],
+                    (i * 37) % 100,
+                    sample.get("cpc"),
+                    small["keyword_info"],
+                    small["keyword_properties"],
+                    small["score_breakdown"],
+                    *(inline[col] for col in DOCUMENT_COLUMNS),
+                ),
+            )
+            if side_table:
+                for doc_type, (codec, payload) in encoded.items():
+                    conn.execute(
+                        queries.UPSERT_OPPORTUNITY_DOCUMENT,
+                        (
+                            cursor.lastrowid,
+                            doc_type,
+                            codec,
+                            payload,
+                            len(documents[doc_type]),
+                            "2024-01-01",
+                        ),
+                    )
+    return conn
+
+
+def table_bytes(conn, name):
+    return conn.execute(
+        "SELECT SUM(pgsize) FROM dbstat WHERE name = ?", (name,)
+    ).fetchone()[0] or 0
+
+
+def time_query(conn, sql, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(sql, ("bench",)).fetchall()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with open(SAMPLE_PATH) as f:
+        sample = json.load(f)
+
+    results = {}
+    for label, side_table in (("inline", False), ("side table", True)):
+        conn = build_db(sample, rows, side_table)
+        results[label] = {
+            "opportunities bytes": table_bytes(conn, "opportunities"),
+            "opportunity_documents bytes": table_bytes(conn, "opportunity_documents"),
+            **{name: time_query(conn, sql) for name, sql in LIST_QUERIES.items()},
+        }
+        conn.close()
+
+    print(f"{rows} opportunities")
+    for metric in results["inline"]:
+        before, after = results["inline"][metric], results["side table"][metric]
+        if metric.endswith("bytes"):
+            print(f"  {metric:30} {before / 1e6:10.2f} MB -> {after / 1e6:10.2f} MB")
+        else:
+            print(
+                f"  {metric:30} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms"
+                f"  ({before / after:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: core.serializer with the standard library vs. orjson on
+opportunity_3.json, for the raw encode/decode, a DatabaseManager document
+round trip and rendering the API response. Also checks that both backends
+decode to the same values.
+
+Run from the repository root (needs orjson):
+
+    python -m backend.benchmarks.benchmark_serializer
+"""
+import json
+import os
+import tempfile
+import timeit
+
+from backend.api.responses import SerializerJSONResponse
+from backend.core import serializer
+from backend.data_access.database_manager import DatabaseManager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAMPLE_PATH = os.path.join(ROOT, "opportunity_3.json")
+CLIENT_ID = "bench"
+NUMBER = 50
+
+
+def best_ms(func) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER * 1000
+
+
+def main():
+    with open(SAMPLE_PATH) as f:
+        sample = json.load(f)
+    text = json.dumps(sample)
+
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    db_manager = DatabaseManager(db_path=db_path)
+    db_manager.initialize()
+    db_manager.add_client(CLIENT_ID, "Benchmark", {})
+    opportunity_id = db_manager.add_opportunity(CLIENT_ID, sample)
+
+    def db_round_trip():
+        db_manager.update_opportunity_full_data(opportunity_id, sample)
+        db_manager.get_opportunity_document(opportunity_id, "full_data")
+
+    cases = {
+        "dumps": lambda: serializer.dumps(sample),
+        "loads": lambda: serializer.loads(text),
+        "db write + read": db_round_trip,
+        "api response": lambda: SerializerJSONResponse(sample),
+    }
+
+    print(f"opportunity_3.json ({len(text):,} bytes as JSON), best of 5 x {NUMBER}")
+    results = {}
+    for name in ("json", "orjson"):
+        serializer.use_backend(name)
+        decoded = serializer.loads(serializer.dumps(sample))
+        assert decoded == json.loads(text), f"{name} round trip differs"
+        results[name] = {case: best_ms(func) for case, func in cases.items()}
+
+    print(f"  {'':16s} {'json':>9s} {'orjson':>9s}")
+    for case in cases:
+        stdlib, fast = results["json"][case], results["orjson"][case]
+        print(f"  {case:16s} {stdlib:7.3f}ms {fast:7.3f}ms  {stdlib / fast:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
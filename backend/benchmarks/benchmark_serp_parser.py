@@ -0,0 +1,147 @@
+"""
+Benchmark: FullSerpAnalyzer.parse_serp single-pass parsing and memoized
+PageClassifier vs. a cold classifier and separate per-analyzer passes. As in
+production, the memoized case builds a new analyzer for every SERP; the
+classification memo is shared at module level.
+
+The SERP is rebuilt in DataForSEO's item format from the serp_overview saved
+in opportunity_3.json, then varied per keyword while reusing the same
+competitor URLs, as real SERPs for a client's keywords do.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.benchmark_serp_parser [serps]
+"""
+import json
+import os
+import sys
+import time
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+from core import page_classifier  # noqa: E402
+from core.serp_analyzer import FullSerpAnalyzer  # noqa: E402
+
+SAMPLE_PATH = os.path.join(os.path.dirname(BACKEND), "opportunity_3.json")
+CONFIG = {
+    "page_classification": {
+        "forum_domains": ["reddit.com", "quora.com", "stackoverflow.com"],
+        "ecommerce_domains": ["amazon.com", "ebay.com", "walmart.com", "etsy.com"],
+        "news_domains": ["nytimes.com", "bbc.com", "cnn.com", "theguardian.com"],
+        "blog_url_patterns": ["/blog/", "/post/", "/article/", r"/\d{4}/\d{2}/"],
+        "forum_url_patterns": ["/thread/", "/forum/", "/discussion/", "/q/", "/questions/"],
+    },
+    "disqualification_rules": {},
+}
+
+
+def build_serp(overview, variant):
+    """DataForSEO-style SERP result from a saved serp_overview."""
+    items = []
+    rank = 1
+    if overview.get("featured_snippet_content"):
+        items.append(
+            {
+                "type": "featured_snippet",
+                "rank_group": 1,
+                "rank_absolute": rank,
+                "description": overview["featured_snippet_content"],
+                "rectangle": {"x": 0, "y": 150, "width": 600, "height": 200},
+            }
+        )
+        rank += 1
+    items.append(
+        {
+            "type": "people_also_ask",
+            "rank_group": 1,
+            "rank_absolute": rank,
+            "items": [{"title": q} for q in overview.get("paa_questions") or []],
+        }
+    )
+    rank += 1
+    results = overview.get("top_organic_results") or []
+    for i, result in enumerate(results[variant % max(len(results), 1) :] + results):
+        items.append(
+            {
+                "type": "organic",
+                "rank_group": i + 1,
+                "rank_absolute": rank,
+                "url": result.get("url"),
+                "domain": result.get("domain"),
+                "title": result.get("title"),
+                "description": result.get("description"),
+                "rectangle": {"x": 0, "y": 300 + 120 * i, "width": 600, "height": 110},
+            }
+        )
+        rank += 1
+    items.append(
+        {
+            "type": "related_searches",
+            "rank_group": 1,
+            "rank_absolute": rank,
+            "items": overview.get("related_searches") or [],
+        }
+    )
+    return {
+        "keyword": f"keyword {variant}",
+        "item_types": sorted({item["type"] for item in items}),
+        "items": items,
+    }
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with open(SAMPLE_PATH) as f:
+        overview = json.load(f)["blueprint"]["serp_overview"]
+    serps = [build_serp(overview, i) for i in range(count)]
+    analyzer = FullSerpAnalyzer(client=None, config=CONFIG)
+
+    def cold_classifier():
+        for serp in serps:
+            page_classifier._path_cache.clear()
+            FullSerpAnalyzer(client=None, config=CONFIG).parse_serp(serp)
+
+    def warm_classifier():
+        for serp in serps:
+            FullSerpAnalyzer(client=None, config=CONFIG).parse_serp(serp)
+
+    def separate_passes():
+        for serp in serps:
+            for sub_analyzer in analyzer.item_analyzers:
+                sub_analyzer.analyze(serp)
+
+    def single_pass():
+        for serp in serps:
+            states = [(a, a.start(serp)) for a in analyzer.item_analyzers]
+            for item in serp["items"]:
+                for index in analyzer._observers_by_type.get(
+                    item.get("type"), analyzer._untyped_observers
+                ):
+                    sub_analyzer, state = states[index]
+                    sub_analyzer.observe(state, item)
+            for sub_analyzer, state in states:
+                sub_analyzer.finish(state)
+
+    results = [
+        ("parse_serp, cold classifier", cold_classifier),
+        ("parse_serp, memoized classifier", warm_classifier),
+        ("sub-analyzers, separate passes", separate_passes),
+        ("sub-analyzers, one shared pass", single_pass),
+    ]
+    print(f"{count} SERPs, {len(serps[0]['items'])} items each")
+    for label, fn in results:
+        print(f"  {label:34} {best_of(fn) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
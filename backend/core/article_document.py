@@ -0,0 +1,62 @@
+# core/article_document.py
+"""
+A parsed article body shared by the content auditor and the HTML formatter,
+so one version of an article is parsed once, mutated in place (internal
+links, TOC) and serialized once when the final package is built.
+"""
+import logging
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
+
+logger = logging.getLogger(__name__)
+
+# lxml (in requirements.txt) is several times faster than html.parser on long
+# articles. Fall back to the stdlib parser if it is missing, and say so once.
+try:
+    BeautifulSoup("", "lxml")
+    HTML_PARSER = "lxml"
+except FeatureNotFound:
+    HTML_PARSER = "html.parser"
+    logger.warning(
+        "lxml is not installed; ArticleDocument falls back to the slower "
+        "html.parser."
+    )
+
+
+class ArticleDocument:
+    """
+    The article body parsed under a single <div> root. `source` is the HTML
+    it was parsed from; `root` is what callers query and mutate.
+    """
+
+    def __init__(self, html: Optional[str]):
+        self.source = html or ""
+        self.soup = BeautifulSoup(f"<div>{self.source}</div>", HTML_PARSER)
+        self.root = self.soup.div
+
+    def get_text(self) -> str:
+        """Visible text of the article, words separated by single spaces."""
+        return self.root.get_text(separator=" ", strip=True)
+
+    def text_blocks(self) -> List[str]:
+        """
+        Text of each top-level element (paragraph, heading, list...). Joined
+        with single spaces they give exactly get_text().
+        """
+        blocks = []
+        for child in self.root.children:
+            if isinstance(child, Tag):
+                text = child.get_text(separator=" ", strip=True)
+            else:
+                text = child.strip()
+            if text:
+                blocks.append(text)
+        return blocks
+
+    def new_tag(self, name: str, **attrs):
+        return self.soup.new_tag(name, **attrs)
+
+    def to_html(self) -> str:
+        """Serializes the (possibly mutated) article, wrapped in its root <div>."""
+        return str(self.root)
@@ -0,0 +1,76 @@
+# core/cost_ledger.py
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional
+
+
+class CostLedger:
+    """
+    Thread-safe accumulator of API spend, keyed by job ID.
+
+    The JobManager binds the running job to its worker thread, so any client
+    call made on that thread (directly or from an agent) is charged to the job
+    without the cost having to be threaded through every return value.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._local = threading.local()
+
+    @contextmanager
+    def bind(self, job_id: str):
+        """Charges every call made on the current thread to `job_id`."""
+        previous = getattr(self._local, "job_id", None)
+        self._local.job_id = job_id
+        try:
+            yield
+        finally:
+            self._local.job_id = previous
+
+    @property
+    def current_job_id(self) -> Optional[str]:
+        return getattr(self._local, "job_id", None)
+
+    def record(
+        self,
+        service: str,
+        cost: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        job_id: Optional[str] = None,
+    ):
+        job_id = job_id or self.current_job_id
+        if not job_id:
+            return
+        with self._lock:
+            entry = self._entries.setdefault(
+                job_id,
+                {
+                    "total_cost": 0.0,
+                    "calls": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "by_service": {},
+                },
+            )
+            entry["total_cost"] += cost
+            entry["calls"] += 1
+            entry["prompt_tokens"] += prompt_tokens
+            entry["completion_tokens"] += completion_tokens
+            entry["by_service"][service] = entry["by_service"].get(service, 0.0) + cost
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if not entry:
+                return {}
+            return {**entry, "by_service": dict(entry["by_service"])}
+
+    def pop(self, job_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._entries.pop(job_id, None) or {}
+
+
+# Process-wide ledger shared by the JobManager and the API clients.
+cost_ledger = CostLedger()
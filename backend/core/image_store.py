@@ -0,0 +1,159 @@
+# core/image_store.py
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import uuid
+from typing import Dict, Any, List, Optional
+
+from PIL import Image
+
+from backend.external_apis.pexels_client import download_image_from_url
+
+# Content-addressed files are named after the SHA-256 of their bytes (plus an
+# optional suffix for derived files), so a name never changes meaning.
+CONTENT_ADDRESSED_NAME = re.compile(r"^([0-9a-f]{64})(-[0-9a-z-]+)?\.[a-z]+$")
+
+# A single process-wide lock: several ImageGenerator instances (one per
+# orchestrator) can share the same directory and index file.
+_store_lock = threading.Lock()
+
+
+class ImageStore:
+    """
+    Content-addressed storage for sourced images.
+
+    Originals are stored once under `<sha256>.jpeg`, regardless of how many
+    opportunities reference them. Derived files (text overlays, resized
+    variants) are keyed by the original's hash plus their inputs, so they are
+    rendered once and reused on every subsequent request.
+    """
+
+    INDEX_FILE_NAME = "source_index.json"
+
+    def __init__(self, base_dir: str, config: Optional[Dict[str, Any]] = None):
+        self.base_dir = base_dir
+        self.config = config or {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+        os.makedirs(self.base_dir, exist_ok=True)
+        self._index_path = os.path.join(self.base_dir, self.INDEX_FILE_NAME)
+
+        widths = self.config.get("image_variant_widths") or [480, 768, 1200]
+        self.variant_widths = sorted({int(w) for w in widths if str(w).strip()})
+        self.variant_format = str(self.config.get("image_variant_format", "WEBP")).upper()
+        self.variant_quality = int(self.config.get("image_variant_quality", 80))
+
+    # --- Source index -----------------------------------------------------
+
+    def _load_index(self) -> Dict[str, str]:
+        if not os.path.exists(self._index_path):
+            return {}
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Image source index unreadable, rebuilding: {e}")
+            return {}
+
+    def _save_index(self, index: Dict[str, str]):
+        tmp_path = f"{self._index_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def path_for(self, digest: str, suffix: str = "", ext: str = "jpeg") -> str:
+        return os.path.join(self.base_dir, f"{digest}{suffix}.{ext}")
+
+    # --- Originals --------------------------------------------------------
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def store_remote(self, source_key: str, url: str) -> Optional[str]:
+        """
+        Returns the local path of the image identified by `source_key`
+        (e.g. 'pexels:12345'), downloading it only if it has never been stored.
+        """
+        with _store_lock:
+            digest = self._load_index().get(source_key)
+        if digest and os.path.exists(self.path_for(digest)):
+            self.logger.info(f"Image store hit for {source_key} ({digest[:12]}).")
+            return self.path_for(digest)
+
+        tmp_path = os.path.join(self.base_dir, f".download-{uuid.uuid4().hex}.tmp")
+        if not download_image_from_url(url, tmp_path):
+            return None
+
+        try:
+            digest = self._hash_file(tmp_path)
+            final_path = self.path_for(digest)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, final_path)
+        except OSError as e:
+            self.logger.error(f"Failed to store downloaded image {url}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        with _store_lock:
+            index = self._load_index()
+            index[source_key] = digest
+            self._save_index(index)
+        return final_path
+
+    # --- Derived files ----------------------------------------------------
+
+    @staticmethod
+    def digest_of(path: str) -> Optional[str]:
+        match = CONTENT_ADDRESSED_NAME.match(os.path.basename(path or ""))
+        return match.group(1) if match else None
+
+    def derived_path(self, source_path: str, parts: List[str], ext: str = "jpeg") -> str:
+        """
+        Deterministic path for a file derived from `source_path` and `parts`
+        (e.g. overlay text and styling). Identical inputs map to the same file.
+        """
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        key = hashlib.sha256("\x1f".join([stem] + parts).encode("utf-8")).hexdigest()
+        digest = self.digest_of(source_path) or hashlib.sha256(stem.encode("utf-8")).hexdigest()
+        return self.path_for(digest, f"-d{key[:16]}", ext)
+
+    def generate_variants(self, image_path: str) -> Dict[int, str]:
+        """
+        Pre-generates resized copies of `image_path` at the configured widths.
+        Existing variants are reused; widths larger than the source are skipped.
+        """
+        variants: Dict[int, str] = {}
+        if not image_path or not self.variant_widths:
+            return variants
+
+        stem = os.path.splitext(os.path.basename(image_path))[0]
+        ext = self.variant_format.lower()
+        try:
+            with Image.open(image_path) as img:
+                source = img.convert("RGB")
+            for width in self.variant_widths:
+                if width >= source.width:
+                    continue
+                variant_path = os.path.join(self.base_dir, f"{stem}-w{width}.{ext}")
+                if not os.path.exists(variant_path):
+                    height = max(1, round(source.height * width / source.width))
+                    resized = source.resize((width, height), Image.LANCZOS)
+                    tmp_path = f"{variant_path}.{uuid.uuid4().hex}.tmp"
+                    resized.save(
+                        tmp_path, format=self.variant_format, quality=self.variant_quality
+                    )
+                    os.replace(tmp_path, variant_path)
+                variants[width] = variant_path
+        except Exception as e:
+            self.logger.error(f"Failed to generate variants for {image_path}: {e}")
+        return variants
@@ -1,8 +1,16 @@
 # core/page_classifier.py
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from urllib.parse import urlparse
 
+# Memoized (domain, path) classifications, shared by every classifier built
+# from the same page_classification config. A new classifier is created for
+# each analysis, so an instance-level cache would never be warm. Entries are
+# keyed by the config as well, so differently configured clients never mix.
+MAX_CACHED_PATHS = 50000
+_path_cache: Dict[Tuple[tuple, str, str], str] = {}
+
 
 class PageClassifier:
     """
@@ -11,9 +19,9 @@ class PageClassifier:
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config.get("page_classification", {})
-        self.forum_domains = self.config.get("forum_domains", [])
-        self.ecommerce_domains = self.config.get("ecommerce_domains", [])
-        self.news_domains = self.config.get("news_domains", [])
+        self.forum_domains = frozenset(self.config.get("forum_domains", []))
+        self.ecommerce_domains = frozenset(self.config.get("ecommerce_domains", []))
+        self.news_domains = frozenset(self.config.get("news_domains", []))
 
         # Pre-compile regex for efficiency
         self.blog_patterns = [
@@ -22,6 +30,15 @@ class PageClassifier:
         self.forum_patterns = [
             re.compile(p) for p in self.config.get("forum_url_patterns", [])
         ]
+        # The same competitor URLs recur across SERPs; only the title check
+        # depends on more than (domain, path).
+        self._config_key = (
+            self.forum_domains,
+            self.ecommerce_domains,
+            self.news_domains,
+            tuple(p.pattern for p in self.blog_patterns),
+            tuple(p.pattern for p in self.forum_patterns),
+        )
 
     def classify(self, url: str, domain: str, title: str) -> str:
         """
@@ -35,6 +52,25 @@ class PageClassifier:
         Returns:
             A string representing the classified page type.
         """
+        path = _url_path(url or "")
+        key = (self._config_key, domain, path)
+        page_type = _path_cache.get(key)
+        if page_type is None:
+            page_type = self._classify_path(domain, path)
+            if len(_path_cache) >= MAX_CACHED_PATHS:
+                _path_cache.clear()
+            _path_cache[key] = page_type
+
+        if page_type in ("E-commerce", "Forum", "News"):
+            return page_type
+        if title and self.forum_patterns:
+            title_lower = title.lower()
+            if any(pattern.search(title_lower) for pattern in self.forum_patterns):
+                return "Forum"
+        return page_type
+
+    def _classify_path(self, domain: str, path: str) -> str:
+        """Page type from the domain and URL path alone (title not considered)."""
         if domain in self.ecommerce_domains:
             return "E-commerce"
         if domain in self.forum_domains:
@@ -43,11 +79,8 @@ class PageClassifier:
             return "News"
 
         # Check URL patterns for more specific types
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-
         for pattern in self.forum_patterns:
-            if pattern.search(path) or pattern.search(title.lower()):
+            if pattern.search(path):
                 return "Forum"
 
         for pattern in self.blog_patterns:
@@ -59,3 +92,8 @@ class PageClassifier:
             return "Homepage/Landing Page"
 
         return "Blog/Article"  # Default category
+
+
+@lru_cache(maxsize=50000)
+def _url_path(url: str) -> str:
+    return urlparse(url).path
@@ -0,0 +1,123 @@
+# core/phrase_matcher.py
+"""
+Multi-phrase matching with an Aho-Corasick automaton: the automaton is built
+once from all phrases (entities, anchors, context paragraphs) and then finds
+every occurrence of all of them in a single pass over a text.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class PhraseMatcher:
+    """
+    Finds occurrences of `phrases` in text. Matches are reported by the index
+    of the phrase in the list given to the constructor.
+
+    ignore_case:    case-insensitive matching (like re.IGNORECASE).
+    word_boundary:  a match must sit on regex \\b boundaries at both ends.
+    plurals:        a phrase not ending in "s" also matches with a trailing "s"
+                    ("tool" matches "tools"); phrases ending in "s" match as is.
+    """
+
+    def __init__(
+        self,
+        phrases: Iterable[str],
+        ignore_case: bool = False,
+        word_boundary: bool = False,
+        plurals: bool = False,
+    ):
+        self.phrases = list(phrases)
+        self.ignore_case = ignore_case
+        self.word_boundary = word_boundary
+
+        # Trie: per-state transitions, failure links and the
+        # (phrase index, pattern length) pairs that end at that state.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, int]]] = [[]]
+
+        for index, phrase in enumerate(self.phrases):
+            if not phrase:
+                continue
+            pattern = self._fold(phrase)
+            self._add(pattern, index)
+            if plurals and not pattern.endswith("s"):
+                self._add(pattern + "s", index)
+        self._build_failure_links()
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        folded = text.lower()
+        if len(folded) == len(text):
+            return folded
+        # A few characters lower-case to several; keep offsets aligned.
+        return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+    def _add(self, pattern: str, index: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append((index, len(pattern)))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = (
+                    self._out[next_state] + self._out[self._fail[next_state]]
+                )
+
+    def _on_boundary(self, text: str, position: int) -> bool:
+        before = position > 0 and _is_word_char(text[position - 1])
+        after = position < len(text) and _is_word_char(text[position])
+        return before != after
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yields (start, end, phrase index) for every match, overlaps included."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, char in enumerate(self._fold(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index, length in out[state]:
+                end = position + 1
+                start = end - length
+                if self.word_boundary and not (
+                    self._on_boundary(text, start) and self._on_boundary(text, end)
+                ):
+                    continue
+                yield start, end, index
+
+    def found(self, text: str) -> Set[int]:
+        """Indexes of the phrases that occur at least once in `text`."""
+        return {index for _, _, index in self.finditer(text)}
+
+    def first_matches(self, text: str) -> Dict[int, Tuple[int, int]]:
+        """(start, end) of the leftmost occurrence of each phrase found."""
+        first: Dict[int, Tuple[int, int]] = {}
+        for start, end, index in self.finditer(text):
+            best: Optional[Tuple[int, int]] = first.get(index)
+            # Leftmost, then longest (a plural over its singular), like re.search.
+            if best is None or start < best[0] or (start == best[0] and end > best[1]):
+                first[index] = (start, end)
+        return first
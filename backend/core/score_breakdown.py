@@ -0,0 +1,66 @@
+# core/score_breakdown.py
+"""
+Score breakdown formats. The full breakdown produced by the ScoringEngine
+nests every component's sub-factors with value and explanation strings. The
+compact form keeps only each component's numeric score and weight; the full
+breakdown is regenerated from the opportunity's data when someone asks for it.
+"""
+from typing import Any, Dict
+
+COMPACT_FORMAT = "compact"
+
+# Display names of the scoring components, by breakdown key.
+COMPONENT_NAMES = {
+    "ease_of_ranking": "Ease of Ranking",
+    "traffic_potential": "Traffic Potential",
+    "commercial_intent": "Commercial Intent",
+    "growth_trend": "Growth Trend",
+    "serp_features": "SERP Opportunity",
+    "serp_volatility": "SERP Volatility",
+    "competitor_weakness": "Competitor Weakness",
+    "serp_crowding": "SERP Crowding",
+    "keyword_structure": "Keyword Structure",
+    "serp_threat": "SERP Threat",
+    "volume_volatility": "Volume Volatility",
+    "serp_freshness": "SERP Freshness",
+    "competitor_performance": "Competitor Tech Performance",
+}
+
+
+def is_compact_breakdown(breakdown: Any) -> bool:
+    return isinstance(breakdown, dict) and breakdown.get("format") == COMPACT_FORMAT
+
+
+def compact_breakdown(breakdown: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduces a full breakdown to per-component scores and weights."""
+    if is_compact_breakdown(breakdown):
+        return breakdown
+    components = {
+        key: value
+        for key, value in breakdown.items()
+        if isinstance(value, dict) and "score" in value
+    }
+    return {
+        "format": COMPACT_FORMAT,
+        "scores": {key: value["score"] for key, value in components.items()},
+        "weights": {key: value.get("weight", 0) for key, value in components.items()},
+    }
+
+
+def inflate_breakdown(breakdown: Any) -> Dict[str, Any]:
+    """
+    Returns a breakdown in the full layout ({key: {name, score, weight, ...}}).
+    Compact breakdowns become components without sub-factor details; use
+    ScoringEngine.explain_breakdown when the explanations are needed.
+    """
+    if not is_compact_breakdown(breakdown):
+        return breakdown or {}
+    weights = breakdown.get("weights", {})
+    return {
+        key: {
+            "name": COMPONENT_NAMES.get(key, key),
+            "score": score,
+            "weight": weights.get(key, 0),
+        }
+        for key, score in breakdown.get("scores", {}).items()
+    }
@@ -0,0 +1,119 @@
+# core/serializer.py
+"""
+JSON serialization for database blobs, API payloads and responses. Uses
+orjson when it is installed and the standard library otherwise.
+
+Whatever the backend, decoding the output gives the same values as the
+standard library would. Anything orjson encodes or decodes differently is
+handed to the standard library instead: non-finite floats, which orjson
+writes as null; non-string keys; subclasses of str, int, dict and list;
+datetimes; strings with lone surrogates; integers over 64 bits;
+NaN/Infinity literals. Input the standard library rejects still raises
+TypeError or json.JSONDecodeError, except that orjson also accepts enums
+and UUIDs.
+
+The encoded text is compact and not ASCII-escaped, so it is not
+byte-identical to json.dumps. Cache keys and hashes that must stay stable
+keep using json.dumps(..., sort_keys=True).
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKENDS = ("orjson", "json") if orjson is not None else ("json",)
+backend = BACKENDS[0]
+
+# Everything orjson would serialize natively but json.dumps would not (or
+# differently) is passed through to the fallback instead.
+_ORJSON_DUMPS_OPTIONS = (
+    (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+    if orjson is not None
+    else 0
+)
+
+
+# Maps digits to b"0" and every other byte to b" ", so a run of digits can be
+# found with a substring search.
+_DIGITS_TO_ZERO = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+_DIGIT_RUN = b"0" * 19
+
+
+def use_backend(name: str) -> None:
+    """Selects the serializer backend ('orjson' or 'json')."""
+    global backend
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown or unavailable serializer backend '{name}'. "
+            f"Expected one of: {', '.join(BACKENDS)}."
+        )
+    backend = name
+
+
+def _has_non_finite(obj: Any) -> bool:
+    # x - x is 0.0 for finite floats and NaN for NaN and +/-Infinity.
+    if type(obj) is float:
+        return obj - obj != 0.0
+    if type(obj) not in (dict, list, tuple):
+        return False
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        values = container.values() if type(container) is dict else container
+        for value in values:
+            kind = type(value)
+            if kind is dict or kind is list or kind is tuple:
+                stack.append(value)
+            elif kind is float and value - value != 0.0:
+                return True
+    return False
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serializes `obj` to UTF-8 JSON bytes."""
+    if backend == "orjson":
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS)
+        except TypeError:
+            pass  # Falls back below; json.dumps raises if it is not serializable.
+        else:
+            # NaN and Infinity come out as null; only then is the walk needed.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serializes `obj` to a JSON string (for TEXT columns and request bodies)."""
+    if backend == "orjson":
+        return dumps_bytes(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _may_have_big_int(data: Union[str, bytes, bytearray]) -> bool:
+    """
+    True if the text has a run of 19+ digits, which includes every integer
+    beyond 64 bits (orjson decodes those as floats). Strings may trigger it
+    too; they just take the slower path.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return _DIGIT_RUN in bytes(data).translate(_DIGITS_TO_ZERO)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Parses a JSON document. Raises json.JSONDecodeError on invalid input."""
+    if backend == "orjson" and isinstance(data, (str, bytes, bytearray)):
+        if not _may_have_big_int(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity literals or invalid input; let json decide.
+    return json.loads(data)
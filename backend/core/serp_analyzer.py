@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional
 from external_apis.dataforseo_client_v2 import DataForSEOClientV2
 from core import utils
 from core.serp_analyzers.featured_snippet_analyzer import FeaturedSnippetAnalyzer
@@ -24,6 +24,35 @@ class FullSerpAnalyzer:
         self.page_classifier = PageClassifier(config)
         self.disqualification_analyzer = DisqualificationAnalyzer()
 
+        # Item type -> handler that extracts it into the analysis.
+        self._item_handlers = {
+            "organic": self._parse_organic,
+            "paid": self._parse_paid,
+            "people_also_ask": self._parse_people_also_ask,
+            "knowledge_graph": self._parse_knowledge_graph,
+            "ai_overview": self._parse_ai_overview,
+            "discussions_and_forums": self._parse_discussions,
+            "perspectives": self._parse_discussions,
+            "related_searches": self._parse_related_searches,
+            "product_considerations": self._parse_product_considerations,
+        }
+        # Sub-analyzers fed from the same pass, indexed by the item types
+        # they observe (item_types=None observes everything).
+        self.item_analyzers = [
+            self.featured_snippet_analyzer,
+            self.video_analyzer,
+            self.pixel_ranking_analyzer,
+        ]
+        self._untyped_observers = [
+            i for i, a in enumerate(self.item_analyzers) if a.item_types is None
+        ]
+        self._observers_by_type: Dict[str, List[int]] = {}
+        for i, analyzer in enumerate(self.item_analyzers):
+            for item_type in analyzer.item_types or ():
+                self._observers_by_type.setdefault(
+                    item_type, list(self._untyped_observers)
+                ).append(i)
+
     def analyze_serp(self, keyword: str) -> Tuple[Optional[Dict[str, Any]], float]:
         """
         Fetches SERP data and extracts a wide range of insights, including rich SERP elements.
@@ -79,6 +108,14 @@ class FullSerpAnalyzer:
         if not serp_results:
             return None, cost
 
+        return self.parse_serp(serp_results), cost
+
+    def parse_serp(self, serp_results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extracts the analysis from a SERP result in a single pass over its items.
+        Each item goes to its type's handler and to the sub-analyzers observing
+        that type.
+        """
         serp_times = utils.calculate_serp_times(
             serp_results.get("datetime"), serp_results.get("previous_updated_time")
         )
@@ -107,199 +144,205 @@ class FullSerpAnalyzer:
             "dominant_content_format": "Article",
         }
 
-        analysis.update(self.featured_snippet_analyzer.analyze(serp_results))
-        analysis.update(self.video_analyzer.analyze(serp_results))
-        analysis.update(self.pixel_ranking_analyzer.analyze(serp_results))
-
+        item_states = [
+            (analyzer, analyzer.start(serp_results)) for analyzer in self.item_analyzers
+        ]
         for item in serp_results.get("items") or []:
             item_type = item.get("type")
+            handler = self._item_handlers.get(item_type)
+            if handler:
+                handler(item, analysis)
+            for index in self._observers_by_type.get(item_type, self._untyped_observers):
+                analyzer, state = item_states[index]
+                analyzer.observe(state, item)
+        for analyzer, state in item_states:
+            analysis.update(analyzer.finish(state))
 
-            # Organic Results
-            if item_type == "organic":
-                organic_result = {
-                    "rank": item.get("rank_absolute"),
-                    "url": item.get("url"),
-                    "title": item.get("title"),
-                    "domain": item.get("domain"),
-                    "description": item.get("description"),
-                    "page_type": self.page_classifier.classify(
-                        item.get("url"), item.get("domain"), item.get("title")
-                    ),
-                }
-                if item.get("rating"):
-                    organic_result["rating"] = {
-                        "value": item["rating"].get("value"),
-                        "votes_count": item["rating"].get("votes_count"),
-                        "rating_max": item["rating"].get("rating_max"),
-                    }
-                if item.get("about_this_result"):
-                    organic_result["about_this_result_source_info"] = item[
-                        "about_this_result"
-                    ].get("source_info")
-                    organic_result["about_this_result_search_terms"] = item[
-                        "about_this_result"
-                    ].get("search_terms")
-                    organic_result["about_this_result_related_terms"] = item[
-                        "about_this_result"
-                    ].get("related_terms")
+        # Deduplicate all lists
+        analysis["ai_overview_sources"] = list(set(analysis["ai_overview_sources"]))
+        analysis["top_organic_faqs"] = list(set(analysis["top_organic_faqs"]))
+        analysis["top_organic_sitelinks"] = list(set(analysis["top_organic_sitelinks"]))
+        analysis["discussion_snippets"] = list(set(analysis["discussion_snippets"]))
 
-                # NEW: Extract FAQ and Sitelinks directly from organic results
-                if item.get("faq") and item["faq"].get("items"):
-                    analysis["top_organic_faqs"].extend(
-                        [
-                            faq_item.get("title")
-                            for faq_item in item["faq"]["items"]
-                            if faq_item.get("title")
-                        ]
-                    )
-                if item.get("links"):
-                    analysis["top_organic_sitelinks"].extend(
-                        [
-                            link.get("title")
-                            for link in item["links"]
-                            if link.get("title")
-                        ]
-                    )
+        # Determine dominant content format (existing logic)
+        # ...
+
+        disqualification_results = self.disqualification_analyzer.analyze(
+            analysis, self.config
+        )
+        analysis.update(disqualification_results)
 
-                analysis["top_organic_results"].append(organic_result)
+        return analysis
 
-            # Paid Ads
-            elif item_type == "paid":
-                if item.get("title") and item.get("description"):
-                    analysis["paid_ad_copy"].append(
-                        {
-                            "title": item.get("title"),
-                            "description": item.get("description"),
-                            "url": item.get("url"),
-                        }
-                    )
+    # --- Item handlers (see _item_handlers) ---
 
-            # People Also Ask (PAA)
-            elif item_type == "people_also_ask":
-                all_paa_questions = []
-                for paa_item in item.get("items") or []:
-                    if paa_item and paa_item.get("title"):
-                        (all_paa_questions.append(paa_item.get("title")),)
-                    if paa_item and paa_item.get("expanded_element"):
-                        for expanded_item in paa_item.get("expanded_element") or []:
-                            if expanded_item and expanded_item.get("title"):
-                                (all_paa_questions.append(expanded_item.get("title")),)
-                analysis["paa_questions"] = list(set(all_paa_questions))
-                analysis["people_also_ask"] = analysis[
-                    "paa_questions"
-                ]  # For backward compatibility
+    def _parse_organic(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Organic Results
+        organic_result = {
+            "rank": item.get("rank_absolute"),
+            "url": item.get("url"),
+            "title": item.get("title"),
+            "domain": item.get("domain"),
+            "description": item.get("description"),
+            "page_type": self.page_classifier.classify(
+                item.get("url"), item.get("domain"), item.get("title")
+            ),
+        }
+        if item.get("rating"):
+            organic_result["rating"] = {
+                "value": item["rating"].get("value"),
+                "votes_count": item["rating"].get("votes_count"),
+                "rating_max": item["rating"].get("rating_max"),
+            }
+        if item.get("about_this_result"):
+            organic_result["about_this_result_source_info"] = item[
+                "about_this_result"
+            ].get("source_info")
+            organic_result["about_this_result_search_terms"] = item[
+                "about_this_result"
+            ].get("search_terms")
+            organic_result["about_this_result_related_terms"] = item[
+                "about_this_result"
+            ].get("related_terms")
+
+        # NEW: Extract FAQ and Sitelinks directly from organic results
+        if item.get("faq") and item["faq"].get("items"):
+            analysis["top_organic_faqs"].extend(
+                [
+                    faq_item.get("title")
+                    for faq_item in item["faq"]["items"]
+                    if faq_item.get("title")
+                ]
+            )
+        if item.get("links"):
+            analysis["top_organic_sitelinks"].extend(
+                [
+                    link.get("title")
+                    for link in item["links"]
+                    if link.get("title")
+                ]
+            )
 
-            # Knowledge Graph
-            elif item_type == "knowledge_graph":
-                analysis["knowledge_graph_data"] = {  # For backward compatibility
+        analysis["top_organic_results"].append(organic_result)
+
+    def _parse_paid(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Paid Ads
+        if item.get("title") and item.get("description"):
+            analysis["paid_ad_copy"].append(
+                {
                     "title": item.get("title"),
                     "description": item.get("description"),
                     "url": item.get("url"),
-                    "image_url": item.get("image_url"),
                 }
-                # NEW: Deep parse Knowledge Graph structured items
-                if item.get("items"):
-                    for kg_sub_item in item["items"]:
-                        if (
-                            kg_sub_item
-                            and kg_sub_item.get("type") == "knowledge_graph_row_item"
-                        ):
-                            analysis["knowledge_graph_facts"].append(
-                                f"{kg_sub_item.get('title')}: {kg_sub_item.get('text')}"
-                            )
-                        elif (
-                            kg_sub_item
-                            and kg_sub_item.get("type")
-                            == "knowledge_graph_carousel_item"
-                            and kg_sub_item.get("items")
-                        ):
-                            analysis["knowledge_graph_facts"].extend(
-                                [
-                                    carousel_el.get("title")
-                                    for carousel_el in kg_sub_item["items"]
-                                    if carousel_el.get("title")
-                                ]
-                            )
-                        elif (
-                            kg_sub_item
-                            and kg_sub_item.get("type") == "knowledge_graph_list_item"
-                            and kg_sub_item.get("items")
-                        ):
-                            analysis["knowledge_graph_facts"].extend(
-                                [
-                                    list_el.get("title")
-                                    for list_el in kg_sub_item["items"]
-                                    if list_el.get("title")
-                                ]
-                            )
+            )
 
-            # AI Overview
-            elif item_type == "ai_overview":
-                ai_items = item.get("items") or []
-                ai_parts = [
-                    sub_item.get("markdown")
-                    for sub_item in ai_items
-                    if sub_item and sub_item.get("markdown")
-                ]
-                analysis["ai_overview_content"] = "\n".join(ai_parts)
-                # NEW: Extract AI Overview References
-                for sub_item in ai_items:
-                    if sub_item and sub_item.get("references"):
-                        analysis["ai_overview_sources"].extend(
-                            [
-                                ref.get("url")
-                                for ref in sub_item["references"]
-                                if ref.get("url")
-                            ]
-                        )
+    def _parse_people_also_ask(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # People Also Ask (PAA)
+        all_paa_questions = []
+        for paa_item in item.get("items") or []:
+            if paa_item and paa_item.get("title"):
+                (all_paa_questions.append(paa_item.get("title")),)
+            if paa_item and paa_item.get("expanded_element"):
+                for expanded_item in paa_item.get("expanded_element") or []:
+                    if expanded_item and expanded_item.get("title"):
+                        (all_paa_questions.append(expanded_item.get("title")),)
+        analysis["paa_questions"] = list(set(all_paa_questions))
+        analysis["people_also_ask"] = analysis[
+            "paa_questions"
+        ]  # For backward compatibility
 
-            # Discussions and Forums / Perspectives
-            elif item_type in [
-                "discussions_and_forums",
-                "perspectives",
-            ]:  # Combined handling
-                if item.get("items"):
-                    analysis["discussion_snippets"].extend(
+    def _parse_knowledge_graph(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Knowledge Graph
+        analysis["knowledge_graph_data"] = {  # For backward compatibility
+            "title": item.get("title"),
+            "description": item.get("description"),
+            "url": item.get("url"),
+            "image_url": item.get("image_url"),
+        }
+        # NEW: Deep parse Knowledge Graph structured items
+        if item.get("items"):
+            for kg_sub_item in item["items"]:
+                if (
+                    kg_sub_item
+                    and kg_sub_item.get("type") == "knowledge_graph_row_item"
+                ):
+                    analysis["knowledge_graph_facts"].append(
+                        f"{kg_sub_item.get('title')}: {kg_sub_item.get('text')}"
+                    )
+                elif (
+                    kg_sub_item
+                    and kg_sub_item.get("type")
+                    == "knowledge_graph_carousel_item"
+                    and kg_sub_item.get("items")
+                ):
+                    analysis["knowledge_graph_facts"].extend(
                         [
-                            d_item.get("title")
-                            for d_item in item["items"]
-                            if d_item.get("title")
+                            carousel_el.get("title")
+                            for carousel_el in kg_sub_item["items"]
+                            if carousel_el.get("title")
                         ]
                     )
-
-            # Related Searches
-            elif item_type == "related_searches":
-                related_items = item.get("items") or []
-                for s in related_items:
-                    if isinstance(s, str):
-                        analysis["related_searches"].append(s)
-                    elif isinstance(s, dict) and s.get("title"):
-                        (analysis["related_searches"].append(s.get("title")),)
-
-            # Product Considerations (existing)
-            elif item_type == "product_considerations":
-                title = item.get("title")
-                items = item.get("items") or []
-                if title and items:
-                    considerations = [
-                        sub.get("title") for sub in items if sub and sub.get("title")
-                    ]
-                    analysis["product_considerations_summary"] = (
-                        f"{title}: {', '.join(considerations)}"
+                elif (
+                    kg_sub_item
+                    and kg_sub_item.get("type") == "knowledge_graph_list_item"
+                    and kg_sub_item.get("items")
+                ):
+                    analysis["knowledge_graph_facts"].extend(
+                        [
+                            list_el.get("title")
+                            for list_el in kg_sub_item["items"]
+                            if list_el.get("title")
+                        ]
                     )
 
-        # Deduplicate all lists
-        analysis["ai_overview_sources"] = list(set(analysis["ai_overview_sources"]))
-        analysis["top_organic_faqs"] = list(set(analysis["top_organic_faqs"]))
-        analysis["top_organic_sitelinks"] = list(set(analysis["top_organic_sitelinks"]))
-        analysis["discussion_snippets"] = list(set(analysis["discussion_snippets"]))
+    def _parse_ai_overview(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # AI Overview
+        ai_items = item.get("items") or []
+        ai_parts = [
+            sub_item.get("markdown")
+            for sub_item in ai_items
+            if sub_item and sub_item.get("markdown")
+        ]
+        analysis["ai_overview_content"] = "\n".join(ai_parts)
+        # NEW: Extract AI Overview References
+        for sub_item in ai_items:
+            if sub_item and sub_item.get("references"):
+                analysis["ai_overview_sources"].extend(
+                    [
+                        ref.get("url")
+                        for ref in sub_item["references"]
+                        if ref.get("url")
+                    ]
+                )
 
-        # Determine dominant content format (existing logic)
-        # ...
+    def _parse_discussions(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Discussions and Forums / Perspectives (combined handling)
+        if item.get("items"):
+            analysis["discussion_snippets"].extend(
+                [
+                    d_item.get("title")
+                    for d_item in item["items"]
+                    if d_item.get("title")
+                ]
+            )
 
-        disqualification_results = self.disqualification_analyzer.analyze(
-            analysis, self.config
-        )
-        analysis.update(disqualification_results)
+    def _parse_related_searches(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Related Searches
+        related_items = item.get("items") or []
+        for s in related_items:
+            if isinstance(s, str):
+                analysis["related_searches"].append(s)
+            elif isinstance(s, dict) and s.get("title"):
+                (analysis["related_searches"].append(s.get("title")),)
 
-        return analysis, cost
+    def _parse_product_considerations(self, item: Dict[str, Any], analysis: Dict[str, Any]):
+        # Product Considerations
+        title = item.get("title")
+        items = item.get("items") or []
+        if title and items:
+            considerations = [
+                sub.get("title") for sub in items if sub and sub.get("title")
+            ]
+            analysis["product_considerations_summary"] = (
+                f"{title}: {', '.join(considerations)}"
+            )
@@ -0,0 +1,32 @@
+# core/serp_analyzers/base.py
+
+from typing import Any, Dict, Optional, Tuple
+
+
+class ItemAnalyzer:
+    """
+    A SERP sub-analyzer fed one item at a time, so FullSerpAnalyzer can run
+    every sub-analyzer from a single traversal of `serp_data["items"]`.
+    """
+
+    # Item types passed to observe(); None means every item.
+    item_types: Optional[Tuple[str, ...]] = None
+
+    def start(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the per-SERP state."""
+        return {}
+
+    def observe(self, state: Dict[str, Any], item: Dict[str, Any]):
+        pass
+
+    def finish(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns this analyzer's analysis fields."""
+        return state
+
+    def analyze(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Standalone pass over the items."""
+        state = self.start(serp_data)
+        for item in serp_data.get("items") or []:
+            if self.item_types is None or item.get("type") in self.item_types:
+                self.observe(state, item)
+        return self.finish(state)
@@ -2,19 +2,27 @@
 
 from typing import Dict, Any
 
+from .base import ItemAnalyzer
 
-class FeaturedSnippetAnalyzer:
-    def analyze(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
+
+class FeaturedSnippetAnalyzer(ItemAnalyzer):
+    item_types = ("featured_snippet",)
+
+    def start(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyzes the featured snippet in the SERP."""
-        analysis = {
+        return {
             "serp_has_featured_snippet": "featured_snippet"
             in serp_data.get("item_types", []),
             "featured_snippet_content": None,
+            "_found": False,
         }
 
-        for item in serp_data.get("items", []):
-            if item.get("type") == "featured_snippet":
-                analysis["featured_snippet_content"] = item.get("description")
-                break
+    def observe(self, state: Dict[str, Any], item: Dict[str, Any]):
+        # Only the first featured snippet counts.
+        if not state["_found"]:
+            state["featured_snippet_content"] = item.get("description")
+            state["_found"] = True
 
-        return analysis
+    def finish(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        state.pop("_found")
+        return state
@@ -2,27 +2,34 @@
 
 from typing import Dict, Any
 
+from .base import ItemAnalyzer
 
-class PixelRankingAnalyzer:
-    def analyze(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
+
+class PixelRankingAnalyzer(ItemAnalyzer):
+    item_types = None  # Any item can carry a rectangle.
+
+    def start(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyzes the pixel ranking data in the SERP."""
-        analysis = {
+        return {
             "pixel_ranking_summary": None,
             "raw_pixel_ranking_data": [],
             "first_organic_y_pixel": None,
         }
 
-        for item in serp_data.get("items", []):
-            if item.get("rectangle"):
-                analysis["raw_pixel_ranking_data"].append(
-                    {
-                        "type": item.get("type"),
-                        "rank_group": item.get("rank_group"),
-                        "rank_absolute": item.get("rank_absolute"),
-                        "title": item.get("title"),
-                        "rectangle": item.get("rectangle"),
-                    }
-                )
+    def observe(self, state: Dict[str, Any], item: Dict[str, Any]):
+        if item.get("rectangle"):
+            state["raw_pixel_ranking_data"].append(
+                {
+                    "type": item.get("type"),
+                    "rank_group": item.get("rank_group"),
+                    "rank_absolute": item.get("rank_absolute"),
+                    "title": item.get("title"),
+                    "rectangle": item.get("rectangle"),
+                }
+            )
+
+    def finish(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        analysis = state
 
         if analysis["raw_pixel_ranking_data"]:
             top_organic_rects_y_coords = [
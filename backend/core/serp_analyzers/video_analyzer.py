@@ -2,12 +2,12 @@
 
 from typing import Dict, Any
 
+from .base import ItemAnalyzer
 
-class VideoAnalyzer:
-    def analyze(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyzes the video results in the SERP."""
-        analysis = {
-            "serp_has_video_results": "video" in serp_data.get("item_types", [])
-        }
 
-        return analysis
+class VideoAnalyzer(ItemAnalyzer):
+    item_types = ()  # Only needs the SERP's item_types.
+
+    def start(self, serp_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyzes the video results in the SERP."""
+        return {"serp_has_video_results": "video" in serp_data.get("item_types", [])}
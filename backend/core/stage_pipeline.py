@@ -0,0 +1,188 @@
+# core/stage_pipeline.py
+"""
+A small staged pipeline for bulk jobs. Items flow through a sequence of stages;
+each stage has its own worker threads and a bounded input queue, so a slow
+stage applies backpressure to the stages before it instead of letting work
+pile up in memory. Per-stage counts, busy time, time blocked on the next
+stage and throughput are reported when the run finishes.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from backend.core.cost_ledger import cost_ledger
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage:
+    """
+    One pipeline stage. `func` takes an item and returns the item to hand to
+    the next stage, or None when the item stops here (finished or failed).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any], Optional[Any]],
+        workers: int = 1,
+        queue_size: Optional[int] = None,
+    ):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        # Default to one item waiting per worker.
+        self.queue_size = max(1, queue_size or self.workers)
+
+
+class _StageStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.first_started: Optional[float] = None
+        self.last_finished: Optional[float] = None
+
+    def as_dict(self, workers: int) -> Dict[str, Any]:
+        active_seconds = (
+            self.last_finished - self.first_started
+            if self.first_started is not None and self.last_finished is not None
+            else 0.0
+        )
+        return {
+            "workers": workers,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "active_seconds": round(active_seconds, 3),
+            "items_per_second": (
+                round(self.items_in / active_seconds, 3) if active_seconds else None
+            ),
+        }
+
+
+class StagePipeline:
+    """
+    Runs items through `stages`. Worker threads are bound to `job_id` in the
+    cost ledger, so API spend in any stage is charged to the job.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        job_id: Optional[str] = None,
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None,
+    ):
+        self.stages = stages
+        self.job_id = job_id
+        self.on_error = on_error
+
+    def run(
+        self,
+        items: Iterable[Any],
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Feeds `items` into the first stage and blocks until every stage has
+        drained. `should_stop` is checked before each new item is pulled from
+        `items`; items already in the pipeline are finished.
+        """
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        stats = [_StageStats() for _ in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+        remaining_lock = threading.Lock()
+
+        def worker(index: int) -> None:
+            stage, inbox = self.stages[index], queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            stage_stats = stats[index]
+            with cost_ledger.bind(self.job_id):
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+                    started = time.perf_counter()
+                    with stage_stats.lock:
+                        stage_stats.items_in += 1
+                        if stage_stats.first_started is None:
+                            stage_stats.first_started = started
+                    try:
+                        result = stage.func(item)
+                    except Exception as e:
+                        logger.error(
+                            f"Pipeline stage '{stage.name}' failed: {e}", exc_info=True
+                        )
+                        with stage_stats.lock:
+                            stage_stats.errors += 1
+                        if self.on_error:
+                            self.on_error(stage.name, item, e)
+                        result = None
+                    finished = time.perf_counter()
+                    blocked = 0.0
+                    if result is not None and outbox is not None:
+                        outbox.put(result)
+                        blocked = time.perf_counter() - finished
+                    with stage_stats.lock:
+                        stage_stats.busy_seconds += finished - started
+                        stage_stats.blocked_seconds += blocked
+                        stage_stats.last_finished = finished
+                        if result is not None:
+                            stage_stats.items_out += 1
+            # The last worker of a stage to finish closes the next stage.
+            with remaining_lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last and outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    outbox.put(_DONE)
+
+        threads = [
+            threading.Thread(
+                target=worker,
+                args=(index,),
+                name=f"pipeline-{stage.name}-{n}",
+                daemon=True,
+            )
+            for index, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+
+        fed = 0
+        iterator = iter(items)
+        while True:
+            # Checked before pulling the next item: producing it may have side
+            # effects, and a pulled item is always fed.
+            if should_stop and should_stop():
+                logger.info(f"Pipeline stopped after feeding {fed} items.")
+                break
+            try:
+                item = next(iterator)
+            except StopIteration:
+                break
+            queues[0].put(item)
+            fed += 1
+        for _ in range(self.stages[0].workers):
+            queues[0].put(_DONE)
+        for thread in threads:
+            thread.join()
+
+        return {
+            "items_fed": fed,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+            "stages": {
+                stage.name: stage_stats.as_dict(stage.workers)
+                for stage, stage_stats in zip(self.stages, stats)
+            },
+        }
@@ -0,0 +1,127 @@
+# core/text_statistics.py
+"""
+Readability statistics computed from shared counts. Text is tokenized once,
+syllables are counted once per distinct word (cached across calls), and counts
+are kept per block (paragraph), so re-auditing an article after a small patch
+only recounts the blocks that changed.
+
+Indices follow textstat's definitions and use textstat's syllable counter.
+"""
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+import textstat
+
+MAX_CACHED_WORDS = 100000
+MAX_CACHED_BLOCKS = 5000
+
+# textstat's tokenization: drop punctuation except apostrophes in
+# contractions, then split on whitespace.
+_NON_CONTRACTION_APOSTROPHE_RE = re.compile(r"\'(?![tsd]|ve|ll|re)")
+_PUNCTUATION_RE = re.compile(r"[^\w\s\']")
+_SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*", re.UNICODE)
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+class BlockCounts(NamedTuple):
+    words: int
+    syllables: int
+    polysyllables: int  # Words of three or more syllables.
+    letters: int
+
+
+def _words(text: str) -> List[str]:
+    text = _NON_CONTRACTION_APOSTROPHE_RE.sub("", text)
+    return _PUNCTUATION_RE.sub("", text).split()
+
+
+@lru_cache(maxsize=MAX_CACHED_WORDS)
+def _word_syllables(word: str) -> int:
+    return textstat.syllable_count(word)
+
+
+@lru_cache(maxsize=MAX_CACHED_BLOCKS)
+def _block_counts(block: str) -> BlockCounts:
+    words = _words(block)
+    syllables = [_word_syllables(word.lower()) for word in words]
+    return BlockCounts(
+        words=len(words),
+        syllables=sum(syllables),
+        polysyllables=sum(1 for count in syllables if count >= 3),
+        letters=len(_WORD_CHAR_RE.findall(block)),
+    )
+
+
+class TextStatistics:
+    """
+    Counts and readability indices for a text given as blocks, which are
+    read as joined by single spaces (as `get_text(separator=" ")` does).
+    """
+
+    def __init__(self, blocks: Iterable[str]):
+        self.blocks = [block for block in blocks if block]
+        self._counts = [_block_counts(block) for block in self.blocks]
+        self._sentences: Optional[int] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextStatistics":
+        return cls([text])
+
+    def replace_block(self, index: int, block: str) -> None:
+        """Updates one block, recounting only that block."""
+        self.blocks[index] = block
+        self._counts[index] = _block_counts(block)
+        self._sentences = None
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.blocks)
+
+    @property
+    def words(self) -> int:
+        return sum(counts.words for counts in self._counts)
+
+    @property
+    def syllables(self) -> int:
+        return sum(counts.syllables for counts in self._counts)
+
+    @property
+    def polysyllables(self) -> int:
+        return sum(counts.polysyllables for counts in self._counts)
+
+    @property
+    def letters(self) -> int:
+        return sum(counts.letters for counts in self._counts)
+
+    @property
+    def sentences(self) -> int:
+        """Sentences of three or more words; at least 1 for non-empty text."""
+        if self._sentences is None:
+            text = self.text
+            if not text:
+                self._sentences = 0
+            else:
+                sentences = _SENTENCE_RE.findall(text)
+                short = sum(1 for sentence in sentences if len(_words(sentence)) <= 2)
+                self._sentences = max(1, len(sentences) - short)
+        return self._sentences
+
+    def flesch_kincaid_grade(self) -> float:
+        words, sentences = self.words, self.sentences
+        if not words or not sentences or not self.syllables:
+            return 0.0
+        return 0.39 * (words / sentences) + 11.8 * (self.syllables / words) - 15.59
+
+    def smog_index(self) -> float:
+        if not self.sentences:
+            return 0.0
+        return 1.043 * (30 * (self.polysyllables / self.sentences)) ** 0.5 + 3.1291
+
+    def coleman_liau_index(self) -> float:
+        words = self.words
+        if not words or not self.letters or not self.sentences:
+            return 0.0
+        letters = self.letters / words * 100
+        sentences = self.sentences / words * 100
+        return 0.058 * letters - 0.296 * sentences - 15.8
@@ -0,0 +1,53 @@
+# data_access/async_database.py
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .database_manager import DatabaseManager
+
+
+class AsyncDatabaseManager:
+    """
+    Async facade over DatabaseManager for the API. Every method of the wrapped
+    manager is available as a coroutine that runs the blocking SQLite call on
+    a dedicated, bounded thread pool, so a slow query never blocks the event
+    loop and other requests keep being served.
+
+    The pool is separate from the server's default threadpool: its size caps
+    the number of concurrent SQLite connections (DatabaseManager keeps one per
+    thread), and DB work cannot starve other offloaded calls or vice versa.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, max_workers: int = 8):
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="db"
+        )
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs any blocking callable that does database work (a service or
+        orchestrator method, for example) on the database executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.db_manager, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__.
+        setattr(self, name, call)
+        return call
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
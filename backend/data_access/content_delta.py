@@ -0,0 +1,49 @@
+# data_access/content_delta.py
+"""
+Text deltas for content history. A version is stored either as a full snapshot
+or as a delta against its opportunity's latest snapshot, so rebuilding any
+version takes at most one snapshot plus one delta.
+"""
+import difflib
+import re
+from typing import List
+
+from backend.core import serializer
+
+# Start a new snapshot after this many deltas against the current one.
+SNAPSHOT_INTERVAL = 10
+# Store a snapshot instead when the delta would not save at least this much.
+MAX_DELTA_RATIO = 0.5
+
+# Split after newlines and closing '>' so HTML bodies (a single JSON string)
+# still diff at tag granularity. Joining the tokens gives back the input.
+_TOKEN_RE = re.compile(r"(?<=[\n>])")
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.split(text) if token]
+
+
+def make_delta(base_text: str, text: str) -> str:
+    """
+    Returns a JSON delta turning `base_text` into `text`: a list of
+    [start, end] token ranges copied from the base and literal strings.
+    """
+    base_tokens = _tokenize(base_text)
+    tokens = _tokenize(text)
+    matcher = difflib.SequenceMatcher(None, base_tokens, tokens, autojunk=False)
+    ops = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(tokens[j1:j2]))
+    return serializer.dumps(ops)
+
+
+def apply_delta(base_text: str, delta: str) -> str:
+    base_tokens = _tokenize(base_text)
+    return "".join(
+        "".join(base_tokens[op[0] : op[1]]) if isinstance(op, list) else op
+        for op in serializer.loads(delta)
+    )
@@ -7,8 +7,23 @@ from typing import List, Dict, Any, Optional, Tuple
 import logging
 import bleach  # ADD THIS LINE
 import os
+import re
 from . import queries
+from .content_delta import (
+    MAX_DELTA_RATIO,
+    SNAPSHOT_INTERVAL,
+    apply_delta,
+    make_delta,
+)
+from .document_store import (
+    DOCUMENT_COLUMNS,
+    decode_document,
+    encode_document,
+    is_empty_inline,
+)
+from .serp_snapshots import join_serp_result, serp_params_hash, split_serp_result
 from backend.app_config.manager import ConfigManager
+from backend.core import serializer
 
 ALLOWED_ATTRIBUTES_DB = {
     "*": ["id", "class"],
@@ -57,6 +72,9 @@ ALLOWED_ATTRIBUTES.update(
 )
 
 DB_FILE = "data/opportunities.db"
+# Stays under SQLite's default bound-parameter limit (999 on older builds),
+# leaving room for the non-IN parameters of a statement.
+SQLITE_MAX_VARIABLES = 900
 
 
 class DatabaseManager:
@@ -91,6 +109,36 @@ class DatabaseManager:
 
         self.logger = logging.getLogger(self.__class__.__name__)
         self._thread_local = threading.local()
+        self._client_settings_listeners: List[Any] = []
+        self._opportunities_added_listeners: List[Any] = []
+
+    def add_client_settings_listener(self, callback):
+        """
+        Registers `callback(client_id)`, called after a client's settings are
+        written, so caches derived from them (e.g. orchestrators) can be dropped.
+        """
+        self._client_settings_listeners.append(callback)
+
+    def _notify_client_settings_changed(self, client_id: str):
+        for callback in self._client_settings_listeners:
+            try:
+                callback(client_id)
+            except Exception as e:
+                self.logger.error(f"Client settings listener failed: {e}")
+
+    def add_opportunities_added_listener(self, callback):
+        """
+        Registers `callback(client_id, keywords)`, called after `add_opportunities`
+        commits, so in-memory keyword indexes can be updated incrementally.
+        """
+        self._opportunities_added_listeners.append(callback)
+
+    def _notify_opportunities_added(self, client_id: str, keywords: List[str]):
+        for callback in self._opportunities_added_listeners:
+            try:
+                callback(client_id, keywords)
+            except Exception as e:
+                self.logger.error(f"Opportunities listener failed: {e}")
 
     def initialize(self):
         """Connects to the DB, creates tables, applies migrations, and ensures default client exists."""
@@ -112,6 +160,8 @@ class DatabaseManager:
                 conn.executescript(full_schema_script)
 
             self._apply_migrations_from_files()
+            self.move_inline_documents()
+            self.compact_content_history()
             self._ensure_default_client_exists(conn)  # Add this line
             self.logger.info("Database initialized.")
         finally:
@@ -234,10 +284,138 @@ class DatabaseManager:
         finally:
             self._close_conn()  # Ensure connection is closed after migrations
 
+    @staticmethod
+    def _projection(projection: str) -> str:
+        """Returns the column list for a named opportunity projection."""
+        try:
+            return queries.OPPORTUNITY_PROJECTIONS[projection]
+        except KeyError:
+            raise ValueError(
+                f"Unknown opportunity projection '{projection}'. "
+                f"Expected one of: {', '.join(queries.OPPORTUNITY_PROJECTIONS)}."
+            )
+
+    @staticmethod
+    def _chunked(values: List[Any], size: int = SQLITE_MAX_VARIABLES):
+        """Yields slices of `values` small enough to bind as IN (...) parameters."""
+        for start in range(0, len(values), size):
+            yield values[start : start + size]
+
+    def _save_documents(self, conn, opportunity_id: int, documents: Dict[str, Any]):
+        """
+        Writes large JSON documents for an opportunity to opportunity_documents
+        (compressed), inside the caller's transaction. A None value removes the
+        document. Saving ai_content_json also refreshes the promoted article_title.
+        """
+        now = datetime.now().isoformat()
+        for doc_type, value in documents.items():
+            text = value if isinstance(value, str) else serializer.dumps(value)
+            if is_empty_inline(text):
+                conn.execute(
+                    queries.DELETE_OPPORTUNITY_DOCUMENT, (opportunity_id, doc_type)
+                )
+                continue
+            codec, payload = encode_document(text)
+            conn.execute(
+                queries.UPSERT_OPPORTUNITY_DOCUMENT,
+                (opportunity_id, doc_type, codec, payload, len(text), now),
+            )
+        if "ai_content_json" in documents:
+            ai_content = documents["ai_content_json"]
+            if isinstance(ai_content, str):
+                try:
+                    ai_content = serializer.loads(ai_content)
+                except json.JSONDecodeError:
+                    ai_content = None
+            title = ai_content.get("meta_title") if isinstance(ai_content, dict) else None
+            conn.execute(queries.UPDATE_OPPORTUNITY_ARTICLE_TITLE, (title, opportunity_id))
+
+    def _load_documents(
+        self, opportunity_ids: List[int], doc_types: List[str]
+    ) -> Dict[int, Dict[str, str]]:
+        """Returns {opportunity_id: {doc_type: json_text}} for the requested documents."""
+        documents: Dict[int, Dict[str, str]] = {}
+        if not opportunity_ids or not doc_types:
+            return documents
+        conn = self._get_conn()
+        for chunk in self._chunked(list(opportunity_ids), SQLITE_MAX_VARIABLES - len(doc_types)):
+            query = queries.SELECT_OPPORTUNITY_DOCUMENTS.format(
+                id_placeholders=",".join("?" for _ in chunk),
+                type_placeholders=",".join("?" for _ in doc_types),
+            )
+            for row in conn.execute(query, list(chunk) + list(doc_types)):
+                documents.setdefault(row["opportunity_id"], {})[row["doc_type"]] = (
+                    decode_document(row["codec"], row["data"])
+                )
+        return documents
+
+    def get_opportunity_document(self, opportunity_id: int, doc_type: str) -> Any:
+        """Loads and parses a single large document (e.g. 'blueprint_data') on demand."""
+        if doc_type not in DOCUMENT_COLUMNS:
+            raise ValueError(f"Unknown opportunity document '{doc_type}'.")
+        text = self._load_documents([opportunity_id], [doc_type]).get(
+            opportunity_id, {}
+        ).get(doc_type)
+        return serializer.loads(text) if text is not None else None
+
+    def move_inline_documents(self, batch_size: int = 200) -> int:
+        """
+        Moves document columns still stored inline on opportunities into
+        opportunity_documents, compressing them, and empties the inline values.
+        Runs on startup; a no-op once every row has been moved. Returns the
+        number of rows moved.
+        """
+        conn = self._get_conn()
+        has_inline = " OR ".join(
+            f"({col} IS NOT NULL AND {col} NOT IN ('', 'null'))"
+            for col in DOCUMENT_COLUMNS
+        )
+        select_query = (
+            f"SELECT id, {', '.join(DOCUMENT_COLUMNS)} FROM opportunities "
+            f"WHERE {has_inline} LIMIT ?"
+        )
+        clear_query = (
+            "UPDATE opportunities SET full_data = '', "
+            + ", ".join(f"{col} = NULL" for col in DOCUMENT_COLUMNS if col != "full_data")
+            + " WHERE id = ?"
+        )
+        moved = 0
+        while True:
+            with conn:
+                rows = conn.execute(select_query, (batch_size,)).fetchall()
+                if not rows:
+                    break
+                for row in rows:
+                    self._save_documents(
+                        conn,
+                        row["id"],
+                        {
+                            col: row[col]
+                            for col in DOCUMENT_COLUMNS
+                            if not is_empty_inline(row[col])
+                        },
+                    )
+                    conn.execute(clear_query, (row["id"],))
+            moved += len(rows)
+        if moved:
+            self.logger.info(
+                f"Moved inline documents for {moved} opportunities to opportunity_documents."
+            )
+            # Reclaim the overflow pages the inline blobs occupied.
+            conn.execute("VACUUM")
+        return moved
+
     def _deserialize_rows(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
         """Deserializes JSON strings from database rows into a clean dictionary."""
         results = []
 
+        # Document columns in the projection are loaded from opportunity_documents.
+        row_keys = rows[0].keys() if rows else []
+        doc_columns = [c for c in DOCUMENT_COLUMNS if c in row_keys]
+        documents = {}
+        if doc_columns and "id" in row_keys:
+            documents = self._load_documents([row["id"] for row in rows], doc_columns)
+
         json_keys = [
             "blueprint_data",
             "ai_content_json",
@@ -261,12 +439,18 @@ class DatabaseManager:
 
         for row in rows:
             final_item = dict(row)
+            row_documents = documents.get(final_item.get("id"), {})
+            for col in doc_columns:
+                if col in row_documents:
+                    final_item[col] = row_documents[col]
+                elif is_empty_inline(final_item[col]):
+                    final_item[col] = None
 
             # Deserialize all JSON fields first
             for key in json_keys:
                 if key in final_item and isinstance(final_item[key], str):
                     try:
-                        final_item[key] = json.loads(final_item[key])
+                        final_item[key] = serializer.loads(final_item[key])
                     except json.JSONDecodeError:
                         self.logger.warning(
                             f"Failed to parse JSON for key '{key}' on row ID {final_item.get('id')}. Leaving as raw string."
@@ -306,7 +490,7 @@ class DatabaseManager:
             # Deserialize search_volume_trend_json if present in new column
             if isinstance(final_item.get("search_volume_trend_json"), str):
                 try:
-                    final_item["search_volume_trend"] = json.loads(
+                    final_item["search_volume_trend"] = serializer.loads(
                         final_item["search_volume_trend_json"]
                     )
                 except json.JSONDecodeError:
@@ -323,7 +507,7 @@ class DatabaseManager:
             # Deserialize competitor_social_media_tags_json
             if isinstance(final_item.get("competitor_social_media_tags_json"), str):
                 try:
-                    final_item["competitor_social_media_tags"] = json.loads(
+                    final_item["competitor_social_media_tags"] = serializer.loads(
                         final_item["competitor_social_media_tags_json"]
                     )
                 except json.JSONDecodeError:
@@ -335,7 +519,7 @@ class DatabaseManager:
             # Deserialize competitor_page_timing_json
             if isinstance(final_item.get("competitor_page_timing_json"), str):
                 try:
-                    final_item["competitor_page_timing"] = json.loads(
+                    final_item["competitor_page_timing"] = serializer.loads(
                         final_item["competitor_page_timing_json"]
                     )
                 except json.JSONDecodeError:
@@ -357,7 +541,7 @@ class DatabaseManager:
                 final_item.get("monthly_searches_json"), str
             ):  # This is from Task 1.2
                 try:
-                    final_item["monthly_searches"] = json.loads(
+                    final_item["monthly_searches"] = serializer.loads(
                         final_item["monthly_searches_json"]
                     )
                 except json.JSONDecodeError:
@@ -391,8 +575,8 @@ class DatabaseManager:
                 INSERT INTO opportunities (
                     keyword, client_id, status, date_added, date_processed, 
                     strategic_score, keyword_info, keyword_properties, 
-                    search_intent_info, serp_overview, score_breakdown, ai_content_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    search_intent_info, score_breakdown, full_data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '')
             """,
                 (
                     opportunity_data.get("keyword"),
@@ -401,15 +585,22 @@ class DatabaseManager:
                     opportunity_data.get("date_added", datetime.now().isoformat()),
                     opportunity_data.get("date_processed"),
                     opportunity_data.get("strategic_score"),
-                    json.dumps(opportunity_data.get("keyword_info")),
-                    json.dumps(opportunity_data.get("keyword_properties")),
-                    json.dumps(opportunity_data.get("search_intent_info")),
-                    json.dumps(opportunity_data.get("serp_overview")),
-                    json.dumps(opportunity_data.get("score_breakdown")),
-                    json.dumps(opportunity_data.get("ai_content")),
+                    serializer.dumps(opportunity_data.get("keyword_info")),
+                    serializer.dumps(opportunity_data.get("keyword_properties")),
+                    serializer.dumps(opportunity_data.get("search_intent_info")),
+                    serializer.dumps(opportunity_data.get("score_breakdown")),
                 ),
             )
-            return cursor.lastrowid
+            opportunity_id = cursor.lastrowid
+            self._save_documents(
+                conn,
+                opportunity_id,
+                {
+                    "serp_overview": opportunity_data.get("serp_overview"),
+                    "ai_content_json": opportunity_data.get("ai_content"),
+                },
+            )
+            return opportunity_id
 
     def add_opportunities(
         self, opportunities: List[Dict[str, Any]], client_id: str, run_id: int
@@ -442,7 +633,7 @@ class DatabaseManager:
                             keyword_properties.get("keyword_difficulty"),
                             keyword_info.get("cpc"),
                             keyword_info.get("competition"),
-                            json.dumps(keyword_info.get("search_volume_trend")),
+                            serializer.dumps(keyword_info.get("search_volume_trend")),
                             search_intent_info.get("main_intent"),
                             keyword_properties.get("core_keyword"),
                             keyword_id,
@@ -461,7 +652,7 @@ class DatabaseManager:
                             keyword_properties.get("keyword_difficulty"),
                             keyword_info.get("cpc"),
                             keyword_info.get("competition"),
-                            json.dumps(keyword_info.get("search_volume_trend")),
+                            serializer.dumps(keyword_info.get("search_volume_trend")),
                             search_intent_info.get("main_intent"),
                             keyword_properties.get("core_keyword"),
                         ),
@@ -477,7 +668,7 @@ class DatabaseManager:
                 if opportunity_row:
                     # Update existing opportunity
                     history = (
-                        json.loads(opportunity_row["metrics_history"])
+                        serializer.loads(opportunity_row["metrics_history"])
                         if opportunity_row["metrics_history"]
                         else []
                     )
@@ -499,7 +690,7 @@ class DatabaseManager:
                     """,
                         (
                             datetime.now().isoformat(),
-                            json.dumps(history),
+                            serializer.dumps(history),
                             opportunity_row["id"],
                         ),
                     )
@@ -509,7 +700,7 @@ class DatabaseManager:
                     cpc_val = keyword_info.get("cpc")
                     competition_val = keyword_info.get("competition")
                     main_intent_val = search_intent_info.get("main_intent")
-                    search_volume_trend_json_val = json.dumps(
+                    search_volume_trend_json_val = serializer.dumps(
                         keyword_info.get("search_volume_trend")
                     )
 
@@ -525,12 +716,12 @@ class DatabaseManager:
                         None,
                     )
                     competitor_social_media_tags_json_val = (
-                        json.dumps(top_competitor.get("social_media_tags", {}))
+                        serializer.dumps(top_competitor.get("social_media_tags", {}))
                         if top_competitor
                         else None
                     )
                     competitor_page_timing_json_val = (
-                        json.dumps(top_competitor.get("page_timing", {}))
+                        serializer.dumps(top_competitor.get("page_timing", {}))
                         if top_competitor
                         else None
                     )
@@ -560,26 +751,26 @@ class DatabaseManager:
                             opp.get("strategic_score"),
                             opp.get("blog_qualification_status"),
                             opp.get("blog_qualification_reason"),
-                            json.dumps(keyword_info),
-                            json.dumps(keyword_properties),
-                            json.dumps(search_intent_info),
-                            json.dumps(opp.get("serp_overview")),
-                            json.dumps(opp.get("score_breakdown")),
-                            json.dumps(opp.get("ai_content")),
-                            json.dumps(opp.get("keyword_info_normalized_with_bing")),
-                            json.dumps(
+                            serializer.dumps(keyword_info),
+                            serializer.dumps(keyword_properties),
+                            serializer.dumps(search_intent_info),
+                            None,  # serp_overview: stored in opportunity_documents
+                            serializer.dumps(opp.get("score_breakdown")),
+                            None,  # ai_content_json: stored in opportunity_documents
+                            serializer.dumps(opp.get("keyword_info_normalized_with_bing")),
+                            serializer.dumps(
                                 opp.get("keyword_info_normalized_with_clickstream")
                             ),
-                            json.dumps(keyword_info.get("monthly_searches")),
+                            serializer.dumps(keyword_info.get("monthly_searches")),
                             opp.get("traffic_value", 0),
                             opp.get("serp_info", {}).get("check_url"),
-                            json.dumps(opp.get("related_keywords")),
-                            json.dumps(keyword_info.get("categories")),
+                            serializer.dumps(opp.get("related_keywords")),
+                            serializer.dumps(keyword_info.get("categories")),
                             keyword_properties.get("core_keyword"),
                             datetime.now().isoformat(),
-                            json.dumps([]),
+                            serializer.dumps([]),
                             keyword_id,
-                            json.dumps(opp),
+                            "",  # full_data: stored in opportunity_documents
                             cpc_val,  # NEW DIRECT COLUMN
                             competition_val,  # NEW DIRECT COLUMN
                             main_intent_val,  # NEW DIRECT COLUMN
@@ -589,15 +780,40 @@ class DatabaseManager:
                             opp.get("social_media_posts_status", "draft"),
                         ),
                     )
+                    self._save_documents(
+                        conn,
+                        cursor.lastrowid,
+                        {
+                            "full_data": opp,
+                            "serp_overview": opp.get("serp_overview"),
+                            "ai_content_json": opp.get("ai_content"),
+                        },
+                    )
 
-            return cursor.rowcount
+            rowcount = cursor.rowcount
+
+        self._notify_opportunities_added(
+            client_id,
+            [
+                opp["keyword"]
+                for opp in opportunities
+                if opp.get("keyword")
+                and opp.get("status", "pending") not in ("rejected", "failed")
+            ],
+        )
+        return rowcount
 
-    def get_opportunity_queue(self, client_id: str = "default") -> List[Dict[str, Any]]:
+    def get_opportunity_queue(
+        self, client_id: str = "default", projection: str = "full"
+    ) -> List[Dict[str, Any]]:
         """Retrieves all pending opportunities for a specific client."""
+        query = queries.SELECT_PENDING_OPPORTUNITIES.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_PENDING_OPPORTUNITIES, (client_id,))
+            cursor.execute(query, (client_id,))
             return self._deserialize_rows(cursor.fetchall())
 
     def get_all_opportunities(
@@ -606,11 +822,15 @@ class DatabaseManager:
         params: Dict[str, Any],
         summary: bool = False,
         select_columns: str = None,
+        projection: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Retrieves keyword opportunities for a client, supporting filtering, sorting, and pagination.
         If summary is True, only essential fields for the table view are returned.
+        A named `projection` takes precedence over `select_columns`.
         """
+        if projection is not None:
+            select_columns = self._projection(projection)
         conn = self._get_conn()
         limit = int(params.get("limit", 20))
         page = int(params.get("page", 1))
@@ -621,9 +841,9 @@ class DatabaseManager:
             "date_added": "date_added",
             "keyword": "keyword",
             "status": "status",
-            "search_volume": "JSON_EXTRACT(full_data, '$.keyword_info.search_volume')",
-            "keyword_difficulty": "JSON_EXTRACT(full_data, '$.keyword_properties.keyword_difficulty')",
-            "cpc": "JSON_EXTRACT(full_data, '$.keyword_info.cpc')",
+            "search_volume": "JSON_EXTRACT(keyword_info, '$.search_volume')",
+            "keyword_difficulty": "JSON_EXTRACT(keyword_properties, '$.keyword_difficulty')",
+            "cpc": "cpc",
         }
         sort_by = sort_by_map.get(params.get("sort_by"), "date_added")
         sort_direction = "ASC" if params.get("sort_direction") == "asc" else "DESC"
@@ -649,10 +869,13 @@ class DatabaseManager:
         select_columns = (
             select_columns
             if select_columns
-            else "id, keyword, status, date_added, strategic_score, search_volume, keyword_difficulty, cpc, competition, main_intent, search_volume_trend_json, competitor_social_media_tags_json, competitor_page_timing_json, blog_qualification_status, latest_job_id, cluster_name, score_breakdown, full_data"
+            else "id, keyword, status, date_added, strategic_score, search_volume, keyword_difficulty, cpc, competition, main_intent, search_volume_trend_json, competitor_social_media_tags_json, competitor_page_timing_json, blog_qualification_status, latest_job_id, cluster_name, score_breakdown, keyword_info, keyword_properties"
         )
-        if summary and "full_data" not in select_columns:
-            select_columns += ", full_data"
+        if summary:
+            # search_volume / keyword_difficulty are derived from these.
+            for column in ("keyword_info", "keyword_properties"):
+                if column not in select_columns and select_columns != "*":
+                    select_columns += f", {column}"
 
         final_query = f"SELECT {select_columns} FROM opportunities WHERE {where_clause} ORDER BY {sort_by} {sort_direction} LIMIT ? OFFSET ?"
 
@@ -662,34 +885,81 @@ class DatabaseManager:
             cursor.execute(final_query, paged_values)
             opportunities = self._deserialize_rows(cursor.fetchall())
 
-        # Manually extract and add search_volume and keyword_difficulty for the frontend
+        # search_volume / keyword_difficulty are derived from keyword_info and
+        # keyword_properties in _deserialize_rows; full_data is only a fallback
+        # for callers that select it explicitly.
         for opp in opportunities:
-            try:
-                if opp.get("full_data"):
-                    full_data = opp["full_data"]
-                    opp["search_volume"] = full_data.get("keyword_info", {}).get(
-                        "search_volume"
-                    )
-                    opp["keyword_difficulty"] = full_data.get(
-                        "keyword_properties", {}
-                    ).get("keyword_difficulty")
-            except (KeyError, TypeError):
-                opp["search_volume"] = None
-                opp["keyword_difficulty"] = None
+            full_data = opp.get("full_data")
+            if not isinstance(full_data, dict):
+                continue
+            if opp.get("search_volume") is None:
+                opp["search_volume"] = (full_data.get("keyword_info") or {}).get(
+                    "search_volume"
+                )
+            if opp.get("keyword_difficulty") is None:
+                opp["keyword_difficulty"] = (
+                    full_data.get("keyword_properties") or {}
+                ).get("keyword_difficulty")
 
         return opportunities, total_count
 
-    def get_opportunity_by_id(self, opportunity_id: int) -> Optional[Dict[str, Any]]:
+    def get_opportunity_by_id(
+        self, opportunity_id: int, projection: str = "full"
+    ) -> Optional[Dict[str, Any]]:
         """Retrieves a single opportunity by its primary key ID."""
+        query = queries.SELECT_OPPORTUNITY_BY_ID.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_OPPORTUNITY_BY_ID, (opportunity_id,))
+            cursor.execute(query, (opportunity_id,))
             row = cursor.fetchone()
             if row:
                 return self._deserialize_rows([row])[0]
         return None
 
+    def get_opportunity_version(self, opportunity_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Returns {id, client_id, version} for an opportunity without touching
+        its JSON columns or documents, or None if it does not exist.
+        """
+        conn = self._get_conn()
+        row = conn.execute(
+            queries.SELECT_OPPORTUNITY_VERSION, (opportunity_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def get_opportunities_by_ids(
+        self,
+        opportunity_ids: List[int],
+        client_id: Optional[str] = None,
+        projection: str = "scoring",
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves several opportunities with one query per chunk of IDs,
+        selecting only the `projection` columns. Results follow the order of
+        `opportunity_ids`; missing IDs (or other clients' rows, if `client_id`
+        is given) are skipped.
+        """
+        if not opportunity_ids:
+            return []
+        columns = self._projection(projection)
+        rows_by_id = {}
+        conn = self._get_conn()
+        with conn:
+            for chunk in self._chunked(opportunity_ids):
+                placeholders = ",".join("?" for _ in chunk)
+                query = f"SELECT {columns} FROM opportunities WHERE id IN ({placeholders})"
+                params = list(chunk)
+                if client_id is not None:
+                    query += " AND client_id = ?"
+                    params.append(client_id)
+                for row in conn.execute(query, params).fetchall():
+                    rows_by_id[row["id"]] = row
+        ordered = [rows_by_id[i] for i in dict.fromkeys(opportunity_ids) if i in rows_by_id]
+        return self._deserialize_rows(ordered)
+
     def get_opportunity_summary_by_id(
         self, opportunity_id: int
     ) -> Optional[Dict[str, Any]]:
@@ -709,28 +979,72 @@ class DatabaseManager:
                 return dict(row)
             return None
 
-    def get_opportunity_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+    def get_opportunity_by_slug(
+        self, slug: str, projection: str = "full"
+    ) -> Optional[Dict[str, Any]]:
         """Retrieves a single opportunity by its URL slug."""
+        query = queries.SELECT_OPPORTUNITY_BY_SLUG.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_OPPORTUNITY_BY_SLUG, (slug,))
+            cursor.execute(query, (slug,))
             row = cursor.fetchone()
             if row:
                 return self._deserialize_rows([row])[0]
         return None
 
-    def search_opportunities(self, client_id: str, query: str) -> List[Dict[str, Any]]:
-        """Searches for opportunities by keyword for a specific client."""
+    @staticmethod
+    def _build_fts_query(query: str) -> Optional[str]:
+        """
+        Turns free text into a safe FTS5 expression: every word becomes a quoted
+        prefix term and all terms must match (e.g. 'best run' -> "best"* "run"*).
+        """
+        terms = re.findall(r"\w+", query or "", flags=re.UNICODE)
+        if not terms:
+            return None
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def search_assets(
+        self,
+        client_id: str,
+        query: str,
+        asset_type: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked (bm25) prefix search across opportunities (keyword, core keyword,
+        cluster, article title) and discovery runs (seed keywords) using the
+        FTS5 search_index. `asset_type` restricts results to one kind.
+        """
+        fts_query = self._build_fts_query(query)
+        if not fts_query:
+            return []
         conn = self._get_conn()
         with conn:
-            cursor = conn.cursor()
-            search_term = f"%{query}%"
-            cursor.execute(
-                queries.SEARCH_OPPORTUNITIES_BY_KEYWORD, (client_id, search_term)
+            cursor = conn.execute(
+                queries.SEARCH_ASSETS_FTS,
+                (fts_query, client_id, asset_type, asset_type, limit),
             )
-            # No need for full deserialization as we are fetching simple columns
-            return [dict(row) for row in cursor.fetchall()]
+            results = []
+            for row in cursor.fetchall():
+                item = dict(row)
+                seeds = item.pop("seed_keywords")
+                item["seed_keywords"] = serializer.loads(seeds) if seeds else []
+                results.append(item)
+            return results
+
+    def search_opportunities(self, client_id: str, query: str) -> List[Dict[str, Any]]:
+        """Searches for opportunities by keyword for a specific client."""
+        return [
+            {
+                "id": hit["asset_id"],
+                "keyword": hit["keyword"],
+                "status": hit["opportunity_status"],
+            }
+            for hit in self.search_assets(client_id, query, asset_type="opportunity")
+        ]
 
     def get_published_articles_for_linking(
         self, client_id: str
@@ -795,6 +1109,40 @@ class DatabaseManager:
                     queries.UPDATE_OPPORTUNITY_STATUS, (new_status, opportunity_id)
                 )
 
+    def update_opportunity_status_bulk(
+        self,
+        opportunity_ids: List[int],
+        new_status: str,
+        client_id: Optional[str] = None,
+    ) -> int:
+        """
+        Sets `new_status` on many opportunities in one transaction, issuing one
+        UPDATE per chunk of IDs. When `client_id` is given, only that client's
+        rows are touched. Returns the number of rows updated.
+        """
+        if not opportunity_ids:
+            return 0
+        set_clause = "status = ?"
+        set_params: List[Any] = [new_status]
+        if new_status in ["generated", "analyzed", "failed"]:
+            set_clause += ", date_processed = ?"
+            set_params.append(datetime.now().isoformat())
+        client_clause = " AND client_id = ?" if client_id is not None else ""
+        client_params = [client_id] if client_id is not None else []
+
+        updated = 0
+        conn = self._get_conn()
+        with conn:
+            for chunk in self._chunked(opportunity_ids):
+                placeholders = ",".join("?" for _ in chunk)
+                cursor = conn.execute(
+                    f"UPDATE opportunities SET {set_clause} "
+                    f"WHERE id IN ({placeholders}){client_clause}",
+                    set_params + list(chunk) + client_params,
+                )
+                updated += cursor.rowcount
+        return updated
+
     def update_opportunity_workflow_state(
         self,
         opportunity_id: int,
@@ -820,9 +1168,9 @@ class DatabaseManager:
         """Stores the generated blueprint data and the URL slug for a specific opportunity."""
         conn = self._get_conn()
         with conn:
-            conn.execute(
-                queries.UPDATE_OPPORTUNITY_BLUEPRINT_AND_SLUG,
-                (json.dumps(blueprint_data), slug, opportunity_id),
+            conn.execute(queries.UPDATE_OPPORTUNITY_SLUG, (slug, opportunity_id))
+            self._save_documents(
+                conn, opportunity_id, {"blueprint_data": blueprint_data}
             )
 
     def update_opportunity_ai_content(
@@ -848,12 +1196,10 @@ class DatabaseManager:
         with conn:
             conn.execute(
                 queries.UPDATE_OPPORTUNITY_AI_CONTENT,
-                (
-                    json.dumps(ai_content_data),
-                    ai_model,
-                    datetime.now().isoformat(),
-                    opportunity_id,
-                ),
+                (ai_model, datetime.now().isoformat(), opportunity_id),
+            )
+            self._save_documents(
+                conn, opportunity_id, {"ai_content_json": ai_content_data}
             )
 
     def update_opportunity_images(
@@ -886,7 +1232,7 @@ class DatabaseManager:
                 (
                     featured_image_url,
                     featured_image_local_path,
-                    json.dumps(in_article_images_data),
+                    serializer.dumps(in_article_images_data),
                     opportunity_id,
                 ),
             )
@@ -898,10 +1244,7 @@ class DatabaseManager:
         self.logger.info(f"Opportunity {opportunity_id}: Updating full_data field.")
         conn = self._get_conn()
         with conn:
-            conn.execute(
-                "UPDATE opportunities SET full_data = ? WHERE id = ?",
-                (json.dumps(full_data), opportunity_id),
-            )
+            self._save_documents(conn, opportunity_id, {"full_data": full_data})
 
     def update_opportunity_scores(
         self,
@@ -918,12 +1261,10 @@ class DatabaseManager:
         with conn:
             conn.execute(
                 queries.UPDATE_OPPORTUNITY_SCORES,
-                (
-                    strategic_score,
-                    json.dumps(score_breakdown),
-                    json.dumps(blueprint_data) if blueprint_data else None,
-                    opportunity_id,
-                ),
+                (strategic_score, serializer.dumps(score_breakdown), opportunity_id),
+            )
+            self._save_documents(
+                conn, opportunity_id, {"blueprint_data": blueprint_data or None}
             )
 
     def update_opportunity_final_package(
@@ -935,9 +1276,8 @@ class DatabaseManager:
         )
         conn = self._get_conn()
         with conn:
-            conn.execute(
-                queries.UPDATE_OPPORTUNITY_FINAL_PACKAGE,
-                (json.dumps(final_package), opportunity_id),
+            self._save_documents(
+                conn, opportunity_id, {"final_package_json": final_package}
             )
 
     def add_client(
@@ -1007,6 +1347,7 @@ class DatabaseManager:
                 self.logger.info(
                     f"Initialized default qualification settings for client '{client_name}' ({client_id})."
                 )
+            self._notify_client_settings_changed(client_id)
             return True
         except sqlite3.IntegrityError:
             self.logger.warning(f"Client with ID '{client_id}' already exists.")
@@ -1025,12 +1366,17 @@ class DatabaseManager:
             cursor.execute(queries.SELECT_ALL_CLIENTS)
             return [dict(row) for row in cursor.fetchall()]
 
-    def get_processed_opportunities(self, client_id: str) -> List[Dict[str, Any]]:
+    def get_processed_opportunities(
+        self, client_id: str, projection: str = "full"
+    ) -> List[Dict[str, Any]]:
         """Retrieves all opportunities with a generated blueprint for a specific client."""
+        query = queries.SELECT_PROCESSED_OPPORTUNITIES.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_PROCESSED_OPPORTUNITIES, (client_id,))
+            cursor.execute(query, (client_id,))
             return self._deserialize_rows(cursor.fetchall())
 
     def get_client_settings(self, client_id: str) -> Dict[str, Any]:
@@ -1205,87 +1551,124 @@ class DatabaseManager:
                 self.logger.info(
                     f"No valid client settings found to update for {client_id}."
                 )
+        self._notify_client_settings_changed(client_id)
 
-    def get_all_opportunities_for_export(self) -> List[Dict[str, Any]]:
+    def get_all_opportunities_for_export(
+        self, projection: str = "full"
+    ) -> List[Dict[str, Any]]:
         """Retrieves all opportunities for all clients from the database."""
+        query = queries.SELECT_ALL_OPPORTUNITIES_FOR_EXPORT.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_ALL_OPPORTUNITIES_FOR_EXPORT)
+            cursor.execute(query)
             return self._deserialize_rows(cursor.fetchall())
 
+    def get_client_stats(self, client_id: str) -> Dict[str, Any]:
+        """
+        Reads the trigger-maintained aggregates for a client: opportunity count,
+        counts by status, traffic value and API cost totals.
+        """
+        conn = self._get_conn()
+        with conn:
+            row = conn.execute(queries.SELECT_CLIENT_STATS, (client_id,)).fetchone()
+        if row is None:
+            return {
+                "total_opportunities": 0,
+                "status_counts": {},
+                "total_traffic_value": 0,
+                "opportunities_api_cost": 0.0,
+                "discovery_runs_api_cost": 0.0,
+                "reconciled_at": None,
+            }
+        stats = dict(row)
+        stats["status_counts"] = {
+            status: count
+            for status, count in serializer.loads(stats["status_counts"] or "{}").items()
+            if count
+        }
+        return stats
+
+    def reconcile_client_stats(self, client_id: Optional[str] = None) -> List[str]:
+        """
+        Recomputes client_stats from the base tables for one client (or all) and
+        returns the IDs whose stored aggregates had drifted.
+        """
+        conn = self._get_conn()
+        with conn:
+            if client_id is None:
+                client_ids = [
+                    row[0] for row in conn.execute(queries.SELECT_CLIENT_IDS_FOR_STATS)
+                ]
+            else:
+                client_ids = [client_id]
+
+        drifted = []
+        fields = (
+            "total_opportunities",
+            "status_counts",
+            "total_traffic_value",
+            "opportunities_api_cost",
+            "discovery_runs_api_cost",
+        )
+        for cid in client_ids:
+            before = self.get_client_stats(cid)
+            with conn:
+                conn.execute(queries.RECONCILE_CLIENT_STATS, {"client_id": cid})
+            after = self.get_client_stats(cid)
+            if any(
+                before[f] != after[f]
+                if f == "status_counts"
+                else abs((before[f] or 0) - (after[f] or 0)) > 1e-6
+                for f in fields
+            ):
+                drifted.append(cid)
+        if drifted:
+            self.logger.warning(f"Reconciled drifted client_stats for: {drifted}")
+        return drifted
+
     def get_dashboard_stats(self, client_id: str) -> Dict[str, Any]:
         """Retrieves statistics for the dashboard UI."""
+        status_counts = self.get_client_stats(client_id)["status_counts"]
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-
-            # Get counts by status
-            cursor.execute(queries.COUNT_OPPORTUNITIES_BY_STATUS, (client_id,))
-            status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
-
-            # Get recent items
             cursor.execute(queries.SELECT_RECENTLY_GENERATED, (client_id,))
             recent_items = [dict(row) for row in cursor.fetchall()]
 
-            return {"status_counts": status_counts, "recent_items": recent_items}
+        return {"status_counts": status_counts, "recent_items": recent_items}
 
     def get_total_api_cost(self, client_id: str) -> float:
-        """Calculates the total API cost for a client by summing costs from both opportunities and discovery runs."""
-        conn = self._get_conn()
-        with conn:
-            cursor = conn.cursor()
-            
-            # Sum cost from opportunities
-            cursor.execute(
-                "SELECT SUM(total_api_cost) FROM opportunities WHERE client_id = ?",
-                (client_id,),
-            )
-            opportunities_cost = cursor.fetchone()[0] or 0.0
-            
-            # Sum cost from discovery runs
-            cursor.execute(
-                "SELECT SUM(total_api_cost) FROM discovery_runs WHERE client_id = ?",
-                (client_id,),
-            )
-            runs_cost = cursor.fetchone()[0] or 0.0
-            
-            return opportunities_cost + runs_cost
+        """Total API cost for a client across opportunities and discovery runs."""
+        stats = self.get_client_stats(client_id)
+        return stats["opportunities_api_cost"] + stats["discovery_runs_api_cost"]
 
     def get_dashboard_data(self, client_id: str) -> Dict[str, Any]:
         """Retrieves aggregated data for the main dashboard UI."""
+        # KPIs and funnel counts come from the single client_stats row.
+        stats = self.get_client_stats(client_id)
+        status_counts = stats["status_counts"]
+        total_opportunities = stats["total_opportunities"]
+        content_generated = status_counts.get("generated", 0)
+
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
 
             # 1. KPIs
-            cursor.execute(
-                "SELECT COUNT(*) FROM opportunities WHERE client_id = ?", (client_id,)
-            )
-            total_opportunities = cursor.fetchone()[0]
-            cursor.execute(
-                "SELECT COUNT(*) FROM opportunities WHERE client_id = ? AND status = 'generated'",
-                (client_id,),
-            )
-            content_generated = cursor.fetchone()[0]
-            cursor.execute(
-                "SELECT SUM(traffic_value) FROM opportunities WHERE client_id = ?",
-                (client_id,),
-            )
-            total_traffic_value = cursor.fetchone()[0] or 0
-            total_api_cost = self.get_total_api_cost(client_id)
-
             kpis = {
                 "totalOpportunities": total_opportunities,
                 "contentGenerated": content_generated,
-                "totalTrafficValue": total_traffic_value,
-                "totalApiCost": total_api_cost,
+                "totalTrafficValue": stats["total_traffic_value"] or 0,
+                "totalApiCost": stats["opportunities_api_cost"]
+                + stats["discovery_runs_api_cost"],
             }
 
             # 2. Funnel and Stats Data
-            dashboard_stats = self.get_dashboard_stats(client_id)
-            status_counts = dashboard_stats.get("status_counts", {})
-            recent_items = dashboard_stats.get("recent_items", [])
+            cursor.execute(queries.SELECT_RECENTLY_GENERATED, (client_id,))
+            recent_items = [dict(row) for row in cursor.fetchall()]
 
             funnel_data = [
                 {"stage": "Total", "count": total_opportunities},
@@ -1326,9 +1709,8 @@ class DatabaseManager:
         )
         conn = self._get_conn()
         with conn:
-            conn.execute(
-                queries.UPDATE_OPPORTUNITY_WORDPRESS_PAYLOAD,
-                (json.dumps(wordpress_payload), opportunity_id),
+            self._save_documents(
+                conn, opportunity_id, {"wordpress_payload_json": wordpress_payload}
             )
 
     def get_api_cache(self, key: str) -> Optional[Dict[str, Any]]:
@@ -1340,7 +1722,7 @@ class DatabaseManager:
             if row:
                 # Check TTL during retrieval
                 if row["timestamp"] + (row["ttl_days"] * 86400) > time.time():
-                    return json.loads(row["data"])
+                    return serializer.loads(row["data"])
                 else:
                     self.logger.debug(f"Cache STALE for key: {key}")
                     self.delete_api_cache_by_key(key)  # Clean up stale entry
@@ -1352,7 +1734,7 @@ class DatabaseManager:
         with conn:
             conn.execute(
                 queries.INSERT_API_CACHE,
-                (key, json.dumps(value), time.time(), ttl_days),
+                (key, serializer.dumps(value), time.time(), ttl_days),
             )
         self.logger.debug(f"Cache SET for key: {key}")
 
@@ -1376,6 +1758,227 @@ class DatabaseManager:
             conn.execute(queries.DELETE_EXPIRED_API_CACHE, (time.time(),))
         self.logger.debug("Expired API cache entries cleaned up.")
 
+    # --- SERP Snapshot Methods ---
+
+    def _intern_serp_url(self, conn, url: str, domain: str, title: Optional[str]):
+        """Returns (url_id, interned_title), creating the url/domain rows if needed."""
+        row = conn.execute(queries.SELECT_SERP_URL, (url,)).fetchone()
+        if row:
+            return row["id"], row["title"]
+        conn.execute(queries.INSERT_DOMAIN, (domain,))
+        domain_id = conn.execute(queries.SELECT_DOMAIN_ID, (domain,)).fetchone()["id"]
+        conn.execute(queries.INSERT_SERP_URL, (url, domain_id, title))
+        row = conn.execute(queries.SELECT_SERP_URL, (url,)).fetchone()
+        return row["id"], row["title"]
+
+    def save_serp_snapshot(
+        self, params: Dict[str, Any], result: Dict[str, Any]
+    ) -> int:
+        """
+        Stores a SERP result as a new snapshot for its keyword and request
+        variant. Ranked URLs, domains and titles are interned. Returns the
+        snapshot ID.
+        """
+        payload, rankings = split_serp_result(result)
+        text = serializer.dumps(payload)
+        codec, data = encode_document(text)
+        conn = self._get_conn()
+        with conn:
+            cursor = conn.execute(
+                queries.INSERT_SERP_SNAPSHOT,
+                (
+                    params["keyword"],
+                    serp_params_hash(params),
+                    params.get("location_code"),
+                    params.get("language_code"),
+                    params.get("device"),
+                    datetime.now().isoformat(),
+                    result.get("se_results_count"),
+                    serializer.dumps(result.get("item_types") or []),
+                    codec,
+                    data,
+                    len(text),
+                ),
+            )
+            snapshot_id = cursor.lastrowid
+            for ranking in rankings:
+                url_id, interned_title = self._intern_serp_url(
+                    conn, ranking["url"], ranking["domain"], ranking["title"]
+                )
+                conn.execute(
+                    queries.INSERT_SERP_RANKING,
+                    (
+                        snapshot_id,
+                        ranking["position"],
+                        ranking["item_type"],
+                        ranking["rank_group"],
+                        ranking["rank_absolute"],
+                        url_id,
+                        ranking["title"] if ranking["title"] != interned_title else None,
+                    ),
+                )
+        return snapshot_id
+
+    def get_latest_serp_snapshot(
+        self, params: Dict[str, Any], max_age_days: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rebuilds the newest SERP result for this keyword and request variant
+        fetched within `max_age_days`, or returns None.
+        """
+        cutoff = datetime.fromtimestamp(time.time() - max_age_days * 86400).isoformat()
+        conn = self._get_conn()
+        row = conn.execute(
+            queries.SELECT_LATEST_SERP_SNAPSHOT,
+            (params["keyword"], serp_params_hash(params), cutoff),
+        ).fetchone()
+        if not row:
+            return None
+        payload = serializer.loads(decode_document(row["codec"], row["payload"]))
+        rankings = [
+            dict(r) for r in conn.execute(queries.SELECT_SERP_RANKINGS, (row["id"],))
+        ]
+        return join_serp_result(payload, rankings)
+
+    def get_serp_snapshot_history(self, keyword: str) -> List[Dict[str, Any]]:
+        """Lists stored SERP snapshots for a keyword (metadata only, newest first)."""
+        conn = self._get_conn()
+        snapshots = []
+        for row in conn.execute(queries.SELECT_SERP_SNAPSHOT_HISTORY, (keyword,)):
+            snapshot = dict(row)
+            snapshot["item_types"] = serializer.loads(snapshot["item_types"] or "[]")
+            snapshots.append(snapshot)
+        return snapshots
+
+    def get_domain_serp_rankings(
+        self, domain: str, max_rank: int = 3, client_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the keywords where `domain` ranks organically within `max_rank`
+        in the latest snapshot of each keyword, optionally limited to keywords
+        that are opportunities of `client_id`.
+        """
+        bare_domain = domain.lower().removeprefix("www.")
+        params: List[Any] = [max_rank, bare_domain, f"www.{bare_domain}"]
+        client_filter = ""
+        if client_id:
+            client_filter = (
+                "\n  AND s.keyword IN (SELECT keyword FROM opportunities WHERE client_id = ?)"
+            )
+            params.append(client_id)
+        conn = self._get_conn()
+        cursor = conn.execute(
+            queries.SELECT_DOMAIN_SERP_RANKINGS.format(client_filter=client_filter),
+            params,
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+    # --- Competitor Page Methods ---
+
+    def save_competitor_pages(self, pages: List[Dict[str, Any]]) -> None:
+        """
+        Stores parsed competitor pages (as built by FullCompetitorAnalyzer),
+        replacing any earlier copy of the same URL.
+        """
+        if not pages:
+            return
+        now = datetime.now().isoformat()
+        conn = self._get_conn()
+        with conn:
+            for page in pages:
+                text = serializer.dumps(
+                    {
+                        "headings": page.get("headings"),
+                        "main_content_text": page.get("main_content_text"),
+                        "full_content_markdown": page.get("full_content_markdown"),
+                    }
+                )
+                codec, data = encode_document(text)
+                conn.execute(
+                    queries.UPSERT_COMPETITOR_PAGE,
+                    (
+                        page["url"],
+                        page.get("domain") or "",
+                        now,
+                        1 if page.get("javascript") else 0,
+                        page.get("title"),
+                        page.get("word_count"),
+                        page.get("readability_score"),
+                        codec,
+                        data,
+                        len(text),
+                    ),
+                )
+
+    def get_fresh_competitor_pages(
+        self, urls: List[str], max_age_days: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns {url: page} for the stored competitor pages among `urls` that
+        were fetched within `max_age_days`.
+        """
+        pages: Dict[str, Dict[str, Any]] = {}
+        if not urls:
+            return pages
+        cutoff = datetime.fromtimestamp(time.time() - max_age_days * 86400).isoformat()
+        conn = self._get_conn()
+        for chunk in self._chunked(list(dict.fromkeys(urls)), SQLITE_MAX_VARIABLES - 1):
+            query = queries.SELECT_FRESH_COMPETITOR_PAGES.format(
+                placeholders=",".join("?" for _ in chunk)
+            )
+            for row in conn.execute(query, list(chunk) + [cutoff]):
+                page = serializer.loads(decode_document(row["codec"], row["data"]))
+                page.update(
+                    url=row["url"],
+                    fetched_at=row["fetched_at"],
+                    javascript=bool(row["javascript"]),
+                    title=row["title"],
+                    word_count=row["word_count"],
+                    readability_score=row["readability_score"],
+                )
+                pages[row["url"]] = page
+        return pages
+
+    # --- Crawl Domain Profile Methods ---
+
+    def record_crawl_outcomes(self, outcomes: List[Dict[str, Any]]) -> None:
+        """
+        Adds competitor fetch outcomes to their domains' crawl profiles. Each
+        outcome has domain, tier (1 or 2), success, seconds and cost.
+        """
+        if not outcomes:
+            return
+        now = datetime.now().isoformat()
+        conn = self._get_conn()
+        with conn:
+            for outcome in outcomes:
+                conn.execute(
+                    queries.RECORD_CRAWL_OUTCOME.format(tier=int(outcome["tier"])),
+                    (
+                        outcome["domain"],
+                        1 if outcome.get("success") else 0,
+                        outcome.get("seconds") or 0.0,
+                        outcome.get("cost") or 0.0,
+                        now,
+                    ),
+                )
+
+    def get_crawl_domain_profiles(
+        self, domains: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns {domain: profile row} for the domains that have a crawl profile."""
+        profiles: Dict[str, Dict[str, Any]] = {}
+        if not domains:
+            return profiles
+        conn = self._get_conn()
+        for chunk in self._chunked(list(dict.fromkeys(domains))):
+            query = queries.SELECT_CRAWL_DOMAIN_PROFILES.format(
+                placeholders=",".join("?" for _ in chunk)
+            )
+            for row in conn.execute(query, chunk):
+                profiles[row["domain"]] = dict(row)
+        return profiles
+
     # --- Discovery Run Methods ---
 
     def create_discovery_run(self, client_id: str, parameters: Dict[str, Any]) -> int:
@@ -1389,7 +1992,7 @@ class DatabaseManager:
                     client_id,
                     datetime.now().isoformat(),
                     "running",
-                    json.dumps(parameters),
+                    serializer.dumps(parameters),
                 ),
             )
             return cursor.lastrowid
@@ -1411,11 +2014,12 @@ class DatabaseManager:
                 queries.UPDATE_DISCOVERY_RUN_COMPLETED,
                 (
                     datetime.now().isoformat(),
-                    json.dumps(results_summary),
+                    serializer.dumps(results_summary),
                     total_cost,
                     run_id,
                 ),
             )
+            self._store_run_reason_counts(conn, run_id)
 
     def update_discovery_run_failed(self, run_id: int, error_message: str):
         """Marks a discovery run as failed and stores the error message."""
@@ -1449,9 +2053,11 @@ class DatabaseManager:
                 run = dict(row)
                 try:
                     if run.get("parameters"):
-                        run["parameters"] = json.loads(run["parameters"])
+                        run["parameters"] = serializer.loads(run["parameters"])
                     if run.get("results_summary"):
-                        run["results_summary"] = json.loads(run["results_summary"])
+                        run["results_summary"] = serializer.loads(run["results_summary"])
+                    if run.get("reason_counts"):
+                        run["reason_counts"] = serializer.loads(run["reason_counts"])
                 except json.JSONDecodeError:
                     self.logger.warning(
                         f"Failed to parse JSON for discovery run ID {run.get('id')}."
@@ -1470,9 +2076,11 @@ class DatabaseManager:
                 run = dict(row)
                 try:
                     if run.get("parameters"):
-                        run["parameters"] = json.loads(run["parameters"])
+                        run["parameters"] = serializer.loads(run["parameters"])
                     if run.get("results_summary"):
-                        run["results_summary"] = json.loads(run["results_summary"])
+                        run["results_summary"] = serializer.loads(run["results_summary"])
+                    if run.get("reason_counts"):
+                        run["reason_counts"] = serializer.loads(run["reason_counts"])
                 except json.JSONDecodeError:
                     self.logger.warning(
                         f"Failed to parse JSON for discovery run ID {run.get('id')}."
@@ -1486,24 +2094,90 @@ class DatabaseManager:
         with conn:
             conn.execute(queries.UPDATE_DISCOVERY_RUN_LOG_PATH, (log_path, run_id))
 
-    def get_keywords_for_run(self, run_id: int) -> List[Dict[str, Any]]:
+    def get_keywords_for_run(
+        self, run_id: int, projection: str = "full"
+    ) -> List[Dict[str, Any]]:
         """Retrieves all opportunities associated with a specific discovery run ID."""
+        query = queries.SELECT_KEYWORDS_FOR_RUN.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM opportunities WHERE run_id = ?", (run_id,))
+            cursor.execute(query, (run_id,))
             return self._deserialize_rows(cursor.fetchall())
 
     def get_keywords_for_run_by_reason(
-        self, run_id: int, reason: str
+        self, run_id: int, reason: str, projection: str = "full"
     ) -> List[Dict[str, Any]]:
         """Retrieves all opportunities associated with a specific discovery run ID that were disqualified for a specific reason."""
+        query = queries.SELECT_KEYWORDS_FOR_RUN_BY_REASON.format(
+            columns=self._projection(projection)
+        )
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
-            cursor.execute(queries.SELECT_KEYWORDS_FOR_RUN_BY_REASON, (run_id, reason))
+            cursor.execute(query, (run_id, reason))
             return self._deserialize_rows(cursor.fetchall())
 
+    def get_keywords_for_run_page(
+        self,
+        run_id: int,
+        page: int = 1,
+        limit: int = 50,
+        status: Optional[str] = None,
+        reason: Optional[str] = None,
+        projection: str = "run",
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Retrieves one page of a discovery run's opportunities, optionally
+        filtered by status and blog_qualification_reason, plus the total count.
+        """
+        filters, params = "", [run_id]
+        if status:
+            filters += " AND status = ?"
+            params.append(status)
+        if reason:
+            filters += " AND blog_qualification_reason = ?"
+            params.append(reason)
+        conn = self._get_conn()
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute(queries.COUNT_KEYWORDS_FOR_RUN.format(filters=filters), params)
+            total_count = cursor.fetchone()[0]
+            cursor.execute(
+                queries.SELECT_KEYWORDS_FOR_RUN_PAGE.format(
+                    columns=self._projection(projection), filters=filters
+                ),
+                params + [limit, (page - 1) * limit],
+            )
+            return self._deserialize_rows(cursor.fetchall()), total_count
+
+    def _store_run_reason_counts(self, conn, run_id: int) -> Dict[str, int]:
+        counts = {
+            row["reason"]: row["count"]
+            for row in conn.execute(queries.SELECT_RUN_REJECTION_REASON_COUNTS, (run_id,))
+        }
+        conn.execute(
+            queries.UPDATE_DISCOVERY_RUN_REASON_COUNTS, (serializer.dumps(counts), run_id)
+        )
+        return counts
+
+    def get_run_reason_counts(self, run_id: int) -> Dict[str, int]:
+        """
+        Returns {reason: count} for a run's keywords rejected at blog
+        qualification (whatever their current status) from
+        discovery_runs.reason_counts, recomputing it if it was cleared.
+        """
+        conn = self._get_conn()
+        with conn:
+            row = conn.execute(
+                queries.SELECT_DISCOVERY_RUN_REASON_COUNTS, (run_id,)
+            ).fetchone()
+            if row and row["reason_counts"]:
+                return serializer.loads(row["reason_counts"])
+            return self._store_run_reason_counts(conn, run_id)
+
     def search_discovery_runs(self, client_id: str, query: str) -> List[Dict[str, Any]]:
         """Searches for discovery runs by seed keywords or status for a specific client."""
         conn = self._get_conn()
@@ -1526,9 +2200,9 @@ class DatabaseManager:
             for row in cursor.fetchall():
                 run = dict(row)
                 if run.get("parameters"):
-                    run["parameters"] = json.loads(run["parameters"])
+                    run["parameters"] = serializer.loads(run["parameters"])
                 if run.get("results_summary"):
-                    run["results_summary"] = json.loads(run["results_summary"])
+                    run["results_summary"] = serializer.loads(run["results_summary"])
                 runs.append(run)
             return runs
 
@@ -1540,7 +2214,7 @@ class DatabaseManager:
             if row:
                 job_data = dict(row)
                 if job_data.get("result"):
-                    job_data["result"] = json.loads(job_data["result"])
+                    job_data["result"] = serializer.loads(job_data["result"])
                 return job_data
         return None
 
@@ -1554,7 +2228,7 @@ class DatabaseManager:
                 job_data = dict(row)
                 if job_data.get("result"):
                     try:
-                        job_data["result"] = json.loads(job_data["result"])
+                        job_data["result"] = serializer.loads(job_data["result"])
                     except json.JSONDecodeError:
                         job_data["result"] = {"raw_result": job_data["result"]}
                 jobs.append(job_data)
@@ -1569,7 +2243,7 @@ class DatabaseManager:
                     job_info["id"],
                     job_info["status"],
                     job_info["progress"],
-                    json.dumps(job_info["result"]) if job_info.get("result") else None,
+                    serializer.dumps(job_info["result"]) if job_info.get("result") else None,
                     job_info.get("error"),
                     job_info["started_at"],
                     job_info.get("finished_at"),
@@ -1606,15 +2280,56 @@ class DatabaseManager:
         with conn:
             conn.execute(
                 queries.UPDATE_OPPORTUNITY_AI_CONTENT_AND_STATUS,
-                (
-                    json.dumps(ai_content_data),
-                    ai_model,
-                    datetime.now().isoformat(),
-                    status,
-                    opportunity_id,
-                ),
+                (ai_model, datetime.now().isoformat(), status, opportunity_id),
+            )
+            self._save_documents(
+                conn, opportunity_id, {"ai_content_json": ai_content_data}
             )
 
+    def _encode_content_version(
+        self, conn, opportunity_id: int, text: str
+    ) -> Tuple[str, Optional[int], str, bytes]:
+        """
+        Returns (version_type, base_id, codec, payload) for a content version:
+        a delta against the opportunity's latest snapshot when that is small
+        enough, otherwise a new snapshot.
+        """
+        snapshot = conn.execute(
+            queries.SELECT_LATEST_CONTENT_SNAPSHOT, (opportunity_id,)
+        ).fetchone()
+        if snapshot and snapshot["delta_count"] < SNAPSHOT_INTERVAL:
+            base_text = decode_document(snapshot["codec"], snapshot["data"])
+            delta = make_delta(base_text, text)
+            if len(delta) <= len(text) * MAX_DELTA_RATIO:
+                codec, payload = encode_document(delta)
+                return "delta", snapshot["id"], codec, payload
+        codec, payload = encode_document(text)
+        return "snapshot", None, codec, payload
+
+    def _decode_content_version(self, conn, row: sqlite3.Row) -> str:
+        """Rebuilds the JSON text of a content_history row."""
+        if row["version_type"] == "full":
+            return row["ai_content_json"]
+        text = decode_document(row["codec"], row["data"])
+        if row["version_type"] == "delta":
+            base = conn.execute(
+                queries.SELECT_CONTENT_SNAPSHOT_DATA, (row["base_id"],)
+            ).fetchone()
+            if not base:
+                raise ValueError(
+                    f"Snapshot {row['base_id']} for content version {row['id']} is missing."
+                )
+            text = apply_delta(decode_document(base["codec"], base["data"]), text)
+        return text
+
+    @staticmethod
+    def _content_title(ai_content_json: Any) -> Optional[str]:
+        return (
+            ai_content_json.get("meta_title")
+            if isinstance(ai_content_json, dict)
+            else None
+        )
+
     def save_content_version_to_history(
         self,
         opportunity_id: int,
@@ -1627,12 +2342,58 @@ class DatabaseManager:
         self.logger.info(
             f"Opportunity {opportunity_id}: Saving content version to history at {timestamp}."
         )
+        text = serializer.dumps(ai_content_json)
         with conn:
+            version_type, base_id, codec, payload = self._encode_content_version(
+                conn, opportunity_id, text
+            )
             conn.execute(
                 queries.INSERT_CONTENT_HISTORY,
-                (opportunity_id, timestamp, json.dumps(ai_content_json)),
+                (
+                    opportunity_id,
+                    timestamp,
+                    version_type,
+                    base_id,
+                    codec,
+                    payload,
+                    len(text),
+                    self._content_title(ai_content_json),
+                ),
             )
 
+    def compact_content_history(self, batch_size: int = 200) -> int:
+        """
+        Re-encodes legacy content_history rows (full inline JSON) as snapshots
+        and deltas, oldest first per opportunity. Runs on startup; a no-op once
+        every row is encoded. Returns the number of rows re-encoded.
+        """
+        conn = self._get_conn()
+        compacted = 0
+        while True:
+            with conn:
+                rows = conn.execute(
+                    queries.SELECT_LEGACY_CONTENT_HISTORY, (batch_size,)
+                ).fetchall()
+                if not rows:
+                    break
+                for row in rows:
+                    text = row["ai_content_json"] or "null"
+                    try:
+                        title = self._content_title(serializer.loads(text))
+                    except json.JSONDecodeError:
+                        title = None
+                    version_type, base_id, codec, payload = (
+                        self._encode_content_version(conn, row["opportunity_id"], text)
+                    )
+                    conn.execute(
+                        queries.UPDATE_CONTENT_HISTORY_ENCODING,
+                        (version_type, base_id, codec, payload, len(text), title, row["id"]),
+                    )
+            compacted += len(rows)
+        if compacted:
+            self.logger.info(f"Re-encoded {compacted} content history versions.")
+        return compacted
+
     def save_content_feedback(
         self, opportunity_id: int, rating: int, comments: Optional[str] = None
     ):
@@ -1648,22 +2409,25 @@ class DatabaseManager:
         )
 
     def get_content_history(self, opportunity_id: int) -> List[Dict[str, Any]]:
-        """Retrieves all historical content versions for an opportunity."""
+        """Lists an opportunity's content versions (metadata only, newest first)."""
         conn = self._get_conn()
         with conn:
             cursor = conn.cursor()
             cursor.execute(queries.SELECT_CONTENT_HISTORY_BY_OPP_ID, (opportunity_id,))
-            rows = cursor.fetchall()
+            return [dict(row) for row in cursor.fetchall()]
 
-            results = []
-            for row in rows:
-                row_dict = dict(row)
-                if row_dict.get("ai_content_json"):
-                    row_dict["ai_content_json"] = json.loads(
-                        row_dict["ai_content_json"]
-                    )
-                results.append(row_dict)
-            return results
+    def get_content_version(
+        self, opportunity_id: int, history_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Rebuilds a single historical content version."""
+        conn = self._get_conn()
+        row = conn.execute(
+            queries.SELECT_CONTENT_VERSION.format(where="id = ?"),
+            (opportunity_id, history_id),
+        ).fetchone()
+        if not row:
+            return None
+        return serializer.loads(self._decode_content_version(conn, row))
 
     def restore_content_version(
         self, opportunity_id: int, version_timestamp: str
@@ -1675,7 +2439,12 @@ class DatabaseManager:
         conn = self._get_conn()
         with conn:
             # First, fetch the current opportunity to save its content
-            cursor = conn.execute(queries.SELECT_OPPORTUNITY_BY_ID, (opportunity_id,))
+            cursor = conn.execute(
+                queries.SELECT_OPPORTUNITY_BY_ID.format(
+                    columns=self._projection("content")
+                ),
+                (opportunity_id,),
+            )
             current_opp_row = cursor.fetchone()
             if not current_opp_row:
                 self.logger.error(
@@ -1692,28 +2461,28 @@ class DatabaseManager:
 
             # Now, find the historical version to restore
             cursor = conn.execute(
-                "SELECT ai_content_json FROM content_history WHERE opportunity_id = ? AND timestamp = ?",
+                queries.SELECT_CONTENT_VERSION.format(where="timestamp = ?"),
                 (opportunity_id, version_timestamp),
             )
             version_to_restore_row = cursor.fetchone()
+            restored_content_str = (
+                self._decode_content_version(conn, version_to_restore_row)
+                if version_to_restore_row
+                else None
+            )
 
-            if (
-                not version_to_restore_row
-                or not version_to_restore_row["ai_content_json"]
-            ):
+            if not restored_content_str:
                 self.logger.error(
                     f"Version not found or content missing for timestamp: {version_timestamp}"
                 )
                 raise ValueError(f"Content version at {version_timestamp} not found.")
 
-            restored_content_str = version_to_restore_row["ai_content_json"]
-            restored_content = json.loads(restored_content_str)
+            restored_content = serializer.loads(restored_content_str)
 
             # Update the main opportunities table with the restored content
             conn.execute(
                 queries.UPDATE_OPPORTUNITY_AI_CONTENT_AND_STATUS,
                 (
-                    restored_content_str,
                     current_opp.get(
                         "ai_content_model", "gpt-4o"
                     ),  # Keep the last used model
@@ -1722,6 +2491,9 @@ class DatabaseManager:
                     opportunity_id,
                 ),
             )
+            self._save_documents(
+                conn, opportunity_id, {"ai_content_json": restored_content_str}
+            )
             self.logger.info(
                 f"Successfully restored content from {version_timestamp} for opportunity {opportunity_id}."
             )
@@ -1739,7 +2511,7 @@ class DatabaseManager:
         with conn:
             conn.execute(
                 queries.UPDATE_OPPORTUNITY_SOCIAL_POSTS,
-                (json.dumps(social_media_posts), opportunity_id),
+                (serializer.dumps(social_media_posts), opportunity_id),
             )
 
     def update_social_media_posts_status(self, opportunity_id: int, new_status: str):
@@ -1786,7 +2558,6 @@ class DatabaseManager:
             conn.execute(
                 queries.UPDATE_GENERATED_CONTENT_AND_STATUS,
                 (
-                    json.dumps(ai_content_data),
                     ai_model,
                     featured_image_data.get("remote_url")
                     if featured_image_data
@@ -1794,14 +2565,21 @@ class DatabaseManager:
                     featured_image_data.get("local_path")
                     if featured_image_data
                     else None,
-                    json.dumps(in_article_images_data),
-                    json.dumps(social_posts) if social_posts else None,
-                    json.dumps(final_package),
+                    serializer.dumps(in_article_images_data),
+                    serializer.dumps(social_posts) if social_posts else None,
                     datetime.now().isoformat(),
                     total_api_cost,
                     opportunity_id,
                 ),
             )
+            self._save_documents(
+                conn,
+                opportunity_id,
+                {
+                    "ai_content_json": ai_content_data,
+                    "final_package_json": final_package,
+                },
+            )
         self.logger.info(
             f"Opportunity {opportunity_id}: Successfully saved full content package and set status to 'generated'."
         )
@@ -1966,17 +2744,20 @@ class DatabaseManager:
         conn = self._get_conn()
         with conn:
             cursor = conn.execute(
-                """
-                SELECT keyword as title,
-                       SUBSTR(JSON_EXTRACT(ai_content_json, '$.meta_description'), 1, 200) as snippet_desc
-                FROM opportunities WHERE slug = ?;
-            """,
+                "SELECT id, keyword as title FROM opportunities WHERE slug = ?;",
                 (slug,),
             )
             row = cursor.fetchone()
-            if row:
-                return dict(row)
-        return None
+        if not row:
+            return None
+        ai_content = self.get_opportunity_document(row["id"], "ai_content_json")
+        description = (
+            ai_content.get("meta_description") if isinstance(ai_content, dict) else None
+        )
+        return {
+            "title": row["title"],
+            "snippet_desc": description[:200] if description else None,
+        }
 
     def fail_stale_jobs(self):
         """Finds all jobs with a 'running' status and marks them as 'failed' on startup."""
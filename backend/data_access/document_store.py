@@ -0,0 +1,43 @@
+# data_access/document_store.py
+"""
+Encoding for the large per-opportunity JSON documents kept in the
+`opportunity_documents` side table instead of inline on `opportunities`.
+"""
+import zlib
+from typing import Optional, Tuple
+
+# opportunities columns whose contents live in opportunity_documents. The
+# document type is the column name, so projections keep working unchanged.
+DOCUMENT_COLUMNS = (
+    "full_data",
+    "blueprint_data",
+    "ai_content_json",
+    "final_package_json",
+    "wordpress_payload_json",
+    "serp_overview",
+)
+
+# Tiny documents are not worth the zlib header and a decompress call.
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 6
+
+
+def encode_document(text: str) -> Tuple[str, bytes]:
+    """Returns (codec, payload) for a JSON document."""
+    raw = text.encode("utf-8")
+    if len(raw) < COMPRESS_MIN_BYTES:
+        return "raw", raw
+    return "zlib", zlib.compress(raw, COMPRESS_LEVEL)
+
+
+def decode_document(codec: str, payload: bytes) -> str:
+    if codec == "zlib":
+        return zlib.decompress(payload).decode("utf-8")
+    if codec == "raw":
+        return bytes(payload).decode("utf-8")
+    raise ValueError(f"Unknown document codec '{codec}'.")
+
+
+def is_empty_inline(value: Optional[str]) -> bool:
+    """True for inline column values that carry no document (moved or unset)."""
+    return value is None or value == "" or value == "null"
@@ -0,0 +1,85 @@
+-- data_access/migrations/026_add_search_index.sql
+-- Full-text search over opportunities and discovery runs (FTS5).
+-- Rowids are namespaced so both asset types share one index:
+--   opportunity  -> id * 2
+--   discovery run -> id * 2 + 1
+
+CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+    keyword,
+    core_keyword,
+    cluster_name,
+    article_title,
+    seed_keywords,
+    client_id UNINDEXED,
+    asset_type UNINDEXED,
+    asset_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3 4'
+);
+
+-- Opportunities
+CREATE TRIGGER IF NOT EXISTS trg_search_opportunities_ai AFTER INSERT ON opportunities BEGIN
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2, NEW.keyword, NEW.core_keyword, NEW.cluster_name,
+        CASE WHEN json_valid(NEW.ai_content_json) THEN json_extract(NEW.ai_content_json, '$.meta_title') END,
+        NULL, NEW.client_id, 'opportunity', NEW.id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_opportunities_au
+AFTER UPDATE OF keyword, core_keyword, cluster_name, ai_content_json, client_id ON opportunities BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 2;
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2, NEW.keyword, NEW.core_keyword, NEW.cluster_name,
+        CASE WHEN json_valid(NEW.ai_content_json) THEN json_extract(NEW.ai_content_json, '$.meta_title') END,
+        NULL, NEW.client_id, 'opportunity', NEW.id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_opportunities_ad AFTER DELETE ON opportunities BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 2;
+END;
+
+-- Discovery runs (seed keywords live in the JSON parameters)
+CREATE TRIGGER IF NOT EXISTS trg_search_discovery_runs_ai AFTER INSERT ON discovery_runs BEGIN
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2 + 1, NULL, NULL, NULL, NULL,
+        CASE WHEN json_valid(NEW.parameters) THEN json_extract(NEW.parameters, '$.seed_keywords') END,
+        NEW.client_id, 'discovery_run', NEW.id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_discovery_runs_au
+AFTER UPDATE OF parameters, client_id ON discovery_runs BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2 + 1, NULL, NULL, NULL, NULL,
+        CASE WHEN json_valid(NEW.parameters) THEN json_extract(NEW.parameters, '$.seed_keywords') END,
+        NEW.client_id, 'discovery_run', NEW.id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_discovery_runs_ad AFTER DELETE ON discovery_runs BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 2 + 1;
+END;
+
+-- Backfill existing rows
+DELETE FROM search_index;
+
+INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+SELECT
+    id * 2, keyword, core_keyword, cluster_name,
+    CASE WHEN json_valid(ai_content_json) THEN json_extract(ai_content_json, '$.meta_title') END,
+    NULL, client_id, 'opportunity', id
+FROM opportunities;
+
+INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+SELECT
+    id * 2 + 1, NULL, NULL, NULL, NULL,
+    CASE WHEN json_valid(parameters) THEN json_extract(parameters, '$.seed_keywords') END,
+    client_id, 'discovery_run', id
+FROM discovery_runs;
@@ -0,0 +1,133 @@
+-- data_access/migrations/027_add_client_stats.sql
+-- Per-client dashboard aggregates, kept current by triggers so the dashboard
+-- reads one row instead of scanning opportunities and discovery_runs.
+-- status_counts is a JSON object of {status: count}.
+-- DatabaseManager.reconcile_client_stats() recomputes rows from the base tables.
+
+CREATE TABLE IF NOT EXISTS client_stats (
+    client_id TEXT PRIMARY KEY,
+    total_opportunities INTEGER NOT NULL DEFAULT 0,
+    status_counts TEXT NOT NULL DEFAULT '{}',
+    total_traffic_value REAL NOT NULL DEFAULT 0,
+    opportunities_api_cost REAL NOT NULL DEFAULT 0,
+    discovery_runs_api_cost REAL NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    reconciled_at TEXT
+);
+
+-- Opportunities
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_opportunities_ai AFTER INSERT ON opportunities BEGIN
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities + 1,
+        status_counts = json_set(
+            status_counts, '$."' || NEW.status || '"',
+            COALESCE(json_extract(status_counts, '$."' || NEW.status || '"'), 0) + 1
+        ),
+        total_traffic_value = total_traffic_value + COALESCE(NEW.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_opportunities_au
+AFTER UPDATE OF status, traffic_value, total_api_cost, client_id ON opportunities
+WHEN OLD.status IS NOT NEW.status
+    OR OLD.traffic_value IS NOT NEW.traffic_value
+    OR OLD.total_api_cost IS NOT NEW.total_api_cost
+    OR OLD.client_id IS NOT NEW.client_id
+BEGIN
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities - 1,
+        status_counts = json_set(
+            status_counts, '$."' || OLD.status || '"',
+            COALESCE(json_extract(status_counts, '$."' || OLD.status || '"'), 0) - 1
+        ),
+        total_traffic_value = total_traffic_value - COALESCE(OLD.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities + 1,
+        status_counts = json_set(
+            status_counts, '$."' || NEW.status || '"',
+            COALESCE(json_extract(status_counts, '$."' || NEW.status || '"'), 0) + 1
+        ),
+        total_traffic_value = total_traffic_value + COALESCE(NEW.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_opportunities_ad AFTER DELETE ON opportunities BEGIN
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities - 1,
+        status_counts = json_set(
+            status_counts, '$."' || OLD.status || '"',
+            COALESCE(json_extract(status_counts, '$."' || OLD.status || '"'), 0) - 1
+        ),
+        total_traffic_value = total_traffic_value - COALESCE(OLD.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+END;
+
+-- Discovery runs (only their cost contributes)
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_discovery_runs_ai AFTER INSERT ON discovery_runs BEGIN
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        discovery_runs_api_cost = discovery_runs_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_discovery_runs_au
+AFTER UPDATE OF total_api_cost, client_id ON discovery_runs
+WHEN OLD.total_api_cost IS NOT NEW.total_api_cost OR OLD.client_id IS NOT NEW.client_id
+BEGIN
+    UPDATE client_stats SET
+        discovery_runs_api_cost = discovery_runs_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        discovery_runs_api_cost = discovery_runs_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_client_stats_discovery_runs_ad AFTER DELETE ON discovery_runs BEGIN
+    UPDATE client_stats SET
+        discovery_runs_api_cost = discovery_runs_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+END;
+
+-- Backfill from existing data
+DELETE FROM client_stats;
+INSERT INTO client_stats (client_id) SELECT client_id FROM clients;
+INSERT OR IGNORE INTO client_stats (client_id) SELECT DISTINCT client_id FROM opportunities;
+INSERT OR IGNORE INTO client_stats (client_id) SELECT DISTINCT client_id FROM discovery_runs;
+UPDATE client_stats SET
+    total_opportunities = (
+        SELECT COUNT(*) FROM opportunities o WHERE o.client_id = client_stats.client_id
+    ),
+    status_counts = COALESCE((
+        SELECT json_group_object(status, cnt) FROM (
+            SELECT status, COUNT(*) AS cnt FROM opportunities o
+            WHERE o.client_id = client_stats.client_id AND status IS NOT NULL
+            GROUP BY status
+        )
+    ), '{}'),
+    total_traffic_value = (
+        SELECT COALESCE(SUM(traffic_value), 0) FROM opportunities o WHERE o.client_id = client_stats.client_id
+    ),
+    opportunities_api_cost = (
+        SELECT COALESCE(SUM(total_api_cost), 0) FROM opportunities o WHERE o.client_id = client_stats.client_id
+    ),
+    discovery_runs_api_cost = (
+        SELECT COALESCE(SUM(total_api_cost), 0) FROM discovery_runs d WHERE d.client_id = client_stats.client_id
+    ),
+    updated_at = CURRENT_TIMESTAMP,
+    reconciled_at = CURRENT_TIMESTAMP;
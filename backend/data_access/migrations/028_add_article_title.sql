@@ -0,0 +1,4 @@
+-- data_access/migrations/028_add_article_title.sql
+-- Promoted from ai_content_json so search can index it once the content
+-- document moves out of the opportunities row (migration 029).
+ALTER TABLE opportunities ADD COLUMN article_title TEXT;
@@ -0,0 +1,47 @@
+-- data_access/migrations/029_add_opportunity_documents.sql
+-- Large JSON documents (full_data, blueprint_data, ai_content_json,
+-- final_package_json, wordpress_payload_json, serp_overview) move out of the
+-- opportunities row into a side table, stored compressed and loaded only when
+-- a read asks for them. Existing inline values are moved (and compressed) by
+-- DatabaseManager.move_inline_documents() on startup; the inline columns are
+-- left empty.
+
+CREATE TABLE IF NOT EXISTS opportunity_documents (
+    opportunity_id INTEGER NOT NULL,
+    doc_type TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    raw_size INTEGER NOT NULL,
+    updated_at TEXT,
+    PRIMARY KEY (opportunity_id, doc_type)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_opportunity_documents_ad AFTER DELETE ON opportunities BEGIN
+    DELETE FROM opportunity_documents WHERE opportunity_id = OLD.id;
+END;
+
+UPDATE opportunities
+SET article_title = json_extract(ai_content_json, '$.meta_title')
+WHERE article_title IS NULL AND json_valid(ai_content_json);
+
+-- Search indexes the promoted title instead of reading ai_content_json.
+DROP TRIGGER IF EXISTS trg_search_opportunities_ai;
+DROP TRIGGER IF EXISTS trg_search_opportunities_au;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_opportunities_ai AFTER INSERT ON opportunities BEGIN
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2, NEW.keyword, NEW.core_keyword, NEW.cluster_name, NEW.article_title,
+        NULL, NEW.client_id, 'opportunity', NEW.id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_search_opportunities_au
+AFTER UPDATE OF keyword, core_keyword, cluster_name, article_title, client_id ON opportunities BEGIN
+    DELETE FROM search_index WHERE rowid = OLD.id * 2;
+    INSERT INTO search_index (rowid, keyword, core_keyword, cluster_name, article_title, seed_keywords, client_id, asset_type, asset_id)
+    VALUES (
+        NEW.id * 2, NEW.keyword, NEW.core_keyword, NEW.cluster_name, NEW.article_title,
+        NULL, NEW.client_id, 'opportunity', NEW.id
+    );
+END;
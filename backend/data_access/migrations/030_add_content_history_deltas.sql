@@ -0,0 +1,15 @@
+-- data_access/migrations/030_add_content_history_deltas.sql
+-- Content history versions are stored as compressed full snapshots or as
+-- deltas against the opportunity's latest snapshot (see content_delta.py).
+-- version_type: 'full' (legacy inline ai_content_json), 'snapshot' or 'delta'.
+-- DatabaseManager.compact_content_history() re-encodes legacy rows on startup.
+
+ALTER TABLE content_history ADD COLUMN version_type TEXT NOT NULL DEFAULT 'full';
+ALTER TABLE content_history ADD COLUMN base_id INTEGER;
+ALTER TABLE content_history ADD COLUMN codec TEXT;
+ALTER TABLE content_history ADD COLUMN data BLOB;
+ALTER TABLE content_history ADD COLUMN raw_size INTEGER;
+ALTER TABLE content_history ADD COLUMN title TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_content_history_opportunity
+ON content_history (opportunity_id, version_type, id);
@@ -0,0 +1,36 @@
+-- data_access/migrations/031_add_run_keyword_index.sql
+-- Index-backed discovery run views. The composite index serves paging a run's
+-- keywords by status and the rejected-reason histogram, and replaces the
+-- plain run_id index.
+-- discovery_runs.reason_counts caches the histogram as {reason: count}. It is
+-- computed when a run completes and cleared by the triggers below whenever a
+-- run's rejected keywords change; readers recompute it when NULL.
+
+ALTER TABLE discovery_runs ADD COLUMN reason_counts TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_opportunities_run_status_reason
+ON opportunities (run_id, status, blog_qualification_reason);
+DROP INDEX IF EXISTS idx_opportunities_run_id;
+
+CREATE TRIGGER IF NOT EXISTS trg_run_reason_counts_ai AFTER INSERT ON opportunities
+WHEN NEW.run_id IS NOT NULL AND NEW.status = 'rejected'
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id = NEW.run_id AND reason_counts IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_run_reason_counts_au
+AFTER UPDATE OF run_id, status, blog_qualification_status, blog_qualification_reason ON opportunities
+WHEN (OLD.run_id IS NOT NULL OR NEW.run_id IS NOT NULL)
+    AND (OLD.status = 'rejected' OR NEW.status = 'rejected')
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id IN (OLD.run_id, NEW.run_id) AND reason_counts IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_run_reason_counts_ad AFTER DELETE ON opportunities
+WHEN OLD.run_id IS NOT NULL AND OLD.status = 'rejected'
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id = OLD.run_id AND reason_counts IS NOT NULL;
+END;
@@ -0,0 +1,49 @@
+-- data_access/migrations/032_add_serp_snapshots.sql
+-- Normalized SERP store. Each fetch adds a versioned serp_snapshots row whose
+-- compressed payload omits url/domain/title of ranked items; those live in
+-- serp_rankings rows that reference interned serp_urls and domains.
+-- params_hash identifies the request variant (location, language, device,
+-- depth, options); see data_access/serp_snapshots.py.
+
+CREATE TABLE IF NOT EXISTS domains (
+    id INTEGER PRIMARY KEY,
+    domain TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS serp_urls (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    domain_id INTEGER NOT NULL REFERENCES domains (id),
+    title TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_serp_urls_domain ON serp_urls (domain_id);
+
+CREATE TABLE IF NOT EXISTS serp_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    params_hash TEXT NOT NULL,
+    location_code INTEGER,
+    language_code TEXT,
+    device TEXT,
+    fetched_at TEXT NOT NULL,
+    se_results_count INTEGER,
+    item_types TEXT,
+    codec TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    raw_size INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_serp_snapshots_lookup
+ON serp_snapshots (keyword, params_hash, fetched_at);
+
+-- title is only set when it differs from the interned serp_urls.title.
+CREATE TABLE IF NOT EXISTS serp_rankings (
+    snapshot_id INTEGER NOT NULL REFERENCES serp_snapshots (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    item_type TEXT,
+    rank_group INTEGER,
+    rank_absolute INTEGER,
+    url_id INTEGER NOT NULL REFERENCES serp_urls (id),
+    title TEXT,
+    PRIMARY KEY (snapshot_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_serp_rankings_url ON serp_rankings (url_id, item_type, rank_group);
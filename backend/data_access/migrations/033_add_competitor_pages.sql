@@ -0,0 +1,18 @@
+-- data_access/migrations/033_add_competitor_pages.sql
+-- Parsed competitor pages keyed by URL, shared across keywords and clients.
+-- `data` is the compressed JSON of headings, main text and markdown (see
+-- data_access/document_store.py); pages older than competitor_page_max_age_days
+-- are refetched.
+
+CREATE TABLE IF NOT EXISTS competitor_pages (
+    url TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    javascript INTEGER NOT NULL DEFAULT 0,
+    title TEXT,
+    word_count INTEGER,
+    readability_score REAL,
+    codec TEXT NOT NULL,
+    data BLOB NOT NULL,
+    raw_size INTEGER
+);
@@ -0,0 +1,18 @@
+-- data_access/migrations/034_add_crawl_domain_profiles.sql
+-- Learned per-domain crawl profile for competitor Content Parsing fetches:
+-- attempts, successes, total seconds and cost per tier (1 = JS disabled,
+-- 2 = JS enabled). FullCompetitorAnalyzer sends domains whose Tier 1 scans
+-- keep failing straight to Tier 2.
+
+CREATE TABLE IF NOT EXISTS crawl_domain_profiles (
+    domain TEXT PRIMARY KEY,
+    tier1_attempts INTEGER NOT NULL DEFAULT 0,
+    tier1_successes INTEGER NOT NULL DEFAULT 0,
+    tier1_seconds REAL NOT NULL DEFAULT 0,
+    tier1_cost REAL NOT NULL DEFAULT 0,
+    tier2_attempts INTEGER NOT NULL DEFAULT 0,
+    tier2_successes INTEGER NOT NULL DEFAULT 0,
+    tier2_seconds REAL NOT NULL DEFAULT 0,
+    tier2_cost REAL NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
@@ -0,0 +1,30 @@
+-- data_access/migrations/035_add_opportunity_version.sql
+-- Per-opportunity version, bumped by triggers on every change to the row or to
+-- one of its opportunity_documents. The API derives ETags from it, so a
+-- conditional GET can answer 304 Not Modified after reading one small row.
+
+ALTER TABLE opportunities ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+
+-- Skipped when the update already moved the version (including the trigger's
+-- own UPDATE), so each statement bumps it once.
+CREATE TRIGGER IF NOT EXISTS trg_opportunities_version_au
+AFTER UPDATE ON opportunities
+WHEN NEW.version IS OLD.version
+BEGIN
+    UPDATE opportunities SET version = OLD.version + 1 WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_opportunity_documents_version_ai
+AFTER INSERT ON opportunity_documents BEGIN
+    UPDATE opportunities SET version = version + 1 WHERE id = NEW.opportunity_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_opportunity_documents_version_au
+AFTER UPDATE ON opportunity_documents BEGIN
+    UPDATE opportunities SET version = version + 1 WHERE id = NEW.opportunity_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_opportunity_documents_version_ad
+AFTER DELETE ON opportunity_documents BEGIN
+    UPDATE opportunities SET version = version + 1 WHERE id = OLD.opportunity_id;
+END;
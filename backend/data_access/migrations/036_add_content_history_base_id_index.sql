@@ -0,0 +1,6 @@
+-- data_access/migrations/036_add_content_history_base_id_index.sql
+-- Databases that applied 030 before it created idx_content_history_base_id.
+-- Without it, counting a snapshot's deltas scans the whole content_history.
+
+CREATE INDEX IF NOT EXISTS idx_content_history_base_id
+ON content_history (base_id);
@@ -0,0 +1,86 @@
+-- data_access/migrations/037_quote_client_stats_status_keys.sql
+-- Recreates the client_stats opportunity triggers from 027. Those built JSON
+-- paths by concatenating the raw status ('$."' || status || '"'), so a status
+-- containing a double quote produced a broken path. Keys are now read with
+-- json_each and written with json_patch/json_object, which need no quoting.
+-- NULL statuses are skipped, matching RECONCILE_CLIENT_STATS.
+
+DROP TRIGGER IF EXISTS trg_client_stats_opportunities_ai;
+DROP TRIGGER IF EXISTS trg_client_stats_opportunities_au;
+DROP TRIGGER IF EXISTS trg_client_stats_opportunities_ad;
+
+CREATE TRIGGER trg_client_stats_opportunities_ai AFTER INSERT ON opportunities BEGIN
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities + 1,
+        status_counts = CASE WHEN NEW.status IS NULL THEN status_counts ELSE json_patch(
+            status_counts,
+            json_object(NEW.status, COALESCE(
+                (SELECT value FROM json_each(status_counts) WHERE key = NEW.status), 0
+            ) + 1)
+        ) END,
+        total_traffic_value = total_traffic_value + COALESCE(NEW.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER trg_client_stats_opportunities_au
+AFTER UPDATE OF status, traffic_value, total_api_cost, client_id ON opportunities
+WHEN OLD.status IS NOT NEW.status
+    OR OLD.traffic_value IS NOT NEW.traffic_value
+    OR OLD.total_api_cost IS NOT NEW.total_api_cost
+    OR OLD.client_id IS NOT NEW.client_id
+BEGIN
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities - 1,
+        status_counts = CASE WHEN OLD.status IS NULL THEN status_counts ELSE json_patch(
+            status_counts,
+            json_object(OLD.status, COALESCE(
+                (SELECT value FROM json_each(status_counts) WHERE key = OLD.status), 0
+            ) - 1)
+        ) END,
+        total_traffic_value = total_traffic_value - COALESCE(OLD.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+    INSERT OR IGNORE INTO client_stats (client_id) VALUES (NEW.client_id);
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities + 1,
+        status_counts = CASE WHEN NEW.status IS NULL THEN status_counts ELSE json_patch(
+            status_counts,
+            json_object(NEW.status, COALESCE(
+                (SELECT value FROM json_each(status_counts) WHERE key = NEW.status), 0
+            ) + 1)
+        ) END,
+        total_traffic_value = total_traffic_value + COALESCE(NEW.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost + COALESCE(NEW.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = NEW.client_id;
+END;
+
+CREATE TRIGGER trg_client_stats_opportunities_ad AFTER DELETE ON opportunities BEGIN
+    UPDATE client_stats SET
+        total_opportunities = total_opportunities - 1,
+        status_counts = CASE WHEN OLD.status IS NULL THEN status_counts ELSE json_patch(
+            status_counts,
+            json_object(OLD.status, COALESCE(
+                (SELECT value FROM json_each(status_counts) WHERE key = OLD.status), 0
+            ) - 1)
+        ) END,
+        total_traffic_value = total_traffic_value - COALESCE(OLD.traffic_value, 0),
+        opportunities_api_cost = opportunities_api_cost - COALESCE(OLD.total_api_cost, 0),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE client_id = OLD.client_id;
+END;
+
+-- Recount status_counts, which the old triggers may have left wrong.
+UPDATE client_stats SET
+    status_counts = COALESCE((
+        SELECT json_group_object(status, cnt) FROM (
+            SELECT status, COUNT(*) AS cnt FROM opportunities o
+            WHERE o.client_id = client_stats.client_id AND status IS NOT NULL
+            GROUP BY status
+        )
+    ), '{}'),
+    updated_at = CURRENT_TIMESTAMP;
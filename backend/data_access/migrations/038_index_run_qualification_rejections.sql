@@ -0,0 +1,40 @@
+-- data_access/migrations/038_index_run_qualification_rejections.sql
+-- The rejected-reason histogram counts every keyword rejected at blog
+-- qualification, whatever its current status: a keyword rejected there and
+-- later bulk-approved keeps blog_qualification_status = 'rejected'. This index
+-- serves that query, and the reason_counts triggers from 031 are recreated to
+-- watch blog_qualification_status instead of status.
+
+CREATE INDEX IF NOT EXISTS idx_opportunities_run_qualification_reason
+ON opportunities (run_id, blog_qualification_status, blog_qualification_reason);
+
+DROP TRIGGER IF EXISTS trg_run_reason_counts_ai;
+DROP TRIGGER IF EXISTS trg_run_reason_counts_au;
+DROP TRIGGER IF EXISTS trg_run_reason_counts_ad;
+
+CREATE TRIGGER trg_run_reason_counts_ai AFTER INSERT ON opportunities
+WHEN NEW.run_id IS NOT NULL AND NEW.blog_qualification_status = 'rejected'
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id = NEW.run_id AND reason_counts IS NOT NULL;
+END;
+
+CREATE TRIGGER trg_run_reason_counts_au
+AFTER UPDATE OF run_id, blog_qualification_status, blog_qualification_reason ON opportunities
+WHEN (OLD.run_id IS NOT NULL OR NEW.run_id IS NOT NULL)
+    AND (OLD.blog_qualification_status = 'rejected'
+        OR NEW.blog_qualification_status = 'rejected')
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id IN (OLD.run_id, NEW.run_id) AND reason_counts IS NOT NULL;
+END;
+
+CREATE TRIGGER trg_run_reason_counts_ad AFTER DELETE ON opportunities
+WHEN OLD.run_id IS NOT NULL AND OLD.blog_qualification_status = 'rejected'
+BEGIN
+    UPDATE discovery_runs SET reason_counts = NULL
+    WHERE id = OLD.run_id AND reason_counts IS NOT NULL;
+END;
+
+-- Cached histograms left out bulk-approved keywords; recompute them on read.
+UPDATE discovery_runs SET reason_counts = NULL WHERE reason_counts IS NOT NULL;
@@ -220,21 +220,145 @@ TRUNCATE_API_CACHE = """
 DELETE FROM api_cache;
 """
 
-# --- Opportunity Queries ---
-INSERT_OPPORTUNITY_OR_IGNORE = """
-INSERT OR IGNORE INTO opportunities 
-(keyword, client_id, date_added, full_data)
-VALUES (?, ?, ?, ?);
+# --- SERP snapshot queries (migration 032_add_serp_snapshots.sql) ---
+INSERT_DOMAIN = "INSERT OR IGNORE INTO domains (domain) VALUES (?);"
+
+SELECT_DOMAIN_ID = "SELECT id FROM domains WHERE domain = ?;"
+
+INSERT_SERP_URL = """
+INSERT OR IGNORE INTO serp_urls (url, domain_id, title) VALUES (?, ?, ?);
 """
 
-INSERT_OPPORTUNITY_WITH_BLUEPRINT = """
-INSERT OR IGNORE INTO opportunities
-(keyword, client_id, date_added, full_data, blueprint_data, slug)
-VALUES (?, ?, ?, ?, ?, ?);
+SELECT_SERP_URL = "SELECT id, title FROM serp_urls WHERE url = ?;"
+
+INSERT_SERP_SNAPSHOT = """
+INSERT INTO serp_snapshots
+(keyword, params_hash, location_code, language_code, device, fetched_at,
+ se_results_count, item_types, codec, payload, raw_size)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
 """
 
+INSERT_SERP_RANKING = """
+INSERT INTO serp_rankings
+(snapshot_id, position, item_type, rank_group, rank_absolute, url_id, title)
+VALUES (?, ?, ?, ?, ?, ?, ?);
+"""
+
+SELECT_LATEST_SERP_SNAPSHOT = """
+SELECT id, fetched_at, codec, payload FROM serp_snapshots
+WHERE keyword = ? AND params_hash = ? AND fetched_at >= ?
+ORDER BY fetched_at DESC
+LIMIT 1;
+"""
+
+SELECT_SERP_RANKINGS = """
+SELECT r.position, r.item_type, r.rank_group, r.rank_absolute, u.url,
+       d.domain, COALESCE(r.title, u.title) AS title
+FROM serp_rankings r
+JOIN serp_urls u ON u.id = r.url_id
+JOIN domains d ON d.id = u.domain_id
+WHERE r.snapshot_id = ?
+ORDER BY r.position;
+"""
+
+SELECT_SERP_SNAPSHOT_HISTORY = """
+SELECT id, keyword, location_code, language_code, device, fetched_at,
+       se_results_count, item_types
+FROM serp_snapshots
+WHERE keyword = ?
+ORDER BY fetched_at DESC;
+"""
+
+# Organic rankings of a domain (bare and www. forms) within the latest snapshot
+# of each keyword variant. {client_filter} optionally restricts keywords to a client's
+# opportunities.
+SELECT_DOMAIN_SERP_RANKINGS = """
+SELECT s.keyword, s.location_code, s.language_code, s.device, s.fetched_at,
+       r.rank_group, r.rank_absolute, u.url, COALESCE(r.title, u.title) AS title
+FROM domains d
+JOIN serp_urls u ON u.domain_id = d.id
+JOIN serp_rankings r ON r.url_id = u.id AND r.item_type = 'organic' AND r.rank_group <= ?
+JOIN serp_snapshots s ON s.id = r.snapshot_id
+WHERE d.domain IN (?, ?)
+  AND s.fetched_at = (
+      SELECT MAX(s2.fetched_at) FROM serp_snapshots s2
+      WHERE s2.keyword = s.keyword AND s2.params_hash = s.params_hash
+  ){client_filter}
+ORDER BY r.rank_group, s.keyword;
+"""
+
+# --- Competitor Page Queries ---
+UPSERT_COMPETITOR_PAGE = """
+INSERT OR REPLACE INTO competitor_pages
+(url, domain, fetched_at, javascript, title, word_count, readability_score,
+ codec, data, raw_size)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
+SELECT_FRESH_COMPETITOR_PAGES = """
+SELECT url, fetched_at, javascript, title, word_count, readability_score, codec, data
+FROM competitor_pages
+WHERE url IN ({placeholders}) AND fetched_at >= ?;
+"""
+
+# --- Crawl Domain Profile Queries ---
+RECORD_CRAWL_OUTCOME = """
+INSERT INTO crawl_domain_profiles
+(domain, tier{tier}_attempts, tier{tier}_successes, tier{tier}_seconds, tier{tier}_cost, updated_at)
+VALUES (?, 1, ?, ?, ?, ?)
+ON CONFLICT (domain) DO UPDATE SET
+    tier{tier}_attempts = tier{tier}_attempts + 1,
+    tier{tier}_successes = tier{tier}_successes + excluded.tier{tier}_successes,
+    tier{tier}_seconds = tier{tier}_seconds + excluded.tier{tier}_seconds,
+    tier{tier}_cost = tier{tier}_cost + excluded.tier{tier}_cost,
+    updated_at = excluded.updated_at;
+"""
+
+SELECT_CRAWL_DOMAIN_PROFILES = """
+SELECT * FROM crawl_domain_profiles WHERE domain IN ({placeholders});
+"""
+
+# --- Opportunity column projections ---
+# Read methods take a projection name so callers only pull the JSON blobs they
+# need. blueprint_data, ai_content_json, final_package_json and full_data are
+# each commonly tens of KB per row; they live in opportunity_documents and are
+# only loaded when the projection names them.
+_SUMMARY_COLUMNS = (
+    "id, keyword, client_id, run_id, status, date_added, date_processed, last_seen_at, "
+    "strategic_score, blog_qualification_status, blog_qualification_reason, "
+    "traffic_value, cpc, competition, main_intent, core_keyword, cluster_name, slug, "
+    "last_workflow_step, error_message, latest_job_id, total_api_cost, "
+    "featured_image_local_path, social_media_posts_status, published_url, "
+    "article_title"
+)
+_SCORING_COLUMNS = _SUMMARY_COLUMNS + (
+    ", keyword_info, keyword_properties, search_intent_info, serp_overview, "
+    "score_breakdown, search_volume_trend_json, monthly_searches, "
+    "keyword_info_normalized_with_bing, keyword_info_normalized_with_clickstream, "
+    "related_keywords, keyword_categories, metrics_history, check_url"
+)
+OPPORTUNITY_PROJECTIONS = {
+    # List rows and existence checks.
+    "summary": _SUMMARY_COLUMNS,
+    # Metrics and score inputs (tables, comparisons, discovery run views).
+    "scoring": _SCORING_COLUMNS,
+    # Scoring plus the raw discovery payload used by validation and analysis.
+    "analysis": _SCORING_COLUMNS
+    + ", full_data, competitor_social_media_tags_json, competitor_page_timing_json",
+    # Generated artefacts, without the discovery/scoring payloads.
+    "content": _SUMMARY_COLUMNS
+    + ", blueprint_data, ai_content_json, ai_content_model, featured_image_url, "
+    "in_article_images_data, social_media_posts_json, final_package_json, "
+    "wordpress_payload_json",
+    # Discovery run detail tables: one page of rows, metrics extracted in SQL.
+    "run": "id, keyword, status, blog_qualification_status, blog_qualification_reason, "
+    "strategic_score, JSON_EXTRACT(keyword_info, '$.search_volume') AS search_volume, "
+    "JSON_EXTRACT(keyword_properties, '$.keyword_difficulty') AS keyword_difficulty",
+    "full": "*",
+}
+
 SELECT_PENDING_OPPORTUNITIES = """
-SELECT * FROM opportunities 
+SELECT {columns} FROM opportunities 
 WHERE status = 'pending' AND client_id = ?;
 """
 
@@ -245,7 +369,11 @@ ORDER BY date_added DESC;
 """
 
 SELECT_OPPORTUNITY_BY_ID = """
-SELECT * FROM opportunities WHERE id = ?;
+SELECT {columns} FROM opportunities WHERE id = ?;
+"""
+
+SELECT_OPPORTUNITY_VERSION = """
+SELECT id, client_id, version FROM opportunities WHERE id = ?;
 """
 
 SELECT_ALL_PROCESSED_KEYWORDS = """
@@ -265,21 +393,15 @@ UPDATE_OPPORTUNITY_WORKFLOW_STATE = """
 UPDATE opportunities SET last_workflow_step = ?, status = ?, error_message = ? WHERE id = ?;
 """
 
-UPDATE_OPPORTUNITY_BLUEPRINT = """
+UPDATE_OPPORTUNITY_SLUG = """
 UPDATE opportunities
-SET blueprint_data = ?
-WHERE id = ?;
-"""
-
-UPDATE_OPPORTUNITY_BLUEPRINT_AND_SLUG = """
-UPDATE opportunities
-SET blueprint_data = ?, slug = ?
+SET slug = ?
 WHERE id = ?;
 """
 
 UPDATE_OPPORTUNITY_AI_CONTENT = """
 UPDATE opportunities
-SET ai_content_json = ?, ai_content_model = ?, date_processed = ?
+SET ai_content_model = ?, date_processed = ?
 WHERE id = ?;
 """
 
@@ -292,22 +414,37 @@ UPDATE opportunities SET social_media_posts_json = ? WHERE id = ?;
 """
 
 SELECT_ALL_OPPORTUNITIES_FOR_EXPORT = """
-SELECT * FROM opportunities ORDER BY client_id, date_added DESC;
+SELECT {columns} FROM opportunities ORDER BY client_id, date_added DESC;
 """
 
 SELECT_PROCESSED_OPPORTUNITIES = """
-SELECT * FROM opportunities
-WHERE client_id = ? AND blueprint_data IS NOT NULL
+SELECT {columns} FROM opportunities
+WHERE client_id = ? AND EXISTS (
+    SELECT 1 FROM opportunity_documents d
+    WHERE d.opportunity_id = opportunities.id AND d.doc_type = 'blueprint_data'
+)
 ORDER BY date_processed DESC;
 """
 
-UPDATE_OPPORTUNITY_WORDPRESS_PAYLOAD = (
-    "UPDATE opportunities SET wordpress_payload_json = ? WHERE id = ?;"
-)
+# --- Opportunity documents (large JSON blobs, see document_store.py) ---
+UPSERT_OPPORTUNITY_DOCUMENT = """
+INSERT OR REPLACE INTO opportunity_documents
+(opportunity_id, doc_type, codec, data, raw_size, updated_at)
+VALUES (?, ?, ?, ?, ?, ?);
+"""
 
-UPDATE_OPPORTUNITY_FINAL_PACKAGE = (
-    "UPDATE opportunities SET final_package_json = ? WHERE id = ?;"
-)
+DELETE_OPPORTUNITY_DOCUMENT = """
+DELETE FROM opportunity_documents WHERE opportunity_id = ? AND doc_type = ?;
+"""
+
+SELECT_OPPORTUNITY_DOCUMENTS = """
+SELECT opportunity_id, doc_type, codec, data FROM opportunity_documents
+WHERE opportunity_id IN ({id_placeholders}) AND doc_type IN ({type_placeholders});
+"""
+
+UPDATE_OPPORTUNITY_ARTICLE_TITLE = """
+UPDATE opportunities SET article_title = ? WHERE id = ?;
+"""
 
 # --- Dashboard Queries ---
 COUNT_OPPORTUNITIES_BY_STATUS = """
@@ -318,10 +455,6 @@ SUM_DISCOVERY_COST_BY_CLIENT = """
 SELECT SUM(CAST(JSON_EXTRACT(results_summary, '$.total_cost') AS REAL)) FROM discovery_runs WHERE client_id = ?;
 """
 
-SUM_ANALYSIS_COST_BY_CLIENT = """
-SELECT SUM(CAST(JSON_EXTRACT(blueprint_data, '$.metadata.total_api_cost') AS REAL)) FROM opportunities WHERE client_id = ?;
-"""
-
 SELECT_RECENTLY_GENERATED = """
 SELECT id, keyword, status, date_processed FROM opportunities 
 WHERE client_id = ? AND status = 'generated' 
@@ -329,6 +462,39 @@ ORDER BY date_processed DESC
 LIMIT 5;
 """
 
+# client_stats is maintained by triggers (migration 027).
+SELECT_CLIENT_STATS = """
+SELECT * FROM client_stats WHERE client_id = ?;
+"""
+
+SELECT_CLIENT_IDS_FOR_STATS = """
+SELECT client_id FROM clients
+UNION SELECT DISTINCT client_id FROM opportunities
+UNION SELECT DISTINCT client_id FROM discovery_runs;
+"""
+
+RECONCILE_CLIENT_STATS = """
+INSERT OR REPLACE INTO client_stats (
+    client_id, total_opportunities, status_counts, total_traffic_value,
+    opportunities_api_cost, discovery_runs_api_cost, updated_at, reconciled_at
+)
+SELECT
+    :client_id,
+    (SELECT COUNT(*) FROM opportunities WHERE client_id = :client_id),
+    COALESCE((
+        SELECT json_group_object(status, cnt) FROM (
+            SELECT status, COUNT(*) AS cnt FROM opportunities
+            WHERE client_id = :client_id AND status IS NOT NULL
+            GROUP BY status
+        )
+    ), '{}'),
+    (SELECT COALESCE(SUM(traffic_value), 0) FROM opportunities WHERE client_id = :client_id),
+    (SELECT COALESCE(SUM(total_api_cost), 0) FROM opportunities WHERE client_id = :client_id),
+    (SELECT COALESCE(SUM(total_api_cost), 0) FROM discovery_runs WHERE client_id = :client_id),
+    CURRENT_TIMESTAMP,
+    CURRENT_TIMESTAMP;
+"""
+
 
 # --- Client Queries ---
 INSERT_CLIENT = """
@@ -373,8 +539,41 @@ SELECT_DISCOVERY_RUN_BY_ID = """
 SELECT * FROM discovery_runs WHERE id = ?;
 """
 
+SELECT_KEYWORDS_FOR_RUN = """
+SELECT {columns} FROM opportunities WHERE run_id = ?;
+"""
+
 SELECT_KEYWORDS_FOR_RUN_BY_REASON = """
-SELECT * FROM opportunities WHERE run_id = ? AND blog_qualification_reason = ?;
+SELECT {columns} FROM opportunities WHERE run_id = ? AND blog_qualification_reason = ?;
+"""
+
+# Paged run views; {filters} is a sequence of "AND column = ?" clauses on
+# status / blog_qualification_reason (see idx_opportunities_run_status_reason).
+SELECT_KEYWORDS_FOR_RUN_PAGE = """
+SELECT {columns} FROM opportunities WHERE run_id = ?{filters}
+ORDER BY id LIMIT ? OFFSET ?;
+"""
+
+COUNT_KEYWORDS_FOR_RUN = """
+SELECT COUNT(*) FROM opportunities WHERE run_id = ?{filters};
+"""
+
+# Keywords rejected at qualification count even after a bulk approval moves
+# their status on (see idx_opportunities_run_qualification_reason).
+SELECT_RUN_REJECTION_REASON_COUNTS = """
+SELECT blog_qualification_reason AS reason, COUNT(*) AS count
+FROM opportunities
+WHERE run_id = ? AND blog_qualification_status = 'rejected'
+    AND blog_qualification_reason IS NOT NULL
+GROUP BY blog_qualification_reason;
+"""
+
+SELECT_DISCOVERY_RUN_REASON_COUNTS = """
+SELECT reason_counts FROM discovery_runs WHERE id = ?;
+"""
+
+UPDATE_DISCOVERY_RUN_REASON_COUNTS = """
+UPDATE discovery_runs SET reason_counts = ? WHERE id = ?;
 """
 
 UPDATE_DISCOVERY_RUN_LOG_PATH = """
@@ -382,9 +581,7 @@ UPDATE discovery_runs SET log_file_path = ? WHERE id = ?;
 """
 
 SELECT_OPPORTUNITY_BY_SLUG = """
-
-SELECT * FROM opportunities WHERE slug = ?;
-
+SELECT {columns} FROM opportunities WHERE slug = ?;
 """
 
 
@@ -438,22 +635,57 @@ CREATE TABLE IF NOT EXISTS content_history (
 """
 
 # In data_access/queries.py, add history queries:
+# Versions are encoded snapshots or deltas; ai_content_json is only populated
+# on legacy ('full') rows.
 INSERT_CONTENT_HISTORY = """
 INSERT INTO content_history
-(opportunity_id, timestamp, ai_content_json)
-VALUES (?, ?, ?);
+(opportunity_id, timestamp, ai_content_json, version_type, base_id, codec, data, raw_size, title)
+VALUES (?, ?, '', ?, ?, ?, ?, ?, ?);
 """
 
 SELECT_CONTENT_HISTORY_BY_OPP_ID = """
-SELECT id, opportunity_id, timestamp, ai_content_json FROM content_history
+SELECT id, opportunity_id, timestamp, title, version_type,
+       COALESCE(raw_size, LENGTH(ai_content_json)) AS size_bytes
+FROM content_history
 WHERE opportunity_id = ?
 ORDER BY timestamp DESC;
 """
 
+SELECT_LATEST_CONTENT_SNAPSHOT = """
+SELECT s.id, s.codec, s.data,
+       (SELECT COUNT(*) FROM content_history d WHERE d.base_id = s.id) AS delta_count
+FROM content_history s
+WHERE s.opportunity_id = ? AND s.version_type = 'snapshot'
+ORDER BY s.id DESC
+LIMIT 1;
+"""
+
+SELECT_CONTENT_VERSION = """
+SELECT id, version_type, base_id, codec, data, ai_content_json FROM content_history
+WHERE opportunity_id = ? AND {where}
+ORDER BY id DESC
+LIMIT 1;
+"""
+
+SELECT_CONTENT_SNAPSHOT_DATA = "SELECT codec, data FROM content_history WHERE id = ?;"
+
+SELECT_LEGACY_CONTENT_HISTORY = """
+SELECT id, opportunity_id, ai_content_json FROM content_history
+WHERE version_type = 'full'
+ORDER BY opportunity_id, id
+LIMIT ?;
+"""
+
+UPDATE_CONTENT_HISTORY_ENCODING = """
+UPDATE content_history
+SET ai_content_json = '', version_type = ?, base_id = ?, codec = ?, data = ?, raw_size = ?, title = ?
+WHERE id = ?;
+"""
+
 # Update/Add status update query:
 UPDATE_OPPORTUNITY_AI_CONTENT_AND_STATUS = """
 UPDATE opportunities
-SET ai_content_json = ?, ai_content_model = ?, date_processed = ?, status = ?
+SET ai_content_model = ?, date_processed = ?, status = ?
 WHERE id = ?;
 """
 
@@ -477,6 +709,25 @@ ORDER BY date_added DESC
 LIMIT 20;
 """
 
+# Full-text search (see migrations/026_add_search_index.sql). Column weights
+# for bm25: keyword, core_keyword, cluster_name, article_title, seed_keywords.
+SEARCH_ASSETS_FTS = """
+SELECT
+    si.asset_type,
+    si.asset_id,
+    si.keyword,
+    si.seed_keywords,
+    o.status AS opportunity_status,
+    bm25(search_index, 10.0, 4.0, 3.0, 6.0, 8.0) AS rank
+FROM search_index AS si
+LEFT JOIN opportunities AS o
+    ON si.asset_type = 'opportunity' AND o.id = si.asset_id
+WHERE search_index MATCH ? AND si.client_id = ?
+  AND (? IS NULL OR si.asset_type = ?)
+ORDER BY rank
+LIMIT ?;
+"""
+
 SELECT_HIGH_PRIORITY_OPPORTUNITIES = """
 SELECT id, keyword, strategic_score, score_breakdown, keyword_info, keyword_properties, traffic_value FROM opportunities
 WHERE client_id = ? AND status = 'validated'
@@ -508,20 +759,18 @@ VALUES (?, ?, ?, ?);
 
 UPDATE_OPPORTUNITY_SCORES = """
 UPDATE opportunities
-SET strategic_score = ?, score_breakdown = ?, blueprint_data = ?
+SET strategic_score = ?, score_breakdown = ?
 WHERE id = ?;
 """
 
 UPDATE_GENERATED_CONTENT_AND_STATUS = """
 UPDATE opportunities
 SET
-    ai_content_json = ?,
     ai_content_model = ?,
     featured_image_url = ?,
     featured_image_local_path = ?,
     in_article_images_data = ?,
     social_media_posts_json = ?,
-    final_package_json = ?,
     status = 'generated',
     last_workflow_step = 'generation_complete',
     date_processed = ?,
@@ -0,0 +1,68 @@
+# data_access/serp_snapshots.py
+"""
+Splitting of DataForSEO SERP results into a compact snapshot payload plus
+normalized ranking rows, and the reverse. Every item carrying a url/domain
+becomes a `serp_rankings` row pointing at an interned `serp_urls` entry, so
+competitor URLs, titles and domains are stored once across keywords and time.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Tuple
+
+# Request parameters that do not change the SERP returned.
+_VOLATILE_PARAMS = ("keyword", "tag")
+
+
+def serp_params_hash(params: Dict[str, Any]) -> str:
+    """Identifies a SERP variant (location, language, device, depth, options)."""
+    variant = {k: v for k, v in params.items() if k not in _VOLATILE_PARAMS}
+    return hashlib.md5(
+        json.dumps(variant, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def split_serp_result(
+    result: Dict[str, Any],
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Returns (payload, rankings). `payload` is the result with url, domain and
+    title removed from ranked items; `rankings` holds them with the item's
+    position in `items`.
+    """
+    payload = dict(result)
+    items, rankings = [], []
+    for position, item in enumerate(result.get("items") or []):
+        url, domain = item.get("url"), item.get("domain")
+        if isinstance(url, str) and url and isinstance(domain, str) and domain:
+            rankings.append(
+                {
+                    "position": position,
+                    "item_type": item.get("type"),
+                    "rank_group": item.get("rank_group"),
+                    "rank_absolute": item.get("rank_absolute"),
+                    "url": url,
+                    "domain": domain,
+                    "title": item.get("title"),
+                }
+            )
+            item = {
+                k: v for k, v in item.items() if k not in ("url", "domain", "title")
+            }
+        items.append(item)
+    if "items" in result:
+        payload["items"] = items
+    return payload, rankings
+
+
+def join_serp_result(
+    payload: Dict[str, Any], rankings: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Inverse of split_serp_result."""
+    items = payload.get("items") or []
+    for ranking in rankings:
+        position = ranking["position"]
+        if position < len(items):
+            items[position]["url"] = ranking["url"]
+            items[position]["domain"] = ranking["domain"]
+            items[position]["title"] = ranking["title"]
+    return payload
@@ -12,6 +12,7 @@ import logging
 import requests
 from urllib.parse import urlparse
 import hashlib
+from backend.core import serializer
 from backend.data_access.database_manager import DatabaseManager
 from backend.data_mappers.dataforseo_mapper import DataForSEOMapper
 
@@ -95,10 +96,15 @@ class DataForSEOClientV2:
         return truncated_filters
 
     def _post_request(
-        self, endpoint: str, data: List[Dict[str, Any]], tag: Optional[str] = None
+        self,
+        endpoint: str,
+        data: List[Dict[str, Any]],
+        tag: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Tuple[Optional[Dict[str, Any]], float]:
         """
         Handles the actual POST request to the API, with retries and exponential backoff for rate limits.
+        `use_cache=False` bypasses api_cache for responses stored elsewhere (e.g. SERP snapshots).
         """
         cache_key_string = json.dumps(
             {
@@ -110,7 +116,7 @@ class DataForSEOClientV2:
         )
         cache_key = hashlib.md5(cache_key_string.encode("utf-8")).hexdigest()
 
-        if self.enable_cache:
+        if self.enable_cache and use_cache:
             cached_response = self.db_manager.get_api_cache(cache_key)
             if cached_response:
                 self.logger.info(f"Cache HIT for endpoint {endpoint} with tag '{tag}'.")
@@ -126,8 +132,10 @@ class DataForSEOClientV2:
                     task_item["tag"] = tag
 
         full_url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        # Bytes, not str: requests would encode a str body as Latin-1.
+        body = serializer.dumps_bytes(data)
         self.logger.info(
-            f"Making POST request to {full_url} with data: {json.dumps(data)}"
+            f"Making POST request to {full_url} with data: {body.decode('utf-8')}"
         )
         retries = 3
         backoff_factor = 5
@@ -135,7 +143,7 @@ class DataForSEOClientV2:
         for attempt in range(retries):
             try:
                 response = requests.post(
-                    full_url, headers=self.headers, data=json.dumps(data), timeout=120
+                    full_url, headers=self.headers, data=body, timeout=120
                 )
 
                 # W20 FIX: Early exit for critical top-level HTTP errors
@@ -174,7 +182,7 @@ class DataForSEOClientV2:
 
                 cost = response_json.get("cost", 0.0)
 
-                if self.enable_cache:
+                if self.enable_cache and use_cache:
                     self.db_manager.set_api_cache(cache_key, response_json)
 
                 return response_json, cost
@@ -200,7 +208,7 @@ class DataForSEOClientV2:
                         "status_message": f"HTTP error: {e}",
                         "tasks": [], "tasks_error": 1, "cost": 0.0
                     }
-                    if self.enable_cache:
+                    if self.enable_cache and use_cache:
                         self.db_manager.set_api_cache(cache_key, failure_response)
                     return failure_response, 0.0
             except requests.exceptions.RequestException as e:
@@ -217,7 +225,7 @@ class DataForSEOClientV2:
                     "status_message": f"Network error after multiple retries: {e}",
                     "tasks": [], "tasks_error": 1, "cost": 0.0
                 }
-                if self.enable_cache:
+                if self.enable_cache and use_cache:
                     self.db_manager.set_api_cache(cache_key, failure_response)
                 return failure_response, 0.0
 
@@ -226,7 +234,7 @@ class DataForSEOClientV2:
             "status_message": "API request failed after multiple retries (likely rate-limited).",
             "tasks": [], "tasks_error": 1, "cost": 0.0
         }
-        if self.enable_cache:
+        if self.enable_cache and use_cache:
             self.db_manager.set_api_cache(cache_key, failure_response)
         return failure_response, 0.0
 
@@ -646,13 +654,31 @@ class DataForSEOClientV2:
         base_serp_params["device"] = device
         base_serp_params["os"] = os_name
 
+        # SERPs are kept in the normalized snapshot store instead of api_cache.
+        snapshot_params = dict(base_serp_params)
+        if self.enable_cache:
+            snapshot = self.db_manager.get_latest_serp_snapshot(
+                snapshot_params, client_cfg.get("serp_snapshot_max_age_days", 7)
+            )
+            if snapshot:
+                self.logger.info(f"SERP snapshot HIT for '{keyword}'.")
+                return DataForSEOMapper.sanitize_serp_overview_response(snapshot), 0.0
+
         request_tag = f"serp_advanced:{keyword[:50]}"
         response, cost = self._post_request(
-            endpoint, [base_serp_params], tag=request_tag
+            endpoint, [base_serp_params], tag=request_tag, use_cache=False
         )
 
         if response and response.get("tasks") and response["tasks"][0].get("result"):
             result_data = response["tasks"][0]["result"][0]
+            if self.enable_cache:
+                try:
+                    self.db_manager.save_serp_snapshot(snapshot_params, result_data)
+                except Exception as e:
+                    self.logger.error(
+                        f"Failed to store SERP snapshot for '{keyword}': {e}",
+                        exc_info=True,
+                    )
             sanitized_result_data = DataForSEOMapper.sanitize_serp_overview_response(
                 result_data
             )  # ADDED SANITIZATION
@@ -0,0 +1,199 @@
+# external_apis/openai_batch.py
+import io
+import json
+import logging
+import time
+from typing import Dict, Any, List, Optional, Callable
+
+from backend.core import serializer
+from backend.core.cost_ledger import cost_ledger
+from backend.external_apis.openai_client import OpenAIClientWrapper
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchRequest:
+    """One chat completion destined for a batch file."""
+
+    def __init__(
+        self,
+        custom_id: str,
+        messages: List[Dict[str, str]],
+        schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_completion_tokens: int = 4096,
+    ):
+        self.custom_id = custom_id
+        self.messages = messages
+        self.schema = schema
+        self.model = model
+        self.temperature = temperature
+        self.max_completion_tokens = max_completion_tokens
+
+
+class OpenAIBatchRunner:
+    """
+    Runs many chat completions through the OpenAI Batch API: builds a JSONL
+    input file, submits it, polls until the batch finishes and returns the
+    parsed result for each `custom_id`.
+
+    Batches trade latency (up to the completion window) for throughput and a
+    lower per-token price, which suits bulk regeneration jobs.
+    """
+
+    def __init__(self, openai_client: OpenAIClientWrapper, config: Dict[str, Any]):
+        self.openai_client = openai_client
+        self.client = openai_client.client
+        self.config = config
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.poll_interval = float(config.get("openai_batch_poll_seconds", 30))
+        self.timeout = float(config.get("openai_batch_timeout_seconds", 86400))
+        self.completion_window = config.get("openai_batch_completion_window", "24h")
+        self.cost_multiplier = float(config.get("openai_batch_cost_multiplier", 0.5))
+
+    def build_jsonl(self, requests: List[BatchRequest]) -> bytes:
+        lines = []
+        for req in requests:
+            model = req.model or self.config.get("default_model", "gpt-5-nano")
+            body = self.openai_client.build_request_body(
+                req.messages,
+                req.schema,
+                model,
+                req.temperature,
+                req.max_completion_tokens,
+            )
+            lines.append(
+                serializer.dumps(
+                    {
+                        "custom_id": req.custom_id,
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": body,
+                    }
+                )
+            )
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+    def submit(self, requests: List[BatchRequest], metadata: Optional[Dict[str, str]] = None) -> str:
+        """Uploads the JSONL input and creates the batch. Returns the batch ID."""
+        if not requests:
+            raise ValueError("Cannot submit an empty batch.")
+        custom_ids = [r.custom_id for r in requests]
+        if len(set(custom_ids)) != len(custom_ids):
+            raise ValueError("Batch requests must have unique custom_ids.")
+
+        input_file = self.client.files.create(
+            file=("batch_input.jsonl", io.BytesIO(self.build_jsonl(requests))),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+            metadata=metadata or None,
+        )
+        self.logger.info(
+            f"Submitted OpenAI batch {batch.id} with {len(requests)} requests."
+        )
+        return batch.id
+
+    def wait(
+        self,
+        batch_id: str,
+        on_progress: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Polls until the batch reaches a terminal status. `on_progress` receives
+        each batch snapshot; returning False cancels the batch.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            if on_progress is not None and on_progress(batch) is False:
+                self.logger.warning(f"Cancelling OpenAI batch {batch_id} on request.")
+                return self.client.batches.cancel(batch_id)
+            if time.monotonic() > deadline:
+                self.logger.error(f"OpenAI batch {batch_id} timed out; cancelling.")
+                return self.client.batches.cancel(batch_id)
+            time.sleep(self.poll_interval)
+
+    def _read_jsonl(self, file_id: Optional[str]) -> List[Dict[str, Any]]:
+        if not file_id:
+            return []
+        text = self.client.files.content(file_id).text
+        return [serializer.loads(line) for line in text.splitlines() if line.strip()]
+
+    def collect(
+        self, batch: Any, schemas: Dict[str, Optional[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Parses the output and error files into
+        {custom_id: {"response": ..., "error": ..., "cost": ...}}.
+        `schemas` tells which results must be decoded as JSON.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for line in self._read_jsonl(getattr(batch, "output_file_id", None)):
+            custom_id = line.get("custom_id")
+            response = line.get("response") or {}
+            body = response.get("body") or {}
+            if line.get("error") or response.get("status_code", 200) >= 400:
+                error = line.get("error") or body.get("error") or "Request failed."
+                results[custom_id] = {"response": None, "error": str(error), "cost": 0.0}
+                continue
+
+            usage = body.get("usage") or {}
+            cost = (
+                self.openai_client._calculate_cost(usage, body.get("model", ""))
+                * self.cost_multiplier
+            )
+            cost_ledger.record(
+                "openai:batch",
+                cost,
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+            )
+
+            content = None
+            choices = body.get("choices") or []
+            if choices:
+                content = (choices[0].get("message") or {}).get("content")
+            if not content:
+                results[custom_id] = {"response": None, "error": "No content.", "cost": cost}
+                continue
+            if schemas.get(custom_id):
+                try:
+                    content = serializer.loads(content)
+                except json.JSONDecodeError as e:
+                    results[custom_id] = {"response": None, "error": f"Invalid JSON: {e}", "cost": cost}
+                    continue
+            results[custom_id] = {"response": content, "error": None, "cost": cost}
+
+        for line in self._read_jsonl(getattr(batch, "error_file_id", None)):
+            custom_id = line.get("custom_id")
+            if custom_id not in results:
+                error = line.get("error") or (line.get("response") or {}).get("body")
+                results[custom_id] = {"response": None, "error": str(error), "cost": 0.0}
+        return results
+
+    def run(
+        self,
+        requests: List[BatchRequest],
+        on_progress: Optional[Callable[[Any], bool]] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Submits, waits for and collects a batch. Missing results are errors."""
+        batch_id = self.submit(requests, metadata=metadata)
+        batch = self.wait(batch_id, on_progress=on_progress)
+        if batch.status != "completed":
+            self.logger.error(f"OpenAI batch {batch_id} ended with status '{batch.status}'.")
+        results = self.collect(batch, {r.custom_id: r.schema for r in requests})
+        for req in requests:
+            results.setdefault(
+                req.custom_id,
+                {"response": None, "error": f"Batch {batch.status}.", "cost": 0.0},
+            )
+        return results
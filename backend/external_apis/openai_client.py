@@ -1,23 +1,188 @@
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+import hashlib
 import json
 import logging
+import random
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 import time
 
+from backend.core import serializer
+from backend.core.cost_ledger import cost_ledger
+from backend.external_apis.openai_runtime import (
+    agent_metrics,
+    get_rate_limiter,
+    get_shared_client,
+    response_cache,
+)
+
+RETRYABLE_ERRORS = (
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+)
+
 
 class OpenAIClientWrapper:
     """
     Provides a robust wrapper for OpenAI API calls,
     handling authentication, retries, and structured outputs (JSON object format).
+
+    The underlying HTTP client and the rate limiter are shared process-wide
+    (see openai_runtime), so creating a wrapper per orchestrator is cheap.
     """
 
-    def __init__(self, api_key: str, client_cfg: Dict[str, Any]):
+    CACHE_KEY_PREFIX = "openai_chat:"
+
+    def __init__(
+        self,
+        api_key: str,
+        client_cfg: Dict[str, Any],
+        db_manager: Optional[Any] = None,
+    ):
         if not api_key:
             raise ValueError("OpenAI API key is required.")
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_shared_client(
+            api_key,
+            timeout=float(client_cfg.get("openai_request_timeout", 120)),
+            base_url=client_cfg.get("openai_base_url") or None,
+        )
+        self.rate_limiter = get_rate_limiter(
+            api_key,
+            client_cfg.get("openai_requests_per_minute", 0),
+            client_cfg.get("openai_tokens_per_minute", 0),
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
         self.client_cfg = client_cfg
-        self.latest_cost = 0.0
+        self.db_manager = db_manager
+        self._local = threading.local()
+
+        # Response cache: opt-in per agent. The persistent tier lives in
+        # api_cache (needs a db_manager); the memory tier is process-wide.
+        self.cache_agents = set(client_cfg.get("openai_cache_agents") or [])
+        self.cache_ttl_days = int(client_cfg.get("openai_cache_ttl_days", 30))
+        response_cache.configure(client_cfg.get("openai_cache_memory_items", 0))
+
+    @property
+    def latest_cost(self) -> float:
+        """
+        Cost of the last call made *on the calling thread*. Kept for agents that
+        read it right after `call_chat_completion`; job totals come from the
+        cost ledger instead.
+        """
+        return getattr(self._local, "latest_cost", 0.0)
+
+    @latest_cost.setter
+    def latest_cost(self, value: float):
+        self._local.latest_cost = value
+
+    @staticmethod
+    def build_request_body(
+        messages: List[Dict[str, str]],
+        schema: Optional[Dict[str, Any]],
+        model: str,
+        temperature: float,
+        max_completion_tokens: int,
+    ) -> Dict[str, Any]:
+        """Chat completion request body, shared by live calls and batch files."""
+        response_kwargs = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_completion_tokens": max_completion_tokens,
+        }
+
+        # gpt-5-nano and gpt-5-mini do not support temperature
+        if model in ['gpt-5-nano', 'gpt-5-mini']:
+            del response_kwargs['temperature']
+
+        if schema:
+            response_kwargs["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema.get("name", "structured_output"),
+                    "schema": schema,
+                    "strict": True,
+                },
+            }
+        return response_kwargs
+
+    @staticmethod
+    def _estimate_tokens(
+        messages: List[Dict[str, str]], max_completion_tokens: int
+    ) -> int:
+        """Rough pre-call estimate (~4 chars/token) used for TPM reservations."""
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in messages)
+        return prompt_chars // 4 + max_completion_tokens
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        schema: Optional[Dict[str, Any]],
+        model: str,
+        temperature: Optional[float],
+        max_completion_tokens: int,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "schema": schema,
+                "temperature": temperature,
+                "max_completion_tokens": max_completion_tokens,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return self.CACHE_KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_lookup(self, key: str, agent: str) -> Optional[Any]:
+        value = response_cache.get(key)
+        if value is not None:
+            agent_metrics.record_cache(agent, "memory")
+            return value
+        if self.db_manager is not None:
+            try:
+                cached = self.db_manager.get_api_cache(key)
+            except Exception as e:
+                self.logger.warning(f"OpenAI response cache read failed: {e}")
+                cached = None
+            if cached is not None:
+                value = cached.get("response")
+                response_cache.set(key, value, self.cache_ttl_days * 86400)
+                agent_metrics.record_cache(agent, "persistent")
+                return value
+        agent_metrics.record_cache(agent, None)
+        return None
+
+    def _cache_store(self, key: str, value: Any):
+        response_cache.set(key, value, self.cache_ttl_days * 86400)
+        if self.db_manager is not None:
+            try:
+                self.db_manager.set_api_cache(
+                    key, {"response": value}, ttl_days=self.cache_ttl_days
+                )
+            except Exception as e:
+                self.logger.warning(f"OpenAI response cache write failed: {e}")
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Honours Retry-After when present, else exponential backoff with jitter."""
+        response = getattr(error, "response", None)
+        retry_after = None
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get("retry-after"))
+            except (TypeError, ValueError):
+                retry_after = None
+        if retry_after is not None:
+            return retry_after
+        return min(30.0, 2 ** attempt) * (0.5 + random.random())
 
     def _calculate_cost(self, usage: Dict[str, Any], model: str) -> float:
         """Calculates the cost of a chat completion based on token usage."""
@@ -37,7 +202,6 @@ class OpenAIClientWrapper:
         output_cost = (completion_tokens / 1_000_000) * model_pricing["output"]
 
         return input_cost + output_cost
-        pass
 
     def call_chat_completion(
         self,
@@ -47,38 +211,62 @@ class OpenAIClientWrapper:
         temperature: float = 0.7,
         max_completion_tokens: int = 4096,
         retries: int = 3,
+        agent: str = "unattributed",
+        cache: Optional[bool] = None,
     ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
         Makes a robust OpenAI chat completion call, optionally enforcing JSON output
-        and calculating the cost.
+        and calculating the cost. `agent` names the caller for metrics.
+
+        Responses are served from / stored in the response cache when `cache` is
+        True, or when it is None and `agent` is listed in `openai_cache_agents`.
+        Cache hits cost nothing and are not charged to the job ledger.
         """
         if model is None:
             model = self.client_cfg.get('default_model', 'gpt-5-nano')
-        
+
         self.latest_cost = 0.0
+        use_cache = agent in self.cache_agents if cache is None else cache
+        cache_key = None
+        if use_cache:
+            cache_key = self._cache_key(
+                messages,
+                schema,
+                model,
+                None if model in ['gpt-5-nano', 'gpt-5-mini'] else temperature,
+                max_completion_tokens,
+            )
+            cached_response = self._cache_lookup(cache_key, agent)
+            if cached_response is not None:
+                self.logger.info(f"OpenAI response cache hit for agent '{agent}'.")
+                return cached_response, None
+
+        started = time.monotonic()
+        usage_totals = {"prompt_tokens": 0, "completion_tokens": 0, "cost": 0.0}
+        attempts_made = 0
+
+        def finish(result, error):
+            if cache_key and error is None and result:
+                self._cache_store(cache_key, result)
+            agent_metrics.record(
+                agent,
+                latency=time.monotonic() - started,
+                retries=max(0, attempts_made - 1),
+                prompt_tokens=usage_totals["prompt_tokens"],
+                completion_tokens=usage_totals["completion_tokens"],
+                cost=usage_totals["cost"],
+                success=error is None,
+            )
+            return result, error
+
+        estimated_tokens = self._estimate_tokens(messages, max_completion_tokens)
         for attempt in range(retries):
+            attempts_made = attempt + 1
+            reservation = self.rate_limiter.acquire(estimated_tokens)
             try:
-                response_kwargs = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_completion_tokens": max_completion_tokens,
-                }
-
-                # gpt-5-nano and gpt-5-mini do not support temperature
-                if model in ['gpt-5-nano', 'gpt-5-mini']:
-                    del response_kwargs['temperature']
-
-                if schema:
-                    response_kwargs["response_format"] = {
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": schema.get("name", "structured_output"),
-                            "schema": schema,
-                            "strict": True,
-                        },
-                    }
-
+                response_kwargs = self.build_request_body(
+                    messages, schema, model, temperature, max_completion_tokens
+                )
                 response = self.client.chat.completions.create(**response_kwargs)
 
                 if response.choices and response.choices[0].finish_reason == "length":
@@ -89,43 +277,68 @@ class OpenAIClientWrapper:
                     )
 
                 if response.usage:
-                    self.latest_cost = self._calculate_cost(
-                        response.usage.dict(), model
+                    usage = response.usage.dict()
+                    call_cost = self._calculate_cost(usage, model)
+                    prompt_tokens = usage.get("prompt_tokens", 0)
+                    completion_tokens = usage.get("completion_tokens", 0)
+                    self.rate_limiter.settle(
+                        reservation, prompt_tokens + completion_tokens
+                    )
+                    usage_totals["prompt_tokens"] += prompt_tokens
+                    usage_totals["completion_tokens"] += completion_tokens
+                    usage_totals["cost"] += call_cost
+                    # Failed-parse retries are billed too, so report the sum.
+                    self.latest_cost = usage_totals["cost"]
+                    cost_ledger.record(
+                        f"openai:{agent}", call_cost, prompt_tokens, completion_tokens
                     )
 
                 if response.choices and response.choices[0].message.content:
                     if schema:
                         try:
-                            parsed_output = json.loads(
+                            parsed_output = serializer.loads(
                                 response.choices[0].message.content
                             )
                             self.logger.info(
                                 f"Successfully parsed structured output from OpenAI (Attempt {attempt + 1}/{retries}). Cost: ${self.latest_cost:.4f}"
                             )
-                            return parsed_output, None
+                            return finish(parsed_output, None)
                         except json.JSONDecodeError as e:
                             self.logger.warning(
                                 f"Failed to decode JSON from OpenAI (Attempt {attempt + 1}/{retries}): {e}."
                             )
                             continue
                     else:
-                        return response.choices[0].message.content, None
+                        return finish(response.choices[0].message.content, None)
 
                 self.logger.warning(
                     f"OpenAI returned no content (Attempt {attempt + 1}/{retries})."
                 )
                 continue
 
-            except Exception as e:
+            except RETRYABLE_ERRORS as e:
+                self.rate_limiter.settle(reservation, 0)
                 self.logger.error(
                     f"OpenAI API call failed (Attempt {attempt + 1}/{retries}): {e}"
                 )
                 if attempt < retries - 1:
-                    time.sleep(5 * (attempt + 1))
+                    delay = self._retry_delay(e, attempt)
+                    if isinstance(e, RateLimitError):
+                        # Hold back every caller sharing this key, not just this thread.
+                        self.rate_limiter.pause(delay)
+                    else:
+                        self.rate_limiter.backoff(delay)
                     continue
-                return None, str(e)
+                return finish(None, str(e))
+            except Exception as e:
+                # Bad requests, auth and schema errors will not succeed on retry.
+                self.rate_limiter.settle(reservation, 0)
+                self.logger.error(
+                    f"OpenAI API call failed (Attempt {attempt + 1}/{retries}): {e}"
+                )
+                return finish(None, str(e))
 
-        return None, "All OpenAI API call attempts failed."
+        return finish(None, "All OpenAI API call attempts failed.")
 
     def call_image_generation(
         self,
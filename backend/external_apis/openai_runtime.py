@@ -0,0 +1,266 @@
+# external_apis/openai_runtime.py
+"""
+Process-wide plumbing shared by every OpenAIClientWrapper instance: a pooled
+HTTP client per API key, a global request/token-per-minute limiter, the
+in-memory tier of the response cache, and per-agent call metrics.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional
+
+from openai import OpenAI
+
+from backend.core import serializer
+
+_pool_lock = threading.Lock()
+_client_pool: Dict[tuple, OpenAI] = {}
+_limiters: Dict[str, "RateLimiter"] = {}
+
+
+def get_shared_client(
+    api_key: str, timeout: float = 120.0, base_url: Optional[str] = None
+) -> OpenAI:
+    """
+    Returns the process-wide OpenAI client for `api_key` (and optional
+    `base_url`, e.g. a local stand-in server). The client owns an httpx
+    connection pool, so sharing it keeps TLS connections alive across
+    orchestrators and jobs. Retries are handled by the wrapper, not the SDK.
+    """
+    pool_key = (api_key, base_url)
+    with _pool_lock:
+        client = _client_pool.get(pool_key)
+        if client is None:
+            client = OpenAI(
+                api_key=api_key, max_retries=0, timeout=timeout, base_url=base_url
+            )
+            _client_pool[pool_key] = client
+        return client
+
+
+def get_rate_limiter(
+    api_key: str, requests_per_minute: int, tokens_per_minute: int
+) -> "RateLimiter":
+    """Returns the process-wide limiter for `api_key`, updating its limits."""
+    with _pool_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _limiters[api_key] = limiter
+        else:
+            limiter.configure(requests_per_minute, tokens_per_minute)
+        return limiter
+
+
+class RateLimiter:
+    """
+    Sliding one-minute window limiter on requests and tokens.
+
+    Callers reserve an estimated token count before the request and settle it
+    with the real usage afterwards. A 429 from the API pauses every caller
+    sharing the limiter until the advertised retry time, instead of each thread
+    sleeping and retrying independently. A limit of 0 disables that dimension.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self._cond = threading.Condition()
+        self._window: deque = deque()  # [timestamp, tokens] reservations
+        self._window_tokens = 0
+        self._paused_until = 0.0
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(self, requests_per_minute: int, tokens_per_minute: int):
+        with self._cond:
+            self.requests_per_minute = max(0, int(requests_per_minute or 0))
+            self.tokens_per_minute = max(0, int(tokens_per_minute or 0))
+            self._cond.notify_all()
+
+    def _prune(self, now: float):
+        while self._window and now - self._window[0][0] >= self.WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        if now < self._paused_until:
+            return self._paused_until - now
+        if not self._window:
+            return 0.0
+        over_requests = (
+            self.requests_per_minute
+            and len(self._window) >= self.requests_per_minute
+        )
+        over_tokens = (
+            self.tokens_per_minute
+            and self._window_tokens + tokens > self.tokens_per_minute
+        )
+        if over_requests or over_tokens:
+            return self._window[0][0] + self.WINDOW_SECONDS - now
+        return 0.0
+
+    def acquire(self, tokens: int) -> list:
+        """Blocks until the request fits in the window; returns a reservation."""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._wait_time(tokens, now)
+                if wait <= 0:
+                    reservation = [now, tokens]
+                    self._window.append(reservation)
+                    self._window_tokens += tokens
+                    return reservation
+                self._cond.wait(timeout=wait)
+
+    def settle(self, reservation: list, actual_tokens: int):
+        """Replaces a reservation's estimate with the tokens actually used."""
+        with self._cond:
+            if any(r is reservation for r in self._window):
+                self._window_tokens += actual_tokens - reservation[1]
+                reservation[1] = actual_tokens
+            self._cond.notify_all()
+
+    def pause(self, seconds: float):
+        """Holds every caller back for `seconds` (e.g. after a 429)."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def backoff(self, seconds: float):
+        """Waits out a retry delay, waking early if the limits are relaxed."""
+        deadline = time.monotonic() + seconds
+        with self._cond:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._cond.wait(timeout=remaining)
+
+
+class MemoryResponseCache:
+    """
+    Small process-wide LRU of completed responses, in front of the persistent
+    api_cache tier. Entries carry their own expiry so they never outlive the
+    persistent TTL. Values are kept as JSON text and decoded on every hit, so
+    callers that edit a response in place never change the cached copy.
+    """
+
+    def __init__(self, max_items: int = 0):
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self.max_items = max_items
+
+    def configure(self, max_items: int):
+        with self._lock:
+            self.max_items = max(0, int(max_items or 0))
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+        return serializer.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        if self.max_items <= 0:
+            return
+        text = serializer.dumps(value)
+        with self._lock:
+            self._items[key] = (time.time() + ttl_seconds, text)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+response_cache = MemoryResponseCache()
+
+
+class AgentMetrics:
+    """Thread-safe per-agent counters for OpenAI calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agents: Dict[str, Dict[str, Any]] = {}
+        self._cache: Dict[str, Dict[str, int]] = {}
+
+    def record(
+        self,
+        agent: str,
+        latency: float,
+        retries: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost: float,
+        success: bool,
+    ):
+        with self._lock:
+            m = self._agents.setdefault(
+                agent,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_cost": 0.0,
+                    "total_latency_seconds": 0.0,
+                    "max_latency_seconds": 0.0,
+                },
+            )
+            m["calls"] += 1
+            m["errors"] += 0 if success else 1
+            m["retries"] += retries
+            m["prompt_tokens"] += prompt_tokens
+            m["completion_tokens"] += completion_tokens
+            m["total_cost"] += cost
+            m["total_latency_seconds"] += latency
+            m["max_latency_seconds"] = max(m["max_latency_seconds"], latency)
+
+    def record_cache(self, agent: str, tier: Optional[str]):
+        """Counts a cache lookup; `tier` is 'memory', 'persistent' or None (miss)."""
+        with self._lock:
+            c = self._cache.setdefault(
+                agent, {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
+            )
+            c[f"{tier}_hits" if tier else "misses"] += 1
+
+    def snapshot(self, agent: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            names = set(self._agents) | set(self._cache)
+            agents = {}
+            for name in names:
+                if agent is not None and name != agent:
+                    continue
+                m = dict(self._agents.get(name, {}))
+                m["avg_latency_seconds"] = (
+                    m["total_latency_seconds"] / m["calls"] if m.get("calls") else 0.0
+                )
+                if name in self._cache:
+                    c = dict(self._cache[name])
+                    lookups = c["memory_hits"] + c["persistent_hits"] + c["misses"]
+                    c["hit_rate"] = (
+                        (c["memory_hits"] + c["persistent_hits"]) / lookups
+                        if lookups
+                        else 0.0
+                    )
+                    m["cache"] = c
+                agents[name] = m
+        return agents
+
+    def reset(self):
+        with self._lock:
+            self._agents.clear()
+            self._cache.clear()
+
+
+agent_metrics = AgentMetrics()
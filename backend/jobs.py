@@ -1,4 +1,5 @@
 # jobs.py
+import json
 import threading
 import time
 import uuid
@@ -6,6 +7,7 @@ import logging
 from typing import Dict, Any, Callable, Optional
 from datetime import datetime
 from backend.data_access import queries
+from backend.core.cost_ledger import cost_ledger
 
 # Import DatabaseManager
 from backend.data_access.database_manager import DatabaseManager
@@ -93,12 +95,24 @@ class JobManager:
             self.update_job_status(job_id, "running", progress=5)
             self.update_job_progress(job_id, "Job Started", "The workflow is initializing.")
             
-            result = target_function(job_id, *args, **kwargs)
-            
+            # Every metered API call made on this thread is charged to the job.
+            with cost_ledger.bind(job_id):
+                result = target_function(job_id, *args, **kwargs)
+            usage = cost_ledger.pop(job_id)
+            if usage and isinstance(result, dict):
+                result.setdefault("api_usage", usage)
+
+            job_info = self.get_job_status(job_id)
+            if job_info and job_info.get("status") == "failed":
+                # Cancelled while running; keep the cancellation visible.
+                logger.info(f"Job {job_id} finished after being cancelled.")
+                return
+
             self.update_job_progress(job_id, "Job Finished", "The workflow completed successfully.")
             self.update_job_status(job_id, "completed", progress=100, result=result)
             logger.info(f"Job {job_id} completed successfully.")
         except Exception as e:
+            cost_ledger.pop(job_id)
             error_message = f"Job {job_id} failed: {e}"
             logger.error(error_message, exc_info=True)
             self.update_job_progress(job_id, "Job Failed", str(e))
@@ -1,10 +1,17 @@
 # backend/pipeline/orchestrator/analysis_orchestrator.py
+import functools
 import logging
+import threading
 import traceback
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+
+from backend.core.stage_pipeline import Stage, StagePipeline
 
 logger = logging.getLogger(__name__)
 
+# Opportunity statuses that mean another workflow is already running on it.
+ACTIVE_WORKFLOW_STATUSES = ("running", "in_progress", "pending", "refresh_started")
+
 
 class AnalysisOrchestrator:
     def run_analysis_phase(
@@ -13,184 +20,264 @@ class AnalysisOrchestrator:
         selected_competitor_urls: Optional[List[str]] = None,
         use_cached_serp: bool = False,
     ) -> Dict[str, Any]:
+        work = self._start_analysis(
+            opportunity_id, selected_competitor_urls, use_cached_serp
+        )
+        if "result" in work:
+            return work["result"]
+
+        for step in self._analysis_steps():
+            result = self._run_analysis_step(step, work)
+            if result:
+                return result
+        return work["result"]
+
+    def _analysis_steps(self) -> List[Callable[[Dict[str, Any]], Optional[Dict]]]:
+        """The analysis phase in order; a step returns a result when it ends the analysis."""
+        return [
+            self._analysis_fetch_serp,
+            self._analysis_crawl_competitors,
+            self._analysis_synthesize,
+            self._analysis_save_blueprint,
+        ]
+
+    def _start_analysis(
+        self,
+        opportunity_id: int,
+        selected_competitor_urls: Optional[List[str]] = None,
+        use_cached_serp: bool = False,
+    ) -> Dict[str, Any]:
+        """Loads the opportunity and returns the work item the analysis steps fill in."""
+        work: Dict[str, Any] = {
+            "opportunity_id": opportunity_id,
+            "selected_competitor_urls": selected_competitor_urls,
+            "use_cached_serp": use_cached_serp,
+            "total_api_cost": 0.0,
+        }
         opportunity = self.db_manager.get_opportunity_by_id(opportunity_id)
         if not opportunity:
-            return {
+            work["result"] = {
                 "status": "failed",
                 "message": f"Opportunity ID {opportunity_id} not found.",
             }
+            return work
 
         keyword = opportunity.get("keyword")
+        work.update(opportunity=opportunity, keyword=keyword)
         self.logger.info(
             f"--- Orchestrator: Starting Full Analysis for '{keyword}' ---"
         )
         self.db_manager.update_opportunity_workflow_state(
             opportunity_id, "analysis_started", "in_progress"
         )
-        total_api_cost = 0.0
+        return work
 
+    def _run_analysis_step(
+        self, step: Callable[[Dict[str, Any]], Optional[Dict]], work: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Runs one step, turning an unexpected error into a failed analysis."""
         try:
-            # 1. Fetch Live SERP Data
-            if use_cached_serp and opportunity.get("full_data", {}).get(
-                "serp_overview"
-            ):
-                self.logger.info(f"Using cached SERP data for '{keyword}'...")
-                live_serp_data = opportunity["full_data"]["serp_overview"]
-                serp_api_cost = 0.0
-            else:
-                self.logger.info(f"Running live SERP data fetch for '{keyword}'...")
-                from core.serp_analyzer import FullSerpAnalyzer
-
-                serp_analyzer = FullSerpAnalyzer(
-                    self.dataforseo_client, self.client_cfg
-                )
-                live_serp_data, serp_api_cost = serp_analyzer.analyze_serp(keyword)
-                total_api_cost += serp_api_cost
+            result = step(work)
+        except Exception as e:
+            error_message = f"Analysis phase failed unexpectedly: {e}"
+            self.logger.error(f"{error_message}\n{traceback.format_exc()}")
+            self.db_manager.update_opportunity_workflow_state(
+                work["opportunity_id"],
+                "analysis_failed",
+                "failed",
+                error_message=str(e),
+            )
+            result = {
+                "status": "failed",
+                "message": str(e),
+                "api_cost": work["total_api_cost"],
+            }
+        if result:
+            work["result"] = result
+        return result
 
-            if not live_serp_data:
-                raise ValueError("Failed to retrieve live SERP data for analysis.")
+    def _analysis_fetch_serp(self, work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        opportunity, keyword = work["opportunity"], work["keyword"]
 
-            # --- START MODIFICATION ---
-            # 2. NEW: Pre-Analysis Validation Gate (Safeguard for AI Calls)
-            # Count valid "blog/article" results in top 15
-            top_results_for_validation = live_serp_data.get("top_organic_results", [])[
-                :15
-            ]
-            min_relevant_results = self.client_cfg.get(
-                "min_relevant_analysis_results", 3
-            )
-            article_type_results_count = sum(
-                1
-                for r in top_results_for_validation
-                if r.get("page_type") in ["Blog/Article", "News"]
+        # 1. Fetch Live SERP Data
+        if work["use_cached_serp"] and opportunity.get("full_data", {}).get(
+            "serp_overview"
+        ):
+            self.logger.info(f"Using cached SERP data for '{keyword}'...")
+            live_serp_data = opportunity["full_data"]["serp_overview"]
+        else:
+            self.logger.info(f"Running live SERP data fetch for '{keyword}'...")
+            from core.serp_analyzer import FullSerpAnalyzer
+
+            serp_analyzer = FullSerpAnalyzer(self.dataforseo_client, self.client_cfg)
+            live_serp_data, serp_api_cost = serp_analyzer.analyze_serp(keyword)
+            work["total_api_cost"] += serp_api_cost
+
+        if not live_serp_data:
+            raise ValueError("Failed to retrieve live SERP data for analysis.")
+
+        # --- START MODIFICATION ---
+        # 2. NEW: Pre-Analysis Validation Gate (Safeguard for AI Calls)
+        # Count valid "blog/article" results in top 15
+        top_results_for_validation = live_serp_data.get("top_organic_results", [])[:15]
+        min_relevant_results = self.client_cfg.get("min_relevant_analysis_results", 3)
+        article_type_results_count = sum(
+            1
+            for r in top_results_for_validation
+            if r.get("page_type") in ["Blog/Article", "News"]
+        )
+
+        if article_type_results_count < min_relevant_results:
+            reason = f"Analysis failed: SERP is dominated by non-article formats ({article_type_results_count} relevant results found in top 15), making it unsuitable for this workflow."
+            self.db_manager.update_opportunity_workflow_state(
+                work["opportunity_id"], "pre_analysis_validation_failed", "failed", reason
             )
+            self.logger.warning(f"Analysis halted for '{keyword}': {reason}")
+            return {
+                "status": "failed",
+                "message": reason,
+                "api_cost": work["total_api_cost"],
+            }
 
-            if article_type_results_count < min_relevant_results:
-                reason = f"Analysis failed: SERP is dominated by non-article formats ({article_type_results_count} relevant results found in top 15), making it unsuitable for this workflow."
-                self.db_manager.update_opportunity_workflow_state(
-                    opportunity_id, "pre_analysis_validation_failed", "failed", reason
-                )
-                self.logger.warning(f"Analysis halted for '{keyword}': {reason}")
-                return {
-                    "status": "failed",
-                    "message": reason,
-                    "api_cost": total_api_cost,
-                }
+        self.logger.info(
+            f"Pre-analysis validation passed for '{keyword}' ({article_type_results_count} relevant results in top 15). Proceeding with blueprint generation."
+        )
+        # --- END MODIFICATION ---
+        work["live_serp_data"] = live_serp_data
+        return None
 
+    def _analysis_crawl_competitors(
+        self, work: Dict[str, Any], shared_crawl: Optional[Any] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        3. Conditional Competitor OnPage Analysis. A bulk analysis passes its
+        SharedCompetitorCrawl so URLs shared by keywords are fetched once.
+        """
+        work["competitor_analysis"] = []
+        work["crawl_stats"] = None
+
+        if not self.client_cfg.get("enable_deep_competitor_analysis", False):
             self.logger.info(
-                f"Pre-analysis validation passed for '{keyword}' ({article_type_results_count} relevant results in top 15). Proceeding with blueprint generation."
+                "Deep competitor analysis is DISABLED. Skipping OnPage competitor analysis."
             )
-            # --- END MODIFICATION ---
-
-            # 3. Conditional Competitor OnPage Analysis
-            competitor_analysis = []
-            competitor_api_cost = 0.0
+            return None
 
-            if self.client_cfg.get("enable_deep_competitor_analysis", False):
-                self.logger.info(
-                    "Deep competitor analysis is ENABLED. Running OnPage competitor analysis."
-                )
-                from pipeline.step_04_analysis.competitor_analyzer import (
-                    FullCompetitorAnalyzer,
+        self.logger.info(
+            "Deep competitor analysis is ENABLED. Running OnPage competitor analysis."
+        )
+        top_organic_urls = [
+            result["url"]
+            for result in work["live_serp_data"].get("top_organic_results", [])[
+                : self.client_cfg.get("num_competitors_to_analyze", 5)
+            ]
+        ]
+        if shared_crawl is not None:
+            competitor_analysis, competitor_api_cost, crawl_stats = (
+                shared_crawl.analyze_competitors(
+                    top_organic_urls, work["selected_competitor_urls"]
                 )
+            )
+        else:
+            from pipeline.step_04_analysis.competitor_analyzer import (
+                FullCompetitorAnalyzer,
+            )
 
-                competitor_analyzer = FullCompetitorAnalyzer(
-                    self.dataforseo_client, self.client_cfg
-                )
-                top_organic_urls = [
-                    result["url"]
-                    for result in live_serp_data.get("top_organic_results", [])[
-                        : self.client_cfg.get("num_competitors_to_analyze", 5)
-                    ]
-                ]
-                competitor_analysis, competitor_api_cost = (
-                    competitor_analyzer.analyze_competitors(
-                        top_organic_urls, selected_competitor_urls
-                    )
-                )
-                total_api_cost += competitor_api_cost
-            else:
-                self.logger.info(
-                    "Deep competitor analysis is DISABLED. Skipping OnPage competitor analysis."
+            competitor_analyzer = FullCompetitorAnalyzer(
+                self.dataforseo_client, self.client_cfg
+            )
+            competitor_analysis, competitor_api_cost = (
+                competitor_analyzer.analyze_competitors(
+                    top_organic_urls, work["selected_competitor_urls"]
                 )
+            )
+            crawl_stats = competitor_analyzer.last_crawl_stats
+        work["total_api_cost"] += competitor_api_cost
+        work["competitor_analysis"] = competitor_analysis
+        work["crawl_stats"] = crawl_stats
+        return None
 
-            # 4. Content Intelligence Synthesis
-            from pipeline.step_04_analysis.content_analyzer import ContentAnalyzer
+    def _analysis_synthesize(self, work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        keyword = work["keyword"]
+        live_serp_data = work["live_serp_data"]
+        competitor_analysis = work["competitor_analysis"]
 
-            content_analyzer = ContentAnalyzer(self.openai_client, self.client_cfg)
-            content_intelligence, content_api_cost = (
-                content_analyzer.synthesize_content_intelligence(
-                    keyword,
-                    live_serp_data,
-                    competitor_analysis,  # Pass this list; it will be empty for the fast workflow
-                )
-            )
-            total_api_cost += content_api_cost
+        # 4. Content Intelligence Synthesis
+        from pipeline.step_04_analysis.content_analyzer import ContentAnalyzer
 
-            # 5. Determine Strategy & Generate Outline
-            from pipeline.step_05_strategy.decision_engine import (
-                StrategicDecisionEngine,
+        content_analyzer = ContentAnalyzer(self.openai_client, self.client_cfg)
+        content_intelligence, content_api_cost = (
+            content_analyzer.synthesize_content_intelligence(
+                keyword,
+                live_serp_data,
+                competitor_analysis,  # Pass this list; it will be empty for the fast workflow
             )
+        )
+        work["total_api_cost"] += content_api_cost
 
-            strategy_engine = StrategicDecisionEngine(self.client_cfg)
-            recommended_strategy = strategy_engine.determine_strategy(
-                live_serp_data, competitor_analysis, content_intelligence
-            )
+        # 5. Determine Strategy & Generate Outline
+        from pipeline.step_05_strategy.decision_engine import (
+            StrategicDecisionEngine,
+        )
 
-            ai_outline, outline_api_cost = content_analyzer.generate_ai_outline(
-                keyword, live_serp_data, content_intelligence
-            )
-            total_api_cost += outline_api_cost
-            content_intelligence.update(ai_outline)
+        strategy_engine = StrategicDecisionEngine(self.client_cfg)
+        recommended_strategy = strategy_engine.determine_strategy(
+            live_serp_data, competitor_analysis, content_intelligence
+        )
 
-            if not content_intelligence.get("article_structure"):
-                self.logger.critical(
-                    "AI outline generation failed to produce an 'article_structure'."
-                )
-                raise ValueError("AI outline generation failed.")
-
-            # 6. Assemble and Save Blueprint & Re-Score
-            analysis_data = {
-                "serp_overview": live_serp_data,
-                "competitor_analysis": competitor_analysis,
-                "content_intelligence": content_intelligence,
-                "recommended_strategy": recommended_strategy,
-            }
+        ai_outline, outline_api_cost = content_analyzer.generate_ai_outline(
+            keyword, live_serp_data, content_intelligence
+        )
+        work["total_api_cost"] += outline_api_cost
+        content_intelligence.update(ai_outline)
 
-            blueprint = self.blueprint_factory.create_blueprint(
-                seed_topic=keyword,
-                winning_keyword_data=opportunity.get("full_data", {}).copy(),
-                analysis_data=analysis_data,
-                total_api_cost=total_api_cost,
-                client_id=opportunity.get("client_id"),
+        if not content_intelligence.get("article_structure"):
+            self.logger.critical(
+                "AI outline generation failed to produce an 'article_structure'."
             )
+            raise ValueError("AI outline generation failed.")
 
-            opportunity["blueprint"] = blueprint
+        work["content_intelligence"] = content_intelligence
+        work["recommended_strategy"] = recommended_strategy
+        return None
 
-            final_score, final_score_breakdown = self.scoring_engine.calculate_score(
-                opportunity
-            )
+    def _analysis_save_blueprint(self, work: Dict[str, Any]) -> Dict[str, Any]:
+        opportunity_id, opportunity = work["opportunity_id"], work["opportunity"]
 
-            self.db_manager.update_opportunity_scores(
-                opportunity_id, final_score, final_score_breakdown, blueprint
-            )
-            self.db_manager.update_opportunity_workflow_state(
-                opportunity_id, "analysis_completed", "paused_for_approval"
-            )
+        # 6. Assemble and Save Blueprint & Re-Score
+        analysis_data = {
+            "serp_overview": work["live_serp_data"],
+            "competitor_analysis": work["competitor_analysis"],
+            "content_intelligence": work["content_intelligence"],
+            "recommended_strategy": work["recommended_strategy"],
+        }
 
-            return {
-                "status": "success",
-                "message": "Analysis phase completed and opportunity re-scored.",
-                "api_cost": total_api_cost,
-            }
+        blueprint = self.blueprint_factory.create_blueprint(
+            seed_topic=work["keyword"],
+            winning_keyword_data=opportunity.get("full_data", {}).copy(),
+            analysis_data=analysis_data,
+            total_api_cost=work["total_api_cost"],
+            client_id=opportunity.get("client_id"),
+        )
 
-        except Exception as e:
-            error_message = f"Analysis phase failed unexpectedly: {e}"
-            self.logger.error(f"{error_message}\n{traceback.format_exc()}")
-            self.db_manager.update_opportunity_workflow_state(
-                opportunity_id, "analysis_failed", "failed", error_message=str(e)
-            )
-            return {"status": "failed", "message": str(e), "api_cost": total_api_cost}
+        opportunity["blueprint"] = blueprint
+
+        final_score, final_score_breakdown = self.scoring_engine.calculate_score(
+            opportunity
+        )
+
+        self.db_manager.update_opportunity_scores(
+            opportunity_id, final_score, final_score_breakdown, blueprint
+        )
+        self.db_manager.update_opportunity_workflow_state(
+            opportunity_id, "analysis_completed", "paused_for_approval"
+        )
+
+        return {
+            "status": "success",
+            "message": "Analysis phase completed and opportunity re-scored.",
+            "api_cost": work["total_api_cost"],
+            "crawl_stats": work["crawl_stats"],
+        }
 
     def _run_analysis_background(
         self,
@@ -199,8 +286,10 @@ class AnalysisOrchestrator:
         selected_competitor_urls: Optional[List[str]],
     ):
         try:
-            self.run_analysis_phase(opportunity_id, selected_competitor_urls)
-            self.job_manager.update_job_status(job_id, "completed", progress=100)
+            result = self.run_analysis_phase(opportunity_id, selected_competitor_urls)
+            self.job_manager.update_job_status(
+                job_id, "completed", progress=100, result=result
+            )
         except Exception as e:
             self.job_manager.update_job_status(job_id, "failed", error=str(e))
             raise
@@ -213,3 +302,147 @@ class AnalysisOrchestrator:
             args=(opportunity_id, selected_competitor_urls),
         )
         return job_id
+
+    def _run_bulk_analysis_background(
+        self, job_id: str, opportunity_ids: List[int]
+    ) -> Dict[str, Any]:
+        """
+        Analyzes many opportunities as a staged pipeline: SERP fetch,
+        competitor crawl (deduplicated across keywords), AI synthesis and
+        blueprint persistence each run with their own worker count and a
+        bounded queue, so stages overlap across keywords and a slow stage
+        holds back the ones before it. Opportunities of other clients, or with
+        a workflow already active, are skipped.
+        """
+        from pipeline.step_04_analysis.competitor_analyzer import (
+            SharedCompetitorCrawl,
+        )
+
+        self.job_manager.update_job_status(
+            job_id, "running", progress=5, result={"step": "Starting Bulk Analysis"}
+        )
+        shared_crawl = SharedCompetitorCrawl(self.dataforseo_client, self.client_cfg)
+        results: Dict[int, Dict[str, Any]] = {}
+        skipped: List[int] = []
+        results_lock = threading.Lock()
+        total = len(opportunity_ids)
+        cancelled = threading.Event()
+
+        def is_cancelled() -> bool:
+            if not cancelled.is_set():
+                job_status = self.job_manager.get_job_status(job_id)
+                if job_status and job_status.get("status") == "failed":
+                    cancelled.set()
+            return cancelled.is_set()
+
+        def record(opportunity_id: int, result: Dict[str, Any]) -> None:
+            with results_lock:
+                results[opportunity_id] = result
+                done = len(results)
+                # A progress write would set a cancelled job back to running.
+                if is_cancelled():
+                    return
+                self.job_manager.update_job_status(
+                    job_id,
+                    "running",
+                    progress=5 + int(90 * done / max(1, total)),
+                    result={"step": f"Analyzed {done}/{total} opportunities"},
+                )
+
+        def stage_step(step: Callable[[Dict[str, Any]], Optional[Dict]]):
+            def run(work: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                result = self._run_analysis_step(step, work)
+                if result:
+                    record(work["opportunity_id"], result)
+                    return None
+                return work
+
+            return run
+
+        def work_items():
+            for opportunity_id in opportunity_ids:
+                # Checked before the opportunity is marked in_progress, so a
+                # cancel never leaves one started but never run.
+                if is_cancelled():
+                    return
+                summary = self.db_manager.get_opportunity_by_id(
+                    opportunity_id, projection="summary"
+                )
+                if (
+                    not summary
+                    or summary.get("client_id") != self.client_id
+                    or summary.get("status") in ACTIVE_WORKFLOW_STATUSES
+                ):
+                    skipped.append(opportunity_id)
+                    continue
+                work = self._start_analysis(opportunity_id)
+                if "result" in work:
+                    record(opportunity_id, work["result"])
+                    continue
+                yield work
+
+        cfg = self.client_cfg
+        pipeline = StagePipeline(
+            [
+                Stage(
+                    "serp",
+                    stage_step(self._analysis_fetch_serp),
+                    workers=cfg.get("bulk_analysis_serp_workers", 4),
+                    queue_size=cfg.get("bulk_analysis_queue_size", 4),
+                ),
+                Stage(
+                    "competitors",
+                    stage_step(
+                        functools.partial(
+                            self._analysis_crawl_competitors, shared_crawl=shared_crawl
+                        )
+                    ),
+                    workers=cfg.get("bulk_analysis_crawl_workers", 2),
+                    queue_size=cfg.get("bulk_analysis_queue_size", 4),
+                ),
+                Stage(
+                    "synthesis",
+                    stage_step(self._analysis_synthesize),
+                    workers=cfg.get("bulk_analysis_synthesis_workers", 3),
+                    queue_size=cfg.get("bulk_analysis_queue_size", 4),
+                ),
+                Stage(
+                    "persistence",
+                    stage_step(self._analysis_save_blueprint),
+                    workers=cfg.get("bulk_analysis_persist_workers", 1),
+                    queue_size=cfg.get("bulk_analysis_queue_size", 4),
+                ),
+            ],
+            job_id=job_id,
+        )
+        pipeline_stats = pipeline.run(work_items(), should_stop=is_cancelled)
+
+        succeeded = [
+            opp_id for opp_id, result in results.items() if result.get("status") == "success"
+        ]
+        failed = {
+            opp_id: result.get("message")
+            for opp_id, result in results.items()
+            if result.get("status") != "success"
+        }
+        return {
+            "status": "success" if not failed else "partial",
+            "message": f"Analysis completed for {len(succeeded)} of {total} opportunities.",
+            "succeeded_ids": succeeded,
+            "failed": failed,
+            "skipped_ids": skipped,
+            "api_cost": sum(result.get("api_cost", 0.0) for result in results.values()),
+            "pipeline": pipeline_stats,
+            "competitor_crawl": shared_crawl.stats(),
+        }
+
+    def run_bulk_analysis(self, opportunity_ids: List[int]) -> str:
+        """Public method to analyze many opportunities in one staged pipeline job."""
+        self.logger.info(
+            f"--- Orchestrator: Initiating Bulk Analysis for {len(opportunity_ids)} opportunities (Async) ---"
+        )
+        job_id = self.job_manager.create_job(
+            target_function=self._run_bulk_analysis_background,
+            args=(list(dict.fromkeys(opportunity_ids)),),
+        )
+        return job_id
@@ -3,6 +3,8 @@ import logging
 import traceback
 from typing import Dict, Any, List, Optional
 
+from backend.core.article_document import ArticleDocument
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,6 +155,7 @@ class ContentOrchestrator:
             MAX_REFINEMENT_ATTEMPTS = 3
             current_html = opportunity["ai_content"]["article_body_html"]
             final_audit_results = {}
+            article_document = None
 
             for attempt in range(MAX_REFINEMENT_ATTEMPTS):
                 self.job_manager.update_job_status(
@@ -162,8 +165,10 @@ class ContentOrchestrator:
                     result={"step": f"Auditing Content (Attempt {attempt + 1})"},
                 )
 
+                # Parsed once per version; the formatter reuses the last one.
+                article_document = ArticleDocument(current_html)
                 audit_results = self.content_auditor.audit_content(
-                    article_html=current_html,
+                    article_html=article_document,
                     primary_keyword=opportunity.get("keyword", ""),
                     blueprint=opportunity.get("blueprint", {}),
                     client_cfg=self.client_cfg,
@@ -235,6 +240,7 @@ class ContentOrchestrator:
                     messages=refine_prompt_messages,
                     model=self.client_cfg.get("default_model", "gpt-5-nano"),
                     temperature=0.2,
+                    agent="content_refinement",
                 )
                 total_api_cost += self.openai_client.latest_cost # Aggregate cost
 
@@ -289,6 +295,7 @@ class ContentOrchestrator:
                 opportunity,
                 internal_linking_suggestions=internal_link_suggestions,
                 in_article_images_data=[],
+                document=article_document,
             )
 
             self.job_manager.update_job_status(
@@ -73,7 +73,9 @@ class CostEstimator:
         if not opportunity_id:
             raise ValueError(f"opportunity_id is required for action '{action}'.")
 
-        opportunity = self.db_manager.get_opportunity_by_id(opportunity_id)
+        opportunity = self.db_manager.get_opportunity_by_id(
+            opportunity_id, projection="summary"
+        )
         if not opportunity:
             raise ValueError("Opportunity not found.")
 
@@ -11,6 +11,7 @@ from backend.agents.internal_linking_suggester import InternalLinkingSuggester
 from backend.agents.html_formatter import HtmlFormatter
 from backend.core.blueprint_factory import BlueprintFactory
 from backend.agents.content_auditor import ContentAuditor
+from backend.agents.summary_generator import SummaryGenerator
 from backend.agents.prompt_assembler import DynamicPromptAssembler
 from backend.services.serp_analysis_service import SerpAnalysisService
 from backend.pipeline.step_03_prioritization.scoring_engine import ScoringEngine
@@ -58,7 +59,7 @@ class WorkflowOrchestrator(
         )
 
         self.openai_client = OpenAIClientWrapper(
-            self.client_cfg.get("openai_api_key"), self.client_cfg
+            self.client_cfg.get("openai_api_key"), self.client_cfg, self.db_manager
         )
         self.dataforseo_client = DataForSEOClientV2(
             login=self.client_cfg["dataforseo_login"],
@@ -85,5 +86,6 @@ class WorkflowOrchestrator(
             self.db_manager,
         )
         self.content_auditor = ContentAuditor()
+        self.summary_generator = SummaryGenerator()
         self.prompt_assembler = DynamicPromptAssembler(self.db_manager)
         self.serp_analysis_service = SerpAnalysisService(self.dataforseo_client, self.client_cfg)
@@ -1,6 +1,9 @@
 # backend/pipeline/orchestrator/social_orchestrator.py
 import logging
 import traceback
+from typing import List
+
+from backend.external_apis.openai_batch import OpenAIBatchRunner
 
 logger = logging.getLogger(__name__)
 
@@ -56,3 +59,107 @@ class SocialOrchestrator:
             args=(opportunity_id,),
         )
         return job_id
+
+    def _run_bulk_social_posts_background(
+        self, job_id: str, opportunity_ids: List[int]
+    ):
+        """
+        Regenerates social posts for many opportunities. Large sets go through
+        the OpenAI Batch API (one JSONL job, polled to completion); small sets,
+        or clients with batching disabled, fall back to sequential calls.
+        """
+        self.job_manager.update_job_status(
+            job_id, "running", progress=5, result={"step": "Loading Opportunities"}
+        )
+        opportunities, skipped = {}, []
+        for opportunity_id in opportunity_ids:
+            opportunity = self.db_manager.get_opportunity_by_id(opportunity_id)
+            if not opportunity or opportunity.get("client_id") != self.client_id:
+                skipped.append(opportunity_id)
+                continue
+            opportunity["client_cfg"] = self.client_cfg
+            opportunities[opportunity_id] = opportunity
+
+        use_batch = self.client_cfg.get("openai_batch_enabled", True) and len(
+            opportunities
+        ) >= self.client_cfg.get("openai_batch_min_size", 10)
+
+        updated, failed, total_cost = [], {}, 0.0
+        if use_batch:
+            runner = OpenAIBatchRunner(self.openai_client, self.client_cfg)
+            requests = [
+                self.social_crafter.build_batch_request(opp, f"opportunity-{opp_id}")
+                for opp_id, opp in opportunities.items()
+            ]
+            self.job_manager.update_job_status(
+                job_id,
+                "running",
+                progress=10,
+                result={"step": f"Submitting batch of {len(requests)} requests"},
+            )
+
+            def on_progress(batch) -> bool:
+                job_status = self.job_manager.get_job_status(job_id)
+                if job_status and job_status.get("status") == "failed":
+                    return False  # Cancelled by the user.
+                counts = getattr(batch, "request_counts", None)
+                done = (counts.completed + counts.failed) if counts else 0
+                progress = 10 + int(80 * done / max(1, len(requests)))
+                self.job_manager.update_job_status(
+                    job_id,
+                    "running",
+                    progress=progress,
+                    result={"step": f"Batch {batch.status}: {done}/{len(requests)}"},
+                )
+                return True
+
+            results = runner.run(
+                requests,
+                on_progress=on_progress,
+                metadata={"job_id": job_id, "client_id": self.client_id},
+            )
+            for opp_id in opportunities:
+                outcome = results[f"opportunity-{opp_id}"]
+                total_cost += outcome["cost"]
+                posts = (outcome["response"] or {}).get("social_media_posts")
+                if posts:
+                    self.db_manager.update_opportunity_social_posts(opp_id, posts)
+                    updated.append(opp_id)
+                else:
+                    failed[opp_id] = outcome["error"] or "No posts returned."
+        else:
+            for i, (opp_id, opportunity) in enumerate(opportunities.items()):
+                self.job_manager.update_job_status(
+                    job_id,
+                    "running",
+                    progress=10 + int(80 * i / max(1, len(opportunities))),
+                    result={"step": f"Crafting posts {i + 1}/{len(opportunities)}"},
+                )
+                posts, cost = self.social_crafter.craft_posts(opportunity)
+                total_cost += cost
+                if posts:
+                    self.db_manager.update_opportunity_social_posts(opp_id, posts)
+                    updated.append(opp_id)
+                else:
+                    failed[opp_id] = "No posts returned."
+
+        return {
+            "status": "success" if not failed else "partial",
+            "message": f"Social posts regenerated for {len(updated)} of {len(opportunity_ids)} opportunities.",
+            "mode": "batch" if use_batch else "sequential",
+            "updated_ids": updated,
+            "failed": failed,
+            "skipped_ids": skipped,
+            "api_cost": total_cost,
+        }
+
+    def regenerate_social_posts_bulk(self, opportunity_ids: List[int]) -> str:
+        """Public method to regenerate social posts for many opportunities asynchronously."""
+        self.logger.info(
+            f"--- Orchestrator: Initiating Bulk Social Post Regeneration for {len(opportunity_ids)} opportunities (Async) ---"
+        )
+        job_id = self.job_manager.create_job(
+            target_function=self._run_bulk_social_posts_background,
+            args=(list(opportunity_ids),),
+        )
+        return job_id
@@ -11,7 +11,9 @@ class ValidationOrchestrator:
         Runs a cost-effective final validation gate before committing to a full analysis.
         Makes one live SERP call and a deep cannibalization check.
         """
-        opportunity = self.db_manager.get_opportunity_by_id(opportunity_id)
+        opportunity = self.db_manager.get_opportunity_by_id(
+            opportunity_id, projection="analysis"
+        )
         if not opportunity:
             return {
                 "status": "failed",
@@ -114,7 +114,10 @@ def run_discovery_phase(
             )
         else:
             # 4. Score the remaining keywords
-            score, breakdown = scoring_engine.calculate_score(opp)
+            # The readable breakdown is rebuilt on demand; most rows never need it.
+            score, breakdown = scoring_engine.calculate_score(
+                opp, compact=client_cfg.get("compact_score_breakdown", False)
+            )
             opp["strategic_score"] = score
             opp["score_breakdown"] = breakdown
 
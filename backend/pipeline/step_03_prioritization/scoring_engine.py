@@ -1,5 +1,11 @@
 import logging
 from typing import Dict, Any, Tuple
+
+from backend.core.score_breakdown import (
+    COMPONENT_NAMES,
+    compact_breakdown,
+    is_compact_breakdown,
+)
 from .scoring_components import (
     calculate_ease_of_ranking_score,
     calculate_traffic_potential_score,
@@ -28,11 +34,12 @@ class ScoringEngine:
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def calculate_score(
-        self, opportunity: Dict[str, Any]
+        self, opportunity: Dict[str, Any], compact: bool = False
     ) -> Tuple[float, Dict[str, Any]]:
         """
         Calculates the final opportunity score by combining weighted scores
-        from all registered scoring components.
+        from all registered scoring components. With `compact`, the breakdown
+        keeps only each component's score and weight (see core.score_breakdown).
         """
         if not isinstance(opportunity, dict):
             self.logger.warning(
@@ -48,7 +55,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["ease_of_ranking"] = {
-            "name": "Ease of Ranking",
+            "name": COMPONENT_NAMES["ease_of_ranking"],
             "score": ease_score,
             "breakdown": ease_breakdown,
         }
@@ -57,7 +64,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["traffic_potential"] = {
-            "name": "Traffic Potential",
+            "name": COMPONENT_NAMES["traffic_potential"],
             "score": traffic_score,
             "breakdown": traffic_breakdown,
         }
@@ -66,7 +73,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["commercial_intent"] = {
-            "name": "Commercial Intent",
+            "name": COMPONENT_NAMES["commercial_intent"],
             "score": intent_score,
             "breakdown": intent_breakdown,
         }
@@ -75,7 +82,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["growth_trend"] = {
-            "name": "Growth Trend",
+            "name": COMPONENT_NAMES["growth_trend"],
             "score": trend_score,
             "breakdown": trend_breakdown,
         }
@@ -84,7 +91,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["serp_features"] = {
-            "name": "SERP Opportunity",
+            "name": COMPONENT_NAMES["serp_features"],
             "score": features_score,
             "breakdown": features_breakdown,
         }
@@ -93,7 +100,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["serp_volatility"] = {
-            "name": "SERP Volatility",
+            "name": COMPONENT_NAMES["serp_volatility"],
             "score": volatility_score,
             "breakdown": volatility_breakdown,
         }
@@ -102,7 +109,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["competitor_weakness"] = {
-            "name": "Competitor Weakness",
+            "name": COMPONENT_NAMES["competitor_weakness"],
             "score": weakness_score,
             "breakdown": weakness_breakdown,
         }
@@ -111,7 +118,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["serp_crowding"] = {
-            "name": "SERP Crowding",
+            "name": COMPONENT_NAMES["serp_crowding"],
             "score": crowding_score,
             "breakdown": crowding_breakdown,
         }
@@ -120,7 +127,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["keyword_structure"] = {
-            "name": "Keyword Structure",
+            "name": COMPONENT_NAMES["keyword_structure"],
             "score": structure_score,
             "breakdown": structure_breakdown,
         }
@@ -129,7 +136,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["serp_threat"] = {
-            "name": "SERP Threat",
+            "name": COMPONENT_NAMES["serp_threat"],
             "score": threat_score,
             "breakdown": threat_breakdown,
         }
@@ -138,7 +145,7 @@ class ScoringEngine:
             calculate_volume_volatility_score(data_source, self.config)
         )
         breakdown["volume_volatility"] = {
-            "name": "Volume Volatility",
+            "name": COMPONENT_NAMES["volume_volatility"],
             "score": volume_volatility_score,
             "breakdown": volume_volatility_breakdown,
         }
@@ -147,7 +154,7 @@ class ScoringEngine:
             data_source, self.config
         )
         breakdown["serp_freshness"] = {
-            "name": "SERP Freshness",
+            "name": COMPONENT_NAMES["serp_freshness"],
             "score": freshness_score,
             "breakdown": freshness_breakdown,
         }
@@ -156,7 +163,7 @@ class ScoringEngine:
             calculate_competitor_performance_score(opportunity, self.config)
         )
         breakdown["competitor_performance"] = {
-            "name": "Competitor Tech Performance",
+            "name": COMPONENT_NAMES["competitor_performance"],
             "score": performance_score,
             "breakdown": performance_breakdown,
         }
@@ -181,7 +188,8 @@ class ScoringEngine:
 
         total_weight = sum(weights.values())
         if total_weight == 0:
-            return 0.0, breakdown  # Avoid division by zero
+            # Avoid division by zero
+            return 0.0, compact_breakdown(breakdown) if compact else breakdown
 
         final_score = (
             (ease_score * weights["ease"])
@@ -219,4 +227,25 @@ class ScoringEngine:
             weight_key = weight_key_map.get(key, "")
             breakdown_data["weight"] = weights.get(weight_key, 0)
 
+        if compact:
+            return round(final_score, 2), compact_breakdown(breakdown)
         return round(final_score, 2), breakdown
+
+    def explain_breakdown(self, opportunity: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the opportunity's full score breakdown. A compact breakdown is
+        expanded by re-running the components on the stored data; component
+        scores and weights stay as they were when the opportunity was scored.
+        """
+        stored = opportunity.get("score_breakdown") or (
+            opportunity.get("full_data") or {}
+        ).get("score_breakdown")
+        if not is_compact_breakdown(stored):
+            return stored or {}
+        _, breakdown = self.calculate_score(opportunity)
+        weights = stored.get("weights", {})
+        for key, score in stored.get("scores", {}).items():
+            if key in breakdown:
+                breakdown[key]["score"] = score
+                breakdown[key]["weight"] = weights.get(key, 0)
+        return breakdown
@@ -1,9 +1,12 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 from urllib.parse import urlparse
-import textstat
 
 from external_apis.dataforseo_client_v2 import DataForSEOClientV2
+from core.text_statistics import TextStatistics
 
 
 class FullCompetitorAnalyzer:
@@ -14,6 +17,9 @@ class FullCompetitorAnalyzer:
     def __init__(self, client: DataForSEOClientV2, config: Dict[str, Any]):
         self.client = client
         self.config = config
+        # Competitor pages are stored in the client's database, when it has one.
+        self.db_manager = getattr(client, "db_manager", None)
+        self.last_crawl_stats: Optional[Dict[str, Any]] = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self.min_word_count = self.config.get("min_competitor_word_count", 300)
 
@@ -40,164 +46,343 @@ class FullCompetitorAnalyzer:
     ) -> Tuple[List[Dict[str, Any]], float]:
         """
         Fetches and analyzes competitor data using a two-tier, adaptive fetching strategy.
-        First attempts a cheap scan without JS, then retries failures with JS enabled.
+        Pages parsed within `competitor_page_max_age_days` (for any keyword or
+        client) are reused from the competitor page store; only missing or stale
+        URLs are fetched. URLs of domains whose crawl profile shows they need JS
+        go straight to Tier 2 (JS enabled), concurrently with Tier 1 (JS
+        disabled) for the rest; Tier 1 failures are then retried in Tier 2.
+        Fetch counts and estimated savings are left in `last_crawl_stats`.
         """
-        urls_to_scan = selected_urls or competitor_urls
+        urls_to_scan = list(dict.fromkeys(selected_urls or competitor_urls))
+        self.last_crawl_stats = None
         if not urls_to_scan:
             return [], 0.0
 
-        total_api_cost = 0.0
-        successful_results = []
-        urls_that_need_js_retry = []
+        started = time.perf_counter()
+        pages = self._get_stored_pages(urls_to_scan)
+        urls_to_fetch = [url for url in urls_to_scan if url not in pages]
+        if pages:
+            self.logger.info(
+                f"Reusing {len(pages)} stored competitor pages; {len(urls_to_fetch)} URLs to fetch."
+            )
+
+        profiles = self._get_domain_profiles(urls_to_fetch)
+        js_urls = [
+            url
+            for url in urls_to_fetch
+            if self._needs_javascript(profiles.get(urlparse(url).netloc))
+        ]
+        tier1_urls = [url for url in urls_to_fetch if url not in js_urls]
+
+        tier1 = direct_tier2 = retry_tier2 = None
+        tiers_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            direct_future = None
+            if js_urls:
+                self.logger.info(
+                    f"Sending {len(js_urls)} URLs of known JS domains straight to Tier 2."
+                )
+                direct_future = executor.submit(self._run_tier, 2, js_urls)
+            if tier1_urls:
+                tier1 = self._run_tier(1, tier1_urls)
+                if tier1["failed_urls"]:
+                    retry_tier2 = self._run_tier(2, tier1["failed_urls"])
+            if direct_future:
+                direct_tier2 = direct_future.result()
+        tiers_seconds = time.perf_counter() - tiers_started
+
+        runs = [run for run in (tier1, direct_tier2, retry_tier2) if run]
+        total_api_cost = sum(run["cost"] for run in runs)
+        outcomes = [outcome for run in runs for outcome in run["outcomes"]]
+        if outcomes and self.db_manager:
+            try:
+                self.db_manager.record_crawl_outcomes(outcomes)
+            except Exception as e:
+                self.logger.warning(f"Could not update crawl domain profiles: {e}")
+
+        # --- Final Processing ---
+        fetched_pages = []
+        for run in runs:
+            for task_url, item in run["results"]:
+                page = self._parse_competitor_page(item)
+                if page:
+                    page["url"] = task_url or page["url"]
+                    page["javascript"] = run["tier"] == 2
+                    fetched_pages.append(page)
+        if fetched_pages and self.db_manager:
+            try:
+                self.db_manager.save_competitor_pages(fetched_pages)
+            except Exception as e:
+                self.logger.warning(f"Could not store competitor pages: {e}")
+        pages.update((page["url"], page) for page in fetched_pages)
 
-        # --- Tier 1: Fast, cheap scan with JavaScript DISABLED ---
-        self.logger.info(
-            f"Starting Tier 1 analysis for {len(urls_to_scan)} URLs (JS disabled)."
+        # In SERP order, then any page reported under a URL that was not requested.
+        ordered_urls = urls_to_scan + [url for url in pages if url not in urls_to_scan]
+        final_competitor_list = self._select_competitors(
+            [pages[url] for url in ordered_urls if url in pages]
         )
+
+        self.last_crawl_stats = self._crawl_stats(
+            urls_to_scan,
+            len(urls_to_scan) - len(urls_to_fetch),
+            js_urls,
+            profiles,
+            tier1,
+            direct_tier2,
+            retry_tier2,
+            tiers_seconds,
+            time.perf_counter() - started,
+        )
+        return final_competitor_list, total_api_cost
+
+    def _run_tier(self, tier: int, urls: List[str]) -> Dict[str, Any]:
+        """
+        Fetches `urls` with JS disabled (tier 1) or enabled (tier 2). Returns
+        the parsed items per requested URL, URLs that failed, cost, elapsed
+        seconds and one profile outcome per URL.
+        """
+        run = {
+            "tier": tier,
+            "urls": list(urls),
+            "results": [],
+            "failed_urls": [],
+            "cost": 0.0,
+            "seconds": 0.0,
+            "outcomes": [],
+        }
+        if tier == 1:
+            self.logger.info(
+                f"Starting Tier 1 analysis for {len(urls)} URLs (JS disabled)."
+            )
+        else:
+            self.logger.info(
+                f"Starting Tier 2 analysis for {len(urls)} URLs (JS enabled)."
+            )
+        started = time.perf_counter()
         try:
-            initial_tasks, initial_cost = self.client.get_content_onpage_data(
-                urls_to_scan, self.config, enable_javascript=False
+            tasks, cost = self.client.get_content_onpage_data(
+                urls, self.config, enable_javascript=tier == 2
             )
-            total_api_cost += initial_cost
-
-            for task in initial_tasks:
-                task_url = task.get("data", {}).get("url")
+            run["cost"] = cost
+        except Exception as e:
+            self.logger.error(
+                f"Error during Tier {tier} competitor analysis: {e}", exc_info=True
+            )
+            tasks = []
+        run["seconds"] = time.perf_counter() - started
+
+        for task in tasks:
+            task_url = task.get("data", {}).get("url")
+            result = (task.get("result") or [{}])[0] or {}
+            succeeded = (
+                task.get("result") is not None
+                and task.get("status_code") == 20000
+                and result.get("items_count", 0) > 0
+                and (tier == 2 or result.get("crawl_status") != "Page content is empty")
+            )
+            if task_url:
+                run["outcomes"].append(
+                    {
+                        "domain": urlparse(task_url).netloc,
+                        "tier": tier,
+                        "success": succeeded,
+                        "seconds": self._task_seconds(task),
+                        "cost": task.get("cost") or 0.0,
+                    }
+                )
 
-                if task.get("result") is None:
+            if succeeded:
+                if tier == 2:
+                    self.logger.info(f"Tier 2 JS-enabled fetch SUCCEEDED for {task_url}.")
+                run["results"].extend(
+                    (task_url, item) for item in result.get("items", [])
+                )
+            elif task.get("result") is None:
+                if tier == 1:
                     self.logger.warning(
                         f"Tier 1 scan for {task_url} returned a null result. Queuing for JS-enabled retry."
                     )
-                    urls_that_need_js_retry.append(task_url)
-                    continue
-
-                result = task.get("result", [{}])[0]
-
-                if (
-                    task.get("status_code") == 20000
-                    and result.get("crawl_status") != "Page content is empty"
-                    and result.get("items_count", 0) > 0
-                ):
-                    successful_results.extend(result.get("items", []))
+                    run["failed_urls"].append(task_url)
                 else:
-                    self.logger.warning(
-                        f"Tier 1 scan failed for {task_url}. Reason: {result.get('crawl_status', task.get('status_message'))}. Queuing for JS-enabled retry."
+                    self.logger.error(
+                        f"Tier 2 fetch FAILED for {task_url}. Reason: API returned a null result. This URL will be excluded from analysis."
                     )
-                    urls_that_need_js_retry.append(task_url)
-        except Exception as e:
-            self.logger.error(
-                f"Error during Tier 1 competitor analysis: {e}", exc_info=True
+            elif tier == 1:
+                self.logger.warning(
+                    f"Tier 1 scan failed for {task_url}. Reason: {result.get('crawl_status', task.get('status_message'))}. Queuing for JS-enabled retry."
+                )
+                run["failed_urls"].append(task_url)
+            else:
+                self.logger.error(
+                    f"Tier 2 fetch FAILED for {task_url}. Reason: {result.get('crawl_status', task.get('status_message'))}. This URL will be excluded from analysis."
+                )
+        return run
+
+    @staticmethod
+    def _task_seconds(task: Dict[str, Any]) -> float:
+        """Server-side task time; DataForSEO reports it as e.g. "1.2345 sec."."""
+        try:
+            return float(str(task.get("time", "0")).split()[0])
+        except (ValueError, IndexError):
+            return 0.0
+
+    def _get_domain_profiles(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not self.db_manager or not urls:
+            return {}
+        try:
+            return self.db_manager.get_crawl_domain_profiles(
+                [urlparse(url).netloc for url in urls]
             )
+        except Exception as e:
+            self.logger.warning(f"Could not read crawl domain profiles: {e}")
+            return {}
 
-        # --- Tier 2: Slower, more expensive scan with JavaScript ENABLED for failures ---
-        if urls_that_need_js_retry:
-            self.logger.info(
-                f"Starting Tier 2 analysis for {len(urls_that_need_js_retry)} failed URLs (JS enabled)."
+    def _needs_javascript(self, profile: Optional[Dict[str, Any]]) -> bool:
+        """
+        True when enough Tier 1 scans of the domain were made, nearly all of
+        them failed, and JS-enabled fetches of it have worked.
+        """
+        if not profile or not profile.get("tier2_successes"):
+            return False
+        attempts = profile.get("tier1_attempts") or 0
+        if attempts < self.config.get("js_domain_min_tier1_attempts", 2):
+            return False
+        success_rate = (profile.get("tier1_successes") or 0) / attempts
+        return success_rate <= self.config.get("js_domain_max_tier1_success_rate", 0.25)
+
+    def _crawl_stats(
+        self,
+        urls_to_scan: List[str],
+        urls_from_store: int,
+        js_urls: List[str],
+        profiles: Dict[str, Dict[str, Any]],
+        tier1: Optional[Dict[str, Any]],
+        direct_tier2: Optional[Dict[str, Any]],
+        retry_tier2: Optional[Dict[str, Any]],
+        tiers_seconds: float,
+        wall_seconds: float,
+    ) -> Dict[str, Any]:
+        """
+        Fetch counts and estimated savings of this analysis. Skipped Tier 1
+        scans are valued at the domain's average Tier 1 time and cost; running
+        the tiers concurrently saves whatever they overlapped.
+        """
+        skipped_cost = skipped_seconds = 0.0
+        for url in js_urls:
+            profile = profiles.get(urlparse(url).netloc) or {}
+            attempts = profile.get("tier1_attempts") or 0
+            if attempts:
+                skipped_cost += profile.get("tier1_cost", 0.0) / attempts
+                skipped_seconds += profile.get("tier1_seconds", 0.0) / attempts
+        runs = [run for run in (tier1, direct_tier2, retry_tier2) if run]
+        overlap_seconds = max(0.0, sum(run["seconds"] for run in runs) - tiers_seconds)
+        return {
+            "urls_requested": len(urls_to_scan),
+            "urls_from_store": urls_from_store,
+            "tier1_urls": len(tier1["urls"]) if tier1 else 0,
+            "tier2_direct_urls": len(js_urls),
+            "tier2_retry_urls": len(retry_tier2["urls"]) if retry_tier2 else 0,
+            "api_cost": round(sum(run["cost"] for run in runs), 6),
+            "wall_seconds": round(wall_seconds, 3),
+            "estimated_cost_saved": round(skipped_cost, 6),
+            "estimated_seconds_saved": round(skipped_seconds + overlap_seconds, 3),
+        }
+
+    def _get_stored_pages(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fresh pages from the competitor page store, keyed by URL."""
+        if not self.db_manager:
+            return {}
+        try:
+            return self.db_manager.get_fresh_competitor_pages(
+                urls, self.config.get("competitor_page_max_age_days", 30)
             )
+        except Exception as e:
+            self.logger.warning(f"Could not read stored competitor pages: {e}")
+            return {}
+
+    def _parse_competitor_page(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Parses one Content Parsing API item into the client-independent page
+        kept in the competitor page store.
+        """
+        url = result.get("url")  # URL is at the top level in the new API response
+        if not url or result.get("status_code") != 200:
+            return None
+
+        page_content = result.get("page_content", {})
+        main_topic_content = ""
+        headings = {"h1": [], "h2": [], "h3": [], "h4": [], "h5": [], "h6": []}
+
+        # Extract main content and headings from the structured 'main_topic' array
+        if page_content and page_content.get("main_topic"):
+            for topic in page_content["main_topic"]:
+                h_level = topic.get("level")
+                h_title = topic.get("h_title")
+                if h_level and h_title:
+                    tag = f"h{h_level}"
+                    if tag in headings:
+                        headings[tag].append(h_title)
+
+                if topic.get("primary_content"):
+                    for pc in topic["primary_content"]:
+                        if pc and pc.get("text"):
+                            main_topic_content += pc["text"] + " "
+
+        main_topic_content = main_topic_content.strip()
+
+        # Manually calculate word count and readability
+        word_count = len(main_topic_content.split())
+        readability_score = None
+        if (
+            word_count > 100
+        ):  # textstat needs a reasonable amount of text to be accurate
             try:
-                retry_tasks, retry_cost = self.client.get_content_onpage_data(
-                    urls_that_need_js_retry, self.config, enable_javascript=True
-                )
-                total_api_cost += retry_cost
-
-                for task in retry_tasks:
-                    task_url = task.get("data", {}).get("url")
-
-                    if task.get("result") is None:
-                        self.logger.error(
-                            f"Tier 2 retry FAILED for {task_url}. Reason: API returned a null result. This URL will be excluded from analysis."
-                        )
-                        continue
-
-                    result = task.get("result", [{}])[0]
-
-                    if (
-                        task.get("status_code") == 20000
-                        and result.get("items_count", 0) > 0
-                    ):
-                        self.logger.info(
-                            f"Tier 2 JS-enabled retry SUCCEEDED for {task_url}."
-                        )
-                        successful_results.extend(result.get("items", []))
-                    else:
-                        self.logger.error(
-                            f"Tier 2 retry FAILED for {task_url}. Reason: {result.get('crawl_status', task.get('status_message'))}. This URL will be excluded from analysis."
-                        )
+                readability_score = TextStatistics.from_text(
+                    main_topic_content
+                ).flesch_kincaid_grade()
             except Exception as e:
-                self.logger.error(
-                    f"Error during Tier 2 competitor analysis: {e}", exc_info=True
+                self.logger.warning(
+                    f"Could not calculate readability for {url}: {e}"
                 )
 
-        # --- Final Processing ---
-        final_competitor_list = self._process_content_parsing_results(
-            successful_results
-        )
-
-        return final_competitor_list, total_api_cost
-
-    def _process_content_parsing_results(
-        self, results: List[Dict[str, Any]]
+        return {
+            "url": url,
+            "domain": urlparse(url).netloc,
+            "title": headings["h1"][0] if headings.get("h1") else None,
+            "word_count": word_count,
+            "readability_score": readability_score,
+            "headings": headings,
+            "main_content_text": main_topic_content,  # Clean text for readability calculation
+            "full_content_markdown": result.get(
+                "page_as_markdown"
+            ),  # Clean markdown for AI analysis
+        }
+
+    def _select_competitors(
+        self, pages: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Processes the successful results from the Content Parsing API call into a standardized competitor object.
+        Applies this client's blacklist and minimum word count to parsed pages
+        and returns them as standardized competitor objects.
         """
         final_competitors = []
-        for result in results:
-            url = result.get("url")  # URL is at the top level in the new API response
-            if not url or result.get("status_code") != 200:
-                continue
-
+        for page in pages:
+            url = page["url"]
             domain = urlparse(url).netloc
             if domain in self.blacklist_domains:
                 self.logger.info(f"Skipping blacklisted competitor: {domain}")
                 continue
 
-            page_content = result.get("page_content", {})
-            main_topic_content = ""
-            headings = {"h1": [], "h2": [], "h3": [], "h4": [], "h5": [], "h6": []}
-
-            # Extract main content and headings from the structured 'main_topic' array
-            if page_content and page_content.get("main_topic"):
-                for topic in page_content["main_topic"]:
-                    h_level = topic.get("level")
-                    h_title = topic.get("h_title")
-                    if h_level and h_title:
-                        tag = f"h{h_level}"
-                        if tag in headings:
-                            headings[tag].append(h_title)
-
-                    if topic.get("primary_content"):
-                        for pc in topic["primary_content"]:
-                            if pc and pc.get("text"):
-                                main_topic_content += pc["text"] + " "
-
-            main_topic_content = main_topic_content.strip()
-
-            # Manually calculate word count and readability
-            word_count = len(main_topic_content.split())
-            readability_score = None
-            if (
-                word_count > 100
-            ):  # textstat needs a reasonable amount of text to be accurate
-                try:
-                    readability_score = textstat.flesch_kincaid_grade(
-                        main_topic_content
-                    )
-                except Exception as e:
-                    self.logger.warning(
-                        f"Could not calculate readability for {url}: {e}"
-                    )
-
+            word_count = page.get("word_count") or 0
             if word_count >= self.min_word_count:
                 processed_competitor = {
                     "url": url,
-                    "title": headings["h1"][0] if headings.get("h1") else None,
+                    "title": page.get("title"),
                     "word_count": word_count,
-                    "readability_score": readability_score,
-                    "headings": headings,
-                    "main_content_text": main_topic_content,  # Clean text for readability calculation
-                    "full_content_markdown": result.get(
-                        "page_as_markdown"
-                    ),  # Clean markdown for AI analysis
+                    "readability_score": page.get("readability_score"),
+                    "headings": page.get("headings"),
+                    "main_content_text": page.get("main_content_text"),
+                    "full_content_markdown": page.get("full_content_markdown"),
                     # Set technical fields to defaults as they are not available from this endpoint
                     "technical_warnings": [],
                     "page_timing": {},
@@ -210,3 +395,69 @@ class FullCompetitorAnalyzer:
                 )
 
         return final_competitors
+
+
+class SharedCompetitorCrawl:
+    """
+    Deduplicates competitor crawls across the keywords of a bulk analysis. Each
+    URL is fetched by the first keyword that needs it; keywords that need a URL
+    already being fetched wait for that fetch instead of repeating it.
+    """
+
+    def __init__(self, client: DataForSEOClientV2, config: Dict[str, Any]):
+        self.client = client
+        self.config = config
+        self._lock = threading.Lock()
+        self._fetches: Dict[str, threading.Event] = {}
+        self._competitors: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.urls_requested = 0
+
+    def analyze_competitors(
+        self, competitor_urls: List[str], selected_urls: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], float, Optional[Dict[str, Any]]]:
+        """
+        Like FullCompetitorAnalyzer.analyze_competitors, but only fetches the
+        URLs no other keyword has claimed, and also returns the crawl stats of
+        this keyword's own fetch.
+        """
+        urls = list(dict.fromkeys(selected_urls or competitor_urls))
+        with self._lock:
+            self.urls_requested += len(urls)
+            claimed = [url for url in urls if url not in self._fetches]
+            for url in claimed:
+                self._fetches[url] = threading.Event()
+
+        analyzer = FullCompetitorAnalyzer(self.client, self.config)
+        extra_competitors: List[Dict[str, Any]] = []
+        api_cost = 0.0
+        try:
+            if claimed:
+                competitors, api_cost = analyzer.analyze_competitors(claimed)
+                by_url = {competitor["url"]: competitor for competitor in competitors}
+                # Pages reported under a URL that was not requested stay with this keyword.
+                extra_competitors = [c for c in competitors if c["url"] not in claimed]
+                with self._lock:
+                    for url in claimed:
+                        self._competitors[url] = by_url.get(url)
+        finally:
+            for url in claimed:
+                self._fetches[url].set()
+
+        for url in urls:
+            self._fetches[url].wait()
+        with self._lock:
+            competitors = [self._competitors.get(url) for url in urls]
+        return (
+            [c for c in competitors if c] + extra_competitors,
+            api_cost,
+            analyzer.last_crawl_stats,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            unique_urls = len(self._fetches)
+            return {
+                "urls_requested": self.urls_requested,
+                "unique_urls": unique_urls,
+                "urls_deduplicated": self.urls_requested - unique_urls,
+            }
@@ -40,6 +40,7 @@ def get_ai_content_analysis(
         schema=schema,
         model=model,
         max_completion_tokens=max_completion_tokens,
+        agent="content_analyzer.synthesis",
     )
 
     return response, error
@@ -256,6 +256,7 @@ class ContentAnalyzer:
             max_completion_tokens=self.config.get(
                 "max_completion_tokens_for_generation", 4096
             ),
+            agent="content_analyzer.outline",
         )
         total_ai_cost = self.openai_client.latest_cost
 
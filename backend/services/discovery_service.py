@@ -16,15 +16,4 @@ class DiscoveryService:
         """
         Retrieves a summary of disqualification reasons for a specific discovery run.
         """
-        keywords = self.db_manager.get_keywords_for_run(run_id)
-
-        disqualification_reasons = {}
-        for keyword in keywords:
-            if keyword.get("blog_qualification_status") == "rejected":
-                reason = keyword.get("blog_qualification_reason")
-                if reason:
-                    disqualification_reasons[reason] = (
-                        disqualification_reasons.get(reason, 0) + 1
-                    )
-
-        return disqualification_reasons
+        return self.db_manager.get_run_reason_counts(run_id)
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Any, Tuple
 from data_access.database_manager import DatabaseManager
+from backend.core.score_breakdown import inflate_breakdown
 
 
 class OpportunitiesService:
@@ -22,11 +23,18 @@ class OpportunitiesService:
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Retrieves a lightweight summary of keyword opportunities for a client.
-        Returns (opportunities_list, total_count).
+        Compact score breakdowns are returned in the full layout, without
+        sub-factor explanations. Returns (opportunities_list, total_count).
         """
-        return self.db_manager.get_all_opportunities(
+        opportunities, total_count = self.db_manager.get_all_opportunities(
             client_id, params, summary=True, select_columns=select_columns
         )
+        for opportunity in opportunities:
+            if "score_breakdown" in opportunity:
+                opportunity["score_breakdown"] = inflate_breakdown(
+                    opportunity["score_breakdown"]
+                )
+        return opportunities, total_count
 
     def get_opportunities_by_category(
         self, client_id: str
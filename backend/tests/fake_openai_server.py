@@ -0,0 +1,194 @@
+"""
+Local stand-in for the subset of the OpenAI API used by OpenAIBatchRunner
+(file upload, batch create/retrieve/cancel, file content). Point the client at
+it with `openai_base_url = server.base_url`.
+"""
+import json
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def echo_responder(request_line):
+    """Default responder: echoes the custom_id back as the message content."""
+    return json.dumps({"echo": request_line["custom_id"]})
+
+
+class FakeOpenAIServer:
+    """
+    `responder(request_line) -> str` produces the assistant message content for
+    each batch line; raising an exception turns that line into an error result.
+    Batches complete after `polls_until_complete` retrieve calls.
+    """
+
+    def __init__(self, responder=echo_responder, polls_until_complete=1):
+        self.responder = responder
+        self.polls_until_complete = polls_until_complete
+        self.files = {}
+        self.batches = {}
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}/v1"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _next_id(self, prefix):
+        with self._lock:
+            self._counter += 1
+            return f"{prefix}_{self._counter}"
+
+    def _add_file(self, content, filename, purpose):
+        file_id = self._next_id("file")
+        self.files[file_id] = content
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def _complete(self, batch):
+        outputs, errors = [], []
+        lines = self.files[batch["input_file_id"]].decode("utf-8").splitlines()
+        for raw in filter(None, lines):
+            line = json.loads(raw)
+            try:
+                content = self.responder(line)
+            except Exception as e:
+                errors.append(
+                    {
+                        "id": self._next_id("batch_req"),
+                        "custom_id": line["custom_id"],
+                        "response": None,
+                        "error": {"code": "stub_error", "message": str(e)},
+                    }
+                )
+                continue
+            outputs.append(
+                {
+                    "id": self._next_id("batch_req"),
+                    "custom_id": line["custom_id"],
+                    "response": {
+                        "status_code": 200,
+                        "body": {
+                            "model": line["body"]["model"],
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "finish_reason": "stop",
+                                    "message": {"role": "assistant", "content": content},
+                                }
+                            ],
+                            "usage": {"prompt_tokens": 100, "completion_tokens": 50},
+                        },
+                    },
+                    "error": None,
+                }
+            )
+        to_jsonl = lambda rows: "".join(json.dumps(r) + "\n" for r in rows).encode()
+        batch["output_file_id"] = self._add_file(to_jsonl(outputs), "output.jsonl", "batch_output")["id"]
+        if errors:
+            batch["error_file_id"] = self._add_file(to_jsonl(errors), "errors.jsonl", "batch_output")["id"]
+        batch["status"] = "completed"
+        batch["request_counts"] = {
+            "total": len(outputs) + len(errors),
+            "completed": len(outputs),
+            "failed": len(errors),
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload, raw=False):
+                body = payload if raw else json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/octet-stream" if raw else "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_POST(self):
+                if self.path == "/v1/files":
+                    message = BytesParser(policy=default_policy).parsebytes(
+                        f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+                        + self._body()
+                    )
+                    fields, content, filename = {}, b"", "upload.jsonl"
+                    for part in message.iter_parts():
+                        name = part.get_param("name", header="content-disposition")
+                        if name == "file":
+                            content = part.get_payload(decode=True)
+                            filename = part.get_filename() or filename
+                        else:
+                            fields[name] = part.get_content().strip()
+                    return self._send(200, server._add_file(content, filename, fields.get("purpose", "batch")))
+                if self.path == "/v1/batches":
+                    req = json.loads(self._body())
+                    batch = {
+                        "id": server._next_id("batch"),
+                        "object": "batch",
+                        "endpoint": req["endpoint"],
+                        "input_file_id": req["input_file_id"],
+                        "completion_window": req["completion_window"],
+                        "metadata": req.get("metadata"),
+                        "status": "validating",
+                        "created_at": int(time.time()),
+                        "request_counts": {"total": 0, "completed": 0, "failed": 0},
+                        "_polls": 0,
+                    }
+                    server.batches[batch["id"]] = batch
+                    return self._send(200, self._public(batch))
+                if self.path.startswith("/v1/batches/") and self.path.endswith("/cancel"):
+                    batch = server.batches[self.path.split("/")[3]]
+                    batch["status"] = "cancelled"
+                    return self._send(200, self._public(batch))
+                self._send(404, {"error": {"message": "not found"}})
+
+            def do_GET(self):
+                parts = self.path.split("/")
+                if self.path.startswith("/v1/batches/"):
+                    batch = server.batches.get(parts[3])
+                    if batch is None:
+                        return self._send(404, {"error": {"message": "not found"}})
+                    if batch["status"] not in ("completed", "cancelled"):
+                        batch["_polls"] += 1
+                        batch["status"] = "in_progress"
+                        if batch["_polls"] >= server.polls_until_complete:
+                            server._complete(batch)
+                    return self._send(200, self._public(batch))
+                if self.path.startswith("/v1/files/") and self.path.endswith("/content"):
+                    content = server.files.get(parts[3])
+                    if content is None:
+                        return self._send(404, {"error": {"message": "not found"}})
+                    return self._send(200, content, raw=True)
+                self._send(404, {"error": {"message": "not found"}})
+
+            @staticmethod
+            def _public(batch):
+                return {k: v for k, v in batch.items() if not k.startswith("_")}
+
+        return Handler
@@ -0,0 +1,98 @@
+# tests/test_bulk_analysis.py
+import logging
+import threading
+import time
+
+from backend.data_access.database_manager import DatabaseManager
+from backend.jobs import JobManager
+from backend.pipeline.orchestrator.analysis_orchestrator import AnalysisOrchestrator
+
+
+class StubAnalysis(AnalysisOrchestrator):
+    """Bulk analysis with the SERP/crawl/AI steps replaced by no-ops."""
+
+    def __init__(self, db_manager, job_manager, cancel_after):
+        self.db_manager = db_manager
+        self.job_manager = job_manager
+        self.client_id = "client"
+        self.client_cfg = {
+            f"bulk_analysis_{stage}_workers": 1
+            for stage in ("serp", "crawl", "synthesis", "persist")
+        }
+        self.client_cfg["bulk_analysis_queue_size"] = 1
+        self.dataforseo_client = None
+        self.logger = logging.getLogger(__name__)
+        self.cancel_after = cancel_after
+        self.job_id = None
+        self.started = []
+        self.lock = threading.Lock()
+
+    def _analysis_fetch_serp(self, work):
+        with self.lock:
+            self.started.append(work["opportunity_id"])
+            if len(self.started) == self.cancel_after:
+                self.job_manager.cancel_job(self.job_id)
+        time.sleep(0.01)
+
+    def _analysis_crawl_competitors(self, work, shared_crawl=None):
+        return None
+
+    def _analysis_synthesize(self, work):
+        return None
+
+    def _analysis_save_blueprint(self, work):
+        self.db_manager.update_opportunity_workflow_state(
+            work["opportunity_id"], "analysis_completed", "analyzed"
+        )
+        return {"status": "success", "message": "ok"}
+
+
+def test_cancelled_bulk_analysis_stops_and_stays_failed(tmp_path):
+    """Test that a cancel stops new items, leaves none in_progress and is not overwritten."""
+    db_manager = DatabaseManager(db_path=str(tmp_path / "bulk.db"))
+    db_manager.initialize()
+    db_manager.add_client("client", "Client", {})
+    opportunity_ids = [
+        db_manager.add_opportunity("client", {"keyword": f"kw {i}", "status": "validated"})
+        for i in range(8)
+    ]
+    job_manager = JobManager(db_manager)
+    analysis = StubAnalysis(db_manager, job_manager, cancel_after=2)
+
+    analysis.job_id = "bulk-job"
+    db_manager.update_job(
+        {
+            "id": analysis.job_id,
+            "status": "pending",
+            "progress": 0,
+            "result": None,
+            "error": None,
+            "started_at": time.time(),
+            "finished_at": None,
+            "function_name": "_run_bulk_analysis_background",
+        }
+    )
+    job_manager._run_job(
+        analysis.job_id,
+        analysis._run_bulk_analysis_background,
+        (opportunity_ids,),
+        {},
+    )
+
+    job = job_manager.get_job_status(analysis.job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Cancelled by user."
+    # Only items started before the cancel run: one waiting in the SERP queue
+    # (queue_size=1) and one the feeder was blocked handing over.
+    assert len(analysis.started) <= analysis.cancel_after + 2
+    assert len(analysis.started) < len(opportunity_ids)
+    statuses = {
+        opp_id: db_manager.get_opportunity_by_id(opp_id, projection="summary")["status"]
+        for opp_id in opportunity_ids
+    }
+    assert "in_progress" not in statuses.values()
+    assert all(
+        status == "validated"
+        for opp_id, status in statuses.items()
+        if opp_id not in analysis.started
+    )
@@ -0,0 +1,90 @@
+# tests/test_content_history.py
+import json
+
+import pytest
+
+from backend.data_access.content_delta import SNAPSHOT_INTERVAL
+from backend.data_access.database_manager import DatabaseManager
+
+
+def make_content(version):
+    paragraphs = [f"<p>Paragraph {i} about raised garden beds.</p>" for i in range(40)]
+    paragraphs[version % 40] = f"<p>Paragraph {version % 40}, revision {version}.</p>"
+    return {
+        "meta_title": f"Raised Garden Beds v{version}",
+        "article_body_html": "".join(paragraphs),
+    }
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db_manager = DatabaseManager(db_path=str(tmp_path / "history.db"))
+    db_manager.initialize()
+    db_manager.add_client("client", "Client", {})
+    return db_manager
+
+
+def version_types(db_manager, opportunity_id):
+    rows = db_manager._get_conn().execute(
+        "SELECT id, version_type FROM content_history "
+        "WHERE opportunity_id = ? ORDER BY id",
+        (opportunity_id,),
+    )
+    return [(row["id"], row["version_type"]) for row in rows]
+
+
+def test_snapshot_and_delta_versions_round_trip(db_manager):
+    """Test that encoded versions come back unchanged and one can be restored."""
+    opportunity_id = db_manager.add_opportunity("client", {"keyword": "raised beds"})
+    versions = [make_content(v) for v in range(25)]
+    for v, content in enumerate(versions):
+        db_manager.save_content_version_to_history(
+            opportunity_id, content, timestamp=f"2024-01-01T00:00:{v:02d}"
+        )
+
+    types = version_types(db_manager, opportunity_id)
+    assert [t for _, t in types].count("snapshot") == 3
+    assert [t for _, t in types].count("delta") == 25 - 3
+    assert types[SNAPSHOT_INTERVAL + 1][1] == "snapshot"
+    for (history_id, _), content in zip(types, versions):
+        assert db_manager.get_content_version(opportunity_id, history_id) == content
+
+    db_manager.update_opportunity_ai_content_and_status(
+        opportunity_id, versions[-1], "gpt-4o", "generated"
+    )
+    restored = db_manager.restore_content_version(
+        opportunity_id, "2024-01-01T00:00:13"
+    )
+    assert restored == versions[13]
+    opportunity = db_manager.get_opportunity_by_id(opportunity_id)
+    assert opportunity["ai_content"] == versions[13]
+    # The content it replaced was saved to history first.
+    history_id = version_types(db_manager, opportunity_id)[-1][0]
+    assert db_manager.get_content_version(opportunity_id, history_id) == versions[-1]
+
+
+def test_legacy_full_rows_are_reencoded(db_manager):
+    """Test that compaction turns inline 'full' rows into snapshots and deltas."""
+    opportunity_id = db_manager.add_opportunity("client", {"keyword": "raised beds"})
+    versions = [make_content(v) for v in range(3)]
+    conn = db_manager._get_conn()
+    with conn:
+        for v, content in enumerate(versions):
+            conn.execute(
+                "INSERT INTO content_history "
+                "(opportunity_id, timestamp, ai_content_json) VALUES (?, ?, ?)",
+                (opportunity_id, f"2023-01-01T00:00:{v:02d}", json.dumps(content)),
+            )
+    assert [t for _, t in version_types(db_manager, opportunity_id)] == ["full"] * 3
+
+    assert db_manager.compact_content_history() == 3
+    assert db_manager.compact_content_history() == 0
+
+    types = version_types(db_manager, opportunity_id)
+    assert [t for _, t in types] == ["snapshot", "delta", "delta"]
+    for (history_id, _), content in zip(types, versions):
+        assert db_manager.get_content_version(opportunity_id, history_id) == content
+    history = db_manager.get_content_history(opportunity_id)
+    assert sorted(row["title"] for row in history) == sorted(
+        content["meta_title"] for content in versions
+    )
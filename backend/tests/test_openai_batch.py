@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from backend.external_apis.openai_client import OpenAIClientWrapper
+from backend.external_apis.openai_batch import BatchRequest, OpenAIBatchRunner
+from fake_openai_server import FakeOpenAIServer
+
+
+def posts_responder(request_line):
+    if request_line["custom_id"] == "opportunity-3":
+        raise RuntimeError("simulated failure")
+    return json.dumps(
+        {
+            "social_media_posts": [
+                {"platform": "Twitter", "content": f"Post for {request_line['custom_id']}"}
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def fake_server():
+    with FakeOpenAIServer(responder=posts_responder, polls_until_complete=2) as server:
+        yield server
+
+
+def test_batch_runner_fans_results_back_by_custom_id(fake_server):
+    cfg = {
+        "openai_base_url": fake_server.base_url,
+        "openai_batch_poll_seconds": 0,
+        "default_model": "gpt-4o",
+    }
+    client = OpenAIClientWrapper(api_key="fake_key", client_cfg=cfg)
+    runner = OpenAIBatchRunner(client, cfg)
+    schema = {"type": "object", "properties": {}}
+    requests = [
+        BatchRequest(f"opportunity-{i}", [{"role": "user", "content": f"p{i}"}], schema=schema)
+        for i in (1, 2, 3)
+    ]
+
+    polls = []
+    results = runner.run(requests, on_progress=lambda batch: polls.append(batch.status))
+
+    assert polls  # at least one non-terminal poll was observed
+    assert results["opportunity-1"]["response"]["social_media_posts"][0]["content"] == "Post for opportunity-1"
+    assert results["opportunity-2"]["error"] is None
+    assert results["opportunity-2"]["cost"] > 0
+    assert results["opportunity-3"]["response"] is None
+    assert "simulated failure" in results["opportunity-3"]["error"]
+
+    submitted = fake_server.files[next(iter(fake_server.files))].decode().splitlines()
+    first = json.loads(submitted[0])
+    assert first["url"] == "/v1/chat/completions"
+    assert first["body"]["response_format"]["type"] == "json_schema"
+
+
+def test_batch_runner_rejects_duplicate_custom_ids(fake_server):
+    cfg = {"openai_base_url": fake_server.base_url}
+    runner = OpenAIBatchRunner(OpenAIClientWrapper("fake_key", cfg), cfg)
+    duplicate = [BatchRequest("same", [{"role": "user", "content": "x"}])] * 2
+    with pytest.raises(ValueError):
+        runner.submit(duplicate)
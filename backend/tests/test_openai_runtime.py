@@ -0,0 +1,21 @@
+# tests/test_openai_runtime.py
+from backend.external_apis.openai_runtime import MemoryResponseCache
+
+
+def test_memory_cache_hits_are_independent_copies():
+    """Test that editing a stored value or a returned hit leaves later hits unchanged."""
+    cache = MemoryResponseCache(max_items=4)
+    outline = {"unique_angles_to_include": ["a", "b"], "sections": [{"title": "Intro"}]}
+    cache.set("key", outline, ttl_seconds=60)
+    outline["unique_angles_to_include"].append("stored later")
+
+    hit = cache.get("key")
+    hit["unique_angles_to_include"].reverse()
+    hit["sections"][0]["title"] = "Changed"
+    hit.update({"keyword": "other keyword"})
+
+    assert cache.get("key") == {
+        "unique_angles_to_include": ["a", "b"],
+        "sections": [{"title": "Intro"}],
+    }
+    assert cache.get("key") is not cache.get("key")
@@ -0,0 +1,29 @@
+# tests/test_phrase_matcher.py
+from core.phrase_matcher import PhraseMatcher
+
+
+def test_overlapping_phrases():
+    """Test that all phrases are found, including ones inside other phrases."""
+    matcher = PhraseMatcher(["he", "she", "hers", "his"])
+    assert sorted(matcher.finditer("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+
+def test_word_boundary_and_plurals():
+    """Test entity-style matching: whole words, case-insensitive, simple plurals."""
+    matcher = PhraseMatcher(
+        ["tool", "tools", "garden bed", "AI"],
+        ignore_case=True,
+        word_boundary=True,
+        plurals=True,
+    )
+    assert matcher.found("Garden beds need tools.") == {0, 1, 2}
+    assert matcher.found("A toolset for the gardenbed, said Aida.") == set()
+
+
+def test_first_matches_is_leftmost():
+    """Test that the leftmost occurrence of each phrase is reported."""
+    matcher = PhraseMatcher(["compost", "soil"], ignore_case=True)
+    assert matcher.first_matches("Soil and compost, then more soil") == {
+        0: (9, 16),
+        1: (0, 4),
+    }
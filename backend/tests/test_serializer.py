@@ -0,0 +1,43 @@
+# tests/test_serializer.py
+import json
+import math
+from collections import OrderedDict
+
+import pytest
+
+from backend.core import serializer
+
+
+@pytest.fixture(params=serializer.BACKENDS)
+def backend(request):
+    previous = serializer.backend
+    serializer.use_backend(request.param)
+    yield request.param
+    serializer.use_backend(previous)
+
+
+def test_round_trip_decodes_like_stdlib(backend):
+    """Test that values orjson handles differently still decode as json would."""
+    value = {
+        "text": "é 中 \ud800",
+        "nested": [1, 2.5, None, True, (3, 4)],
+        "big": 2**70,
+        "keys": {1: "int key"},
+        "ordered": OrderedDict(a=1),
+        "infinite": [float("inf"), float("-inf")],
+    }
+    expected = json.loads(json.dumps(value))
+    assert serializer.loads(serializer.dumps(value)) == expected
+    assert json.loads(serializer.dumps_bytes(value)) == expected
+    assert math.isnan(serializer.loads(serializer.dumps({"x": float("nan")}))["x"])
+    assert serializer.loads('{"n": 123456789012345678901234567890}') == {
+        "n": 123456789012345678901234567890
+    }
+
+
+def test_errors_match_stdlib(backend):
+    """Test that unserializable values and invalid JSON raise like json does."""
+    with pytest.raises(TypeError):
+        serializer.dumps({"when": object()})
+    with pytest.raises(json.JSONDecodeError):
+        serializer.loads('{"a": ')
@@ -0,0 +1,50 @@
+# tests/test_stage_pipeline.py
+import threading
+import time
+
+from backend.core.stage_pipeline import Stage, StagePipeline
+
+
+def test_items_flow_through_all_stages_with_stats():
+    """Test that every item reaches the last stage and each stage is counted."""
+    finished = []
+    lock = threading.Lock()
+
+    def finish(item):
+        with lock:
+            finished.append(item)
+
+    pipeline = StagePipeline(
+        [
+            Stage("double", lambda item: item * 2, workers=3),
+            Stage("keep_multiples_of_4", lambda item: item if item % 4 == 0 else None, workers=2),
+            Stage("collect", finish),
+        ]
+    )
+    stats = pipeline.run(range(10))
+
+    assert sorted(finished) == [0, 4, 8, 12, 16]
+    assert stats["items_fed"] == 10
+    assert stats["stages"]["double"]["items_out"] == 10
+    assert stats["stages"]["keep_multiples_of_4"]["items_out"] == 5
+    assert stats["stages"]["collect"]["items_in"] == 5
+
+
+def test_errors_are_reported_and_backpressure_blocks_upstream():
+    """Test that a failing item is dropped and a slow stage holds back the one before it."""
+    errors = []
+
+    def slow(item):
+        if item == 3:
+            raise ValueError("bad item")
+        time.sleep(0.02)
+
+    pipeline = StagePipeline(
+        [Stage("fast", lambda item: item, queue_size=1), Stage("slow", slow, queue_size=1)],
+        on_error=lambda stage, item, e: errors.append((stage, item)),
+    )
+    stats = pipeline.run(range(8))
+
+    assert errors == [("slow", 3)]
+    assert stats["stages"]["slow"]["errors"] == 1
+    assert stats["stages"]["fast"]["blocked_seconds"] > 0
@@ -0,0 +1,55 @@
+# tests/test_text_statistics.py
+import re
+
+import pytest
+
+import core.text_statistics as text_statistics
+from core.text_statistics import TextStatistics
+
+BLOCKS = [
+    "How to Build a Raised Garden Bed",
+    "Raised beds warm up earlier in spring. They drain well, and they're easy to reach.",
+    "Fill the bed with a mix of topsoil and compost! Water it thoroughly before planting.",
+]
+
+
+def _vowel_groups(word: str) -> int:
+    return max(1, len(re.findall(r"[aeiouy]+", word)))
+
+
+@pytest.fixture(autouse=True)
+def vowel_group_syllables(monkeypatch):
+    """
+    textstat's syllable counter needs the NLTK cmudict download, so the tests
+    count syllables as vowel groups. The expected values below are what
+    textstat gives for the joined text with the same counter.
+    """
+    monkeypatch.setattr(text_statistics, "_word_syllables", _vowel_groups)
+    text_statistics._block_counts.cache_clear()
+    yield
+    text_statistics._block_counts.cache_clear()
+
+
+def test_indices_match_textstat():
+    """Test that indices from shared counts equal textstat's on the joined text."""
+    stats = TextStatistics(BLOCKS)
+    assert (stats.words, stats.sentences, stats.syllables, stats.polysyllables) == (
+        37,
+        4,
+        51,
+        2,
+    )
+    assert stats.flesch_kincaid_grade() == pytest.approx(4.282364864864864)
+    assert stats.smog_index() == pytest.approx(7.168621630094336)
+    assert stats.coleman_liau_index() == pytest.approx(5.767567567567568)
+
+
+def test_replace_block_matches_fresh_statistics():
+    """Test that updating one block gives the same result as recounting everything."""
+    stats = TextStatistics(BLOCKS)
+    patched = "Fill the bed with topsoil, compost and aged manure. Then water it."
+    stats.replace_block(2, patched)
+    fresh = TextStatistics(BLOCKS[:2] + [patched])
+    assert stats.text == fresh.text
+    assert stats.flesch_kincaid_grade() == fresh.flesch_kincaid_grade()
+    assert stats.smog_index() == fresh.smog_index()
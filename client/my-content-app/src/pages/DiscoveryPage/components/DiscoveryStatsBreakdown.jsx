@@ -10,19 +10,20 @@ const DiscoveryStatsBreakdown = ({ summary, runId }) => {
   const [modalVisible, setModalVisible] = useState(false);
   const [modalTitle, setModalTitle] = useState('');
   const [modalData, setModalData] = useState([]);
+  const [modalReason, setModalReason] = useState(null);
+  const [modalPagination, setModalPagination] = useState({ current: 1, pageSize: 10, total: 0 });
   const [modalLoading, setModalLoading] = useState(false);
 
   if (!summary) {
     return <Empty description="No summary data available for this run." />;
   }
 
-  const handleReasonClick = async (reason) => {
-    setModalTitle(`Disqualified Keywords: ${reason}`);
-    setModalVisible(true);
+  const fetchReasonPage = async (reason, page, pageSize) => {
     setModalLoading(true);
     try {
-      const data = await getDisqualifiedKeywords(runId, reason);
-      setModalData(data);
+      const data = await getDisqualifiedKeywords(runId, reason, { page, limit: pageSize });
+      setModalData(data?.items || []);
+      setModalPagination({ current: page, pageSize, total: data?.total_items || 0 });
     } catch (error) {
       console.error('Failed to fetch disqualified keywords:', error);
     } finally {
@@ -30,6 +31,13 @@ const DiscoveryStatsBreakdown = ({ summary, runId }) => {
     }
   };
 
+  const handleReasonClick = (reason) => {
+    setModalTitle(`Disqualified Keywords: ${reason}`);
+    setModalReason(reason);
+    setModalVisible(true);
+    fetchReasonPage(reason, 1, modalPagination.pageSize);
+  };
+
   // Destructure with defaults to prevent errors if fields are missing
   const {
     source_counts = {},
@@ -49,7 +57,7 @@ const DiscoveryStatsBreakdown = ({ summary, runId }) => {
     },
     {
       title: 'Search Volume',
-      dataIndex: ['keyword_info', 'search_volume'],
+      dataIndex: 'search_volume',
       key: 'search_volume',
     },
   ];
@@ -90,7 +98,10 @@ const DiscoveryStatsBreakdown = ({ summary, runId }) => {
           dataSource={modalData}
           columns={modalColumns}
           rowKey="id"
-          pagination={{ pageSize: 10 }}
+          pagination={modalPagination}
+          onChange={(newPagination) =>
+            fetchReasonPage(modalReason, newPagination.current, newPagination.pageSize)
+          }
         />
       </Modal>
     </div>
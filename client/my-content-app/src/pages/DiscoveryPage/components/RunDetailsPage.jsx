@@ -12,6 +12,9 @@ const RunDetailsPage = () => {
   const { runId } = useParams();
   const navigate = useNavigate();
   const [keywords, setKeywords] = useState([]);
+  const [totalKeywords, setTotalKeywords] = useState(0);
+  const [pagination, setPagination] = useState({ current: 1, pageSize: 50 });
+  const [statusFilter, setStatusFilter] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [updatingIds, setUpdatingIds] = useState(new Set());
@@ -21,8 +24,13 @@ const RunDetailsPage = () => {
     const fetchKeywords = async () => {
       try {
         setLoading(true);
-        const response = await getKeywordsForRun(runId);
-        setKeywords(response || []);
+        const response = await getKeywordsForRun(runId, {
+          page: pagination.current,
+          limit: pagination.pageSize,
+          ...(statusFilter ? { status: statusFilter } : {}),
+        });
+        setKeywords(response?.items || []);
+        setTotalKeywords(response?.total_items || 0);
       } catch (err) {
         setError('Failed to fetch keyword details for this run.');
         console.error(err);
@@ -32,7 +40,17 @@ const RunDetailsPage = () => {
     };
 
     fetchKeywords();
-  }, [runId]);
+  }, [runId, pagination, statusFilter]);
+
+  const handleTableChange = (newPagination, filters) => {
+    const status = filters.status?.[0] || null;
+    if (status !== statusFilter) {
+      setStatusFilter(status);
+      setPagination({ current: 1, pageSize: newPagination.pageSize });
+    } else {
+      setPagination({ current: newPagination.current, pageSize: newPagination.pageSize });
+    }
+  };
 
   const handleOverride = async (opportunityId) => {
     setUpdatingIds(prev => new Set(prev).add(opportunityId));
@@ -43,7 +61,7 @@ const RunDetailsPage = () => {
       setKeywords(prevKeywords => 
         prevKeywords.map(kw => 
           kw.id === opportunityId 
-            ? { ...kw, blog_qualification_status: 'passed_manual_override', blog_qualification_reason: 'Manually overridden by user.' }
+            ? { ...kw, status: 'pending', blog_qualification_status: 'passed_manual_override', blog_qualification_reason: 'Manually overridden by user.' }
             : kw
         )
       );
@@ -64,7 +82,6 @@ const RunDetailsPage = () => {
       title: 'Keyword',
       dataIndex: 'keyword',
       key: 'keyword',
-      sorter: (a, b) => a.keyword.localeCompare(b.keyword),
     },
     {
       title: 'Qualification Status',
@@ -81,12 +98,20 @@ const RunDetailsPage = () => {
           </Tag>
         );
       },
+    },
+    {
+      title: 'Status',
+      dataIndex: 'status',
+      key: 'status',
+      render: (status) => <Tag>{status ? status.toUpperCase() : 'N/A'}</Tag>,
       filters: [
-        { text: 'Passed', value: 'passed' },
-        { text: 'Failed', value: 'failed' },
-        { text: 'Override', value: 'passed_manual_override' },
+        { text: 'Qualified', value: 'qualified' },
+        { text: 'Review', value: 'review' },
+        { text: 'Rejected', value: 'rejected' },
+        { text: 'Overridden (Pending)', value: 'pending' },
       ],
-      onFilter: (value, record) => record.blog_qualification_status === value,
+      filterMultiple: false,
+      filteredValue: statusFilter ? [statusFilter] : null,
     },
     {
       title: 'Reason',
@@ -96,16 +121,14 @@ const RunDetailsPage = () => {
     },
     {
         title: 'Search Volume',
-        dataIndex: ['keyword_info', 'search_volume'],
+        dataIndex: 'search_volume',
         key: 'search_volume',
-        sorter: (a, b) => (a.keyword_info?.search_volume || 0) - (b.keyword_info?.search_volume || 0),
         render: (sv) => sv ? sv.toLocaleString() : 'N/A',
     },
     {
         title: 'Keyword Difficulty',
-        dataIndex: ['keyword_properties', 'keyword_difficulty'],
+        dataIndex: 'keyword_difficulty',
         key: 'keyword_difficulty',
-        sorter: (a, b) => (a.keyword_properties?.keyword_difficulty || 0) - (b.keyword_properties?.keyword_difficulty || 0),
         render: (kd) => kd || 'N/A',
     },
     {
@@ -132,7 +155,7 @@ const RunDetailsPage = () => {
     },
   ];
 
-  if (loading) {
+  if (loading && keywords.length === 0) {
     return <Spin tip="Loading keywords..." style={{ display: 'block', marginTop: '50px' }} />;
   }
 
@@ -151,7 +174,7 @@ const RunDetailsPage = () => {
             <Title level={4} style={{ margin: 0 }}>
               Keywords for Discovery Run #{runId}
             </Title>
-            <Text type="secondary">{keywords.length.toLocaleString()} keywords found</Text>
+            <Text type="secondary">{totalKeywords.toLocaleString()} keywords found</Text>
           </Col>
         </Row>
       </div>
@@ -161,7 +184,8 @@ const RunDetailsPage = () => {
           dataSource={keywords}
           rowKey="id"
           loading={loading}
-          pagination={{ pageSize: 50 }}
+          pagination={{ ...pagination, total: totalKeywords }}
+          onChange={handleTableChange}
         />
       </div>
     </>
@@ -16,12 +16,12 @@ export const rerunDiscoveryRun = (runId) => {
   return apiClient.post(`/api/discovery-runs/rerun/${runId}`);
 };
 
-export const getKeywordsForRun = (runId) => {
-  return apiClient.get(`/api/discovery-runs/${runId}/keywords`);
+export const getKeywordsForRun = (runId, params = {}) => {
+  return apiClient.get(`/api/discovery-runs/${runId}/keywords`, { params });
 };
 
-export const getDisqualifiedKeywords = (runId, reason) => {
-    return apiClient.get(`/api/discovery-runs/${runId}/keywords/${reason}`);
+export const getDisqualifiedKeywords = (runId, reason, params = {}) => {
+    return apiClient.get(`/api/discovery-runs/${runId}/keywords/${reason}`, { params });
 };
 
 export const getDisqualificationReasons = (runId) => {